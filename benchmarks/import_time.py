@@ -0,0 +1,76 @@
+"""
+Benchmark do tempo de importação dos pacotes, medido com `python -X importtime` em processos novos.
+
+Para cada módulo mostra o tempo total de importação e as dependências pesadas carregadas.
+Importar apenas um pacote (ex: `src.matplotlib_helper`) não deve carregar nenhuma dependência pesada.
+
+Uso:
+    python -m benchmarks.import_time
+    python -m benchmarks.import_time src.yolo_helper.manifest src.matplotlib_helper.palette
+"""
+from subprocess import run
+from sys import argv, executable
+
+
+RUNS = 5
+HEAVY_MODULES = ("matplotlib", "numpy", "pandas", "PIL", "fastapi", "pydantic", "uvicorn", "starlette")
+TARGETS = [
+    "src.email_helper",
+    "src.fastapi_helper",
+    "src.fastapi_helper.middleware",
+    "src.matplotlib_helper",
+    "src.pandas_helper",
+    "src.pydantic_helper",
+    "src.python_helper",
+    "src.yolo_helper",
+    "src.yolo_helper.manifest",
+    "src.matplotlib_helper.cache",
+    "src.matplotlib_helper.palette",
+    "src.matplotlib_helper.render",
+    "src.fastapi_helper.web_sockets",
+    "src.pydantic_helper.schemas.user",
+]
+
+
+def import_time(target: str) -> tuple[float, list[str]]:
+    """
+    Importa o módulo em um processo novo e lê a saída do `-X importtime`
+
+    - Args:
+        - target:: str: Módulo importado
+
+    - Returns:
+        - tuple[float, list[str]]: Tempo acumulado da importação em ms e as dependências pesadas carregadas
+    """
+    result = run(
+        [executable, "-X", "importtime", "-c", f"import {target}"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    total_us = 0
+    heavy = set()
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = (part.strip() for part in line[len("import time:"):].split("|"))
+        if name == target:
+            total_us = int(cumulative)
+        root = name.split(".")[0]
+        if root in HEAVY_MODULES:
+            heavy.add(root)
+    return total_us / 1000, sorted(heavy)
+
+
+def main():
+    targets = argv[1:] or TARGETS
+    print(f"{'módulo':<40} {'tempo (ms)':>10}  dependências pesadas")
+    for target in targets:
+        # O menor tempo de várias execuções descarta o ruído do cache de disco
+        results = [import_time(target) for _ in range(RUNS)]
+        elapsed = min(elapsed for elapsed, _ in results)
+        print(f"{target:<40} {elapsed:>10.1f}  {', '.join(results[0][1]) or '-'}")
+
+
+if __name__ == "__main__":
+    main()
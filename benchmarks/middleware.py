@@ -0,0 +1,101 @@
+"""
+Benchmark do CustomErrorMiddleware ASGI contra a implementação anterior baseada em BaseHTTPMiddleware,
+e do custo do MetricsMiddleware em relação a uma aplicação sem middlewares.
+
+As requisições são enviadas diretamente para a aplicação ASGI, sem servidor e sem rede, então o
+resultado mede apenas o custo do middleware e do roteamento.
+
+Uso:
+    python -m benchmarks.middleware
+"""
+from asyncio import run
+from time import perf_counter
+
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse
+from starlette.middleware.base import BaseHTTPMiddleware
+
+from src.fastapi_helper.middleware.main import CustomErrorMiddleware
+from src.fastapi_helper.middleware.metrics import MetricsMiddleware
+
+
+REQUESTS = 5_000
+
+
+class BaseHTTPErrorMiddleware(BaseHTTPMiddleware):
+    # Implementação anterior, mantida apenas para comparação
+    async def dispatch(self, request: Request, call_next):
+        try:
+            return await call_next(request)
+        except Exception as e:
+            return JSONResponse(
+                status_code=500,
+                content={"detail": "Internal Server Error: " + str(e)},
+            )
+
+
+def build_app(middleware_class=None) -> FastAPI:
+    app = FastAPI()
+    if middleware_class is not None:
+        app.add_middleware(middleware_class)
+
+    @app.get("/ok")
+    async def ok():
+        return {"message": "Tudo certo!"}
+
+    @app.get("/error")
+    async def error():
+        raise RuntimeError("falha")
+
+    return app
+
+
+async def request(app, path: str):
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "root_path": "",
+        "query_string": b"",
+        "headers": [(b"host", b"localhost")],
+        "client": ("127.0.0.1", 1234),
+        "server": ("localhost", 80),
+    }
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        pass
+
+    await app(scope, receive, send)
+
+
+async def measure(app, path: str) -> float:
+    for _ in range(100):
+        await request(app, path)
+    start = perf_counter()
+    for _ in range(REQUESTS):
+        await request(app, path)
+    return REQUESTS / (perf_counter() - start)
+
+
+async def main():
+    for path in ("/ok", "/error"):
+        for middleware_class in (BaseHTTPErrorMiddleware, CustomErrorMiddleware):
+            rps = await measure(build_app(middleware_class), path)
+            print(f"{middleware_class.__name__:<25} {path:<7} {rps:>10,.0f} req/s")
+
+    base = await measure(build_app(), "/ok")
+    instrumented = await measure(build_app(MetricsMiddleware), "/ok")
+    overhead = (1 / instrumented - 1 / base) * 1e6
+    print(f"{'sem middleware':<25} {'/ok':<7} {base:>10,.0f} req/s")
+    print(f"{'MetricsMiddleware':<25} {'/ok':<7} {instrumented:>10,.0f} req/s ({overhead:.1f} µs por requisição)")
+
+
+if __name__ == "__main__":
+    run(main())
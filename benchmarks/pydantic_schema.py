@@ -0,0 +1,81 @@
+"""
+Benchmark dos métodos de exportação do BaseSchema contra a implementação anterior do `to_dict`,
+que serializava o modelo inteiro e filtrava as chaves em Python.
+
+Uso:
+    python -m benchmarks.pydantic_schema
+"""
+from datetime import datetime
+from time import perf_counter
+
+from src.pydantic_helper.schemas.base import BaseSchema
+
+
+ITEMS = 20_000
+EXCLUDE = ["password", "google_id"]
+
+
+class Address(BaseSchema):
+    street: str
+    city: str
+    zip_code: str
+
+
+class UserOut(BaseSchema):
+    id: int
+    name: str
+    email: str
+    password: str
+    google_id: str | None
+    phone: str | None
+    is_admin: bool
+    created_at: datetime
+    address: Address
+
+
+def legacy_to_dict(model: BaseSchema, exclude_fields: list[str] = [], include_fields: dict = {}, exclude_none: bool = False) -> dict:
+    # Implementação anterior, mantida apenas para comparação
+    data = model.model_dump()
+    data = {k: v for k, v in data.items() if k not in exclude_fields and (not exclude_none or v is not None)}
+    data.update(include_fields)
+    return data
+
+
+def build_users() -> list[UserOut]:
+    return [
+        UserOut(
+            id=idx,
+            name=f"USUARIO {idx}",
+            email=f"usuario{idx}@gmail.com",
+            password="Senha@1234",
+            google_id=None,
+            phone="11999999999" if idx % 2 else None,
+            is_admin=False,
+            created_at=datetime(2024, 1, 1),
+            address=Address(street="Rua A", city="São Paulo", zip_code="01000-000"),
+        )
+        for idx in range(ITEMS)
+    ]
+
+
+def measure(name: str, function):
+    start = perf_counter()
+    function()
+    elapsed = perf_counter() - start
+    print(f"{name:<40} {elapsed * 1000:>9.1f} ms  {ITEMS / elapsed:>12,.0f} itens/s")
+
+
+def main():
+    users = build_users()
+    measure("to_dict anterior", lambda: [legacy_to_dict(user, EXCLUDE, exclude_none=True) for user in users])
+    measure("to_dict", lambda: [user.to_dict(EXCLUDE, exclude_none=True) for user in users])
+    measure("dump_many", lambda: UserOut.dump_many(users, EXCLUDE, exclude_none=True))
+    measure("json.dumps(to_dict anterior)", lambda: [
+        __import__("json").dumps(legacy_to_dict(user, EXCLUDE, exclude_none=True), default=str) for user in users
+    ])
+    measure("to_json", lambda: [user.to_json(EXCLUDE, exclude_none=True) for user in users])
+    measure("dump_many_json", lambda: UserOut.dump_many_json(users, EXCLUDE, exclude_none=True))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+"""
+Benchmark da validação em massa de usuários: schema com os validadores Python (`mode="before"`)
+contra o `User` com restrições do pydantic-core e validação da lista inteira via TypeAdapter.
+
+Uso:
+    python -m benchmarks.pydantic_user
+"""
+from json import dumps
+from time import perf_counter
+
+from src.pydantic_helper.schemas.base import BaseSchema
+from src.pydantic_helper.schemas.user import User, validate_users, validate_users_json
+from src.pydantic_helper.validators.user import (
+    validate_email,
+    validate_is_admin,
+    validate_name,
+    validate_password,
+    validate_phone,
+    validate_username,
+)
+
+
+USERS = 100_000
+
+
+class ValidatorUser(BaseSchema):
+    # Mesmas regras com os validadores Python, mantido apenas para comparação
+    email: str
+    password: str
+    name: str
+    phone: str
+    username: str
+    is_admin: bool = False
+
+    _validate_email = validate_email
+    _validate_password = validate_password
+    _validate_name = validate_name
+    _validate_phone = validate_phone
+    _validate_username = validate_username
+    _validate_is_admin = validate_is_admin
+
+
+def build_payloads() -> list[dict]:
+    return [
+        {
+            "email": f" usuario{idx}@gmail.com ",
+            "password": f"senha{idx}Forte!",
+            "name": f"usuario {idx}",
+            "phone": "(11) 99999-9999",
+            "username": f"usuario{idx}",
+            "is_admin": False,
+        }
+        for idx in range(USERS)
+    ]
+
+
+def measure(name: str, function):
+    start = perf_counter()
+    function()
+    elapsed = perf_counter() - start
+    print(f"{name:<40} {elapsed * 1000:>9.1f} ms  {USERS / elapsed:>12,.0f} usuários/s")
+
+
+def main():
+    payloads = build_payloads()
+    data = dumps(payloads)
+    measure("validadores Python, um a um", lambda: [ValidatorUser(**payload) for payload in payloads])
+    measure("User, um a um", lambda: [User(**payload) for payload in payloads])
+    measure("validate_users", lambda: validate_users(payloads))
+    measure("validate_users_json", lambda: validate_users_json(data))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+"""
+Benchmark do ConnectionManager com milhares de clientes simulados.
+
+Uso:
+    python -m benchmarks.web_sockets
+"""
+from asyncio import run, sleep
+from time import perf_counter
+
+from src.fastapi_helper.web_sockets import ConnectionManager
+
+
+CLIENTS = 10_000
+ROOMS = 100
+MESSAGES = 100
+
+
+class FakeWebSocket:
+    """
+    WebSocket simulado que apenas conta as mensagens recebidas
+    """
+    def __init__(self):
+        self.received = 0
+
+    async def accept(self):
+        pass
+
+    async def send_text(self, message: str):
+        self.received += 1
+
+    async def close(self, code: int = 1000):
+        pass
+
+
+async def main():
+    manager = ConnectionManager(max_queue_size=MESSAGES * 2)
+    clients = [FakeWebSocket() for _ in range(CLIENTS)]
+
+    start = perf_counter()
+    for client_id, websocket in enumerate(clients):
+        await manager.connect(websocket, client_id)
+        manager.subscribe(websocket, f"room-{client_id % ROOMS}")
+    print(f"connect + subscribe: {CLIENTS} clientes em {perf_counter() - start:.3f}s")
+
+    start = perf_counter()
+    for idx in range(MESSAGES):
+        await manager.broadcast({"message": idx})
+    elapsed = perf_counter() - start
+    print(f"broadcast: {MESSAGES / elapsed:,.0f} mensagens/s para {CLIENTS} clientes")
+    await sleep(0)
+
+    start = perf_counter()
+    for idx in range(MESSAGES):
+        await manager.publish(f"room-{idx % ROOMS}", {"message": idx})
+    elapsed = perf_counter() - start
+    print(f"publish: {MESSAGES / elapsed:,.0f} mensagens/s para {CLIENTS // ROOMS} clientes por sala")
+
+    start = perf_counter()
+    for client_id in range(CLIENTS):
+        await manager.send_personal_message("ping", client_id)
+    print(f"send_personal_message: {CLIENTS / (perf_counter() - start):,.0f} mensagens/s")
+
+    start = perf_counter()
+    for websocket in clients:
+        manager.disconnect(websocket)
+    print(f"disconnect: {CLIENTS} clientes em {perf_counter() - start:.3f}s")
+
+
+if __name__ == "__main__":
+    run(main())
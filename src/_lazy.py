@@ -0,0 +1,30 @@
+from importlib import import_module
+from sys import modules
+from typing import Callable
+
+
+def make_lazy(package: str, exports: dict[str, str]) -> tuple[Callable[[str], object], Callable[[], list[str]]]:
+    """
+    Cria o `__getattr__` e o `__dir__` de um pacote que importa os submódulos apenas no primeiro acesso (PEP 562)
+
+    - Args:
+        - package:: str: Nome do pacote (`__name__` do `__init__`)
+        - exports:: dict[str, str]: Nome exportado -> submódulo relativo que o define
+
+    - Returns:
+        - tuple:
+            - __getattr__: Callable[[str], object]: Importa o submódulo e devolve o nome pedido
+            - __dir__: Callable[[], list[str]]: Nomes do pacote, incluindo os ainda não importados
+    """
+    def __getattr__(name: str):
+        if name not in exports:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+        value = getattr(import_module(exports[name], package), name)
+        # Os próximos acessos não passam mais pelo __getattr__
+        setattr(modules[package], name, value)
+        return value
+
+    def __dir__() -> list[str]:
+        return sorted(set(vars(modules[package])) | exports.keys())
+
+    return __getattr__, __dir__
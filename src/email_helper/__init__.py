@@ -0,0 +1,15 @@
+from .._lazy import make_lazy
+
+
+# Nome exportado -> submódulo que o define, importado apenas no primeiro acesso (PEP 562)
+_EXPORTS = {
+    "EmailDispatcher": ".dispatcher",
+    "EmailTemplate": ".templates",
+    "SMTPConnectionPool": ".pool",
+    "generate_email": ".generate",
+    "generate_email_body_with_password": ".generate",
+    "send_email": ".send",
+}
+
+__all__ = list(_EXPORTS)
+__getattr__, __dir__ = make_lazy(__name__, _EXPORTS)
@@ -0,0 +1,229 @@
+from asyncio import Event, Queue, QueueFull, Task, create_task, get_running_loop, to_thread
+from collections import OrderedDict
+from dataclasses import dataclass
+from email.message import Message
+from enum import Enum
+from smtplib import SMTPRecipientsRefused, SMTPResponseException
+from time import monotonic
+from uuid import uuid4
+
+
+from .configs import EMAIL_USERNAME
+from .pool import SMTPConnectionPool
+
+
+class DeliveryStatus(str, Enum):
+    QUEUED = "queued"
+    SENDING = "sending"
+    RETRYING = "retrying"
+    SENT = "sent"
+    FAILED = "failed"
+
+
+@dataclass
+class Delivery:
+    """
+    Estado de entrega de um email enviado pelo EmailDispatcher
+
+    O conteúdo (`msg`) é descartado quando o envio é finalizado, restando apenas o estado.
+    """
+    id: str
+    to_email: str
+    msg: Message | bytes | str | None
+    status: DeliveryStatus = DeliveryStatus.QUEUED
+    attempts: int = 0
+    error: str | None = None
+
+
+def is_permanent_error(error: Exception) -> bool:
+    """
+    Indica se um erro SMTP é definitivo (código 5xx ou destinatário recusado) e não deve ser tentado novamente
+
+    - Args:
+        - error:: Exception: Erro levantado no envio
+
+    - Returns:
+        - bool: True se o erro é definitivo
+    """
+    if isinstance(error, SMTPRecipientsRefused):
+        return True
+    return isinstance(error, SMTPResponseException) and 500 <= error.smtp_code < 600
+
+
+class EmailDispatcher:
+    """
+    Despacha emails em segundo plano sem bloquear o event loop
+
+    Os emails entram em uma fila e workers os enviam em lotes, cada lote por uma única conexão do pool,
+    em threads. Falhas temporárias são tentadas novamente com backoff exponencial e o estado de cada
+    envio fica disponível em `status`. Envios finalizados são descartados após `retention` segundos ou
+    quando passam de `max_finished`, o que ocorrer primeiro.
+
+    - Args:
+        - pool:: SMTPConnectionPool | None: Pool de conexões usado nos envios
+        - workers:: int: Quantidade de workers enviando lotes em paralelo
+        - max_queue:: int: Tamanho máximo da fila de envios
+        - batch_size:: int: Quantidade máxima de emails enviados por lote
+        - max_retries:: int: Quantidade de novas tentativas após uma falha temporária
+        - backoff_base:: float: Espera em segundos antes da primeira nova tentativa, dobrada a cada tentativa
+        - backoff_max:: float: Espera máxima em segundos entre tentativas
+        - from_email:: str: Email do remetente
+        - retention:: float: Tempo em segundos que o estado de um envio finalizado fica disponível
+        - max_finished:: int: Quantidade máxima de envios finalizados guardados
+    """
+    def __init__(
+        self,
+        pool: SMTPConnectionPool | None = None,
+        workers: int = 4,
+        max_queue: int = 10_000,
+        batch_size: int = 50,
+        max_retries: int = 3,
+        backoff_base: float = 1.0,
+        backoff_max: float = 60.0,
+        from_email: str = EMAIL_USERNAME,
+        retention: float = 3600.0,
+        max_finished: int = 10_000
+    ):
+        self.pool = pool or SMTPConnectionPool(max_connections=workers)
+        self.workers = workers
+        self.batch_size = batch_size
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.from_email = from_email
+        self.retention = retention
+        self.max_finished = max_finished
+        self.deliveries: dict[str, Delivery] = {}
+        # ID -> momento em que o envio foi finalizado, do mais antigo para o mais recente
+        self._finished: OrderedDict[str, float] = OrderedDict()
+        self._queue: Queue[Delivery] = Queue(maxsize=max_queue)
+        self._tasks: list[Task] = []
+        self._unfinished = 0
+        self._idle = Event()
+        self._idle.set()
+
+    async def start(self):
+        self._tasks = [create_task(self._worker()) for _ in range(self.workers)]
+
+    async def stop(self, drain: bool = True):
+        """
+        Para os workers e fecha as conexões do pool
+
+        - Args:
+            - drain:: bool: Se True, aguarda a fila esvaziar antes de parar
+        """
+        if drain:
+            await self.join()
+        for task in self._tasks:
+            task.cancel()
+        self._tasks = []
+        await to_thread(self.pool.close)
+
+    async def join(self):
+        """
+        Aguarda todos os emails enfileirados, inclusive novas tentativas agendadas, serem enviados ou falharem
+        """
+        await self._idle.wait()
+
+    async def submit(self, to_email: str, msg: Message | bytes | str) -> str:
+        """
+        Enfileira um email para envio, aguardando caso a fila esteja cheia
+
+        - Args:
+            - to_email:: str: Email do destinatário
+            - msg:: Message | bytes | str: Email formatado para envio
+
+        - Returns:
+            - str: ID do envio, usado em `status`
+        """
+        delivery = Delivery(id=uuid4().hex, to_email=to_email, msg=msg)
+        self.deliveries[delivery.id] = delivery
+        self._unfinished += 1
+        self._idle.clear()
+        await self._queue.put(delivery)
+        return delivery.id
+
+    def status(self, delivery_id: str) -> Delivery | None:
+        return self.deliveries.get(delivery_id)
+
+    def forget(self, delivery_id: str):
+        # Remove o registro de um envio já finalizado antes do fim da retenção
+        self._finished.pop(delivery_id, None)
+        self.deliveries.pop(delivery_id, None)
+
+    async def _worker(self):
+        while True:
+            batch = [await self._queue.get()]
+            while len(batch) < self.batch_size and not self._queue.empty():
+                batch.append(self._queue.get_nowait())
+            for delivery in batch:
+                delivery.status = DeliveryStatus.SENDING
+                delivery.attempts += 1
+            failures = await to_thread(self._send_batch, batch)
+            failed = {id(delivery) for delivery, _ in failures}
+            for delivery in batch:
+                if id(delivery) not in failed:
+                    self._finish(delivery)
+            for delivery, error in failures:
+                self._handle_failure(delivery, error)
+
+    def _send_batch(self, batch: list[Delivery]) -> list[tuple[Delivery, Exception]]:
+        # Roda em uma thread: envia o lote inteiro pela mesma conexão
+        failures = []
+        sent = 0
+        try:
+            with self.pool.connection() as server:
+                for delivery in batch:
+                    msg = delivery.msg
+                    if isinstance(msg, Message):
+                        msg = msg.as_string().encode('utf-8')
+                    try:
+                        server.sendmail(self.from_email, delivery.to_email, msg)
+                        delivery.status = DeliveryStatus.SENT
+                        delivery.error = None
+                    except (SMTPRecipientsRefused, SMTPResponseException) as e:
+                        # Erro apenas deste email, a conexão continua válida
+                        failures.append((delivery, e))
+                    sent += 1
+        except Exception as e:
+            # A conexão falhou, os emails restantes do lote serão tentados novamente
+            failures.extend((delivery, e) for delivery in batch[sent:])
+        return failures
+
+    def _handle_failure(self, delivery: Delivery, error: Exception):
+        delivery.error = str(error)
+        if is_permanent_error(error) or delivery.attempts > self.max_retries:
+            delivery.status = DeliveryStatus.FAILED
+            self._finish(delivery)
+            return
+
+        delivery.status = DeliveryStatus.RETRYING
+        delay = min(self.backoff_max, self.backoff_base * 2 ** (delivery.attempts - 1))
+        get_running_loop().call_later(delay, self._requeue, delivery)
+
+    def _requeue(self, delivery: Delivery):
+        delivery.status = DeliveryStatus.QUEUED
+        try:
+            self._queue.put_nowait(delivery)
+        except QueueFull:
+            delivery.status = DeliveryStatus.FAILED
+            delivery.error = "Fila de envios cheia"
+            self._finish(delivery)
+
+    def _finish(self, delivery: Delivery):
+        # O estado fica disponível durante a retenção, mas o corpo do email não é mais necessário
+        delivery.msg = None
+        self._finished[delivery.id] = monotonic()
+        self._evict_finished()
+        self._unfinished -= 1
+        if self._unfinished == 0:
+            self._idle.set()
+
+    def _evict_finished(self):
+        expired = monotonic() - self.retention
+        while self._finished:
+            delivery_id, finished_at = next(iter(self._finished.items()))
+            if len(self._finished) <= self.max_finished and finished_at > expired:
+                break
+            self._finished.popitem(last=False)
+            self.deliveries.pop(delivery_id, None)
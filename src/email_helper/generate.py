@@ -3,6 +3,21 @@ from email.mime.text import MIMEText
 
 
 from .configs import EMAIL_USERNAME
+from .templates import EmailTemplate
+
+
+PASSWORD_EMAIL_BODY = """
+    <html>
+    <body>
+        <p>Este e-mail foi gerado automaticamente para recuperar sua senha, recomendamos que acesse com a senha a baixo e a substitua por uma senha nova e segura.</p>
+        <p>Sua nova senha é: <span style="color: blue;">$password</span></p>
+    </body>
+    </html>
+    """
+
+# Compilado uma única vez, use PASSWORD_EMAIL.render(to_email, password=...) para gerar o email completo
+PASSWORD_EMAIL = EmailTemplate("Recuperação de senha", PASSWORD_EMAIL_BODY)
+
 
 def generate_email_body_with_password(password: str) -> str:
     """
@@ -15,16 +30,7 @@ def generate_email_body_with_password(password: str) -> str:
         - str: Corpo do email
     """
 
-    html = f"""
-    <html>
-    <body>
-        <p>Este e-mail foi gerado automaticamente para recuperar sua senha, recomendamos que acesse com a senha a baixo e a substitua por uma senha nova e segura.</p>
-        <p>Sua nova senha é: <span style="color: blue;">{password}</span></p>
-    </body>
-    </html>
-    """
-
-    return html
+    return PASSWORD_EMAIL.render_body(password=password)
 
 
 def generate_email(to_email: str, subject: str, body: str) -> MIMEMultipart:
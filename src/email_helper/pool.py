@@ -0,0 +1,150 @@
+from collections import deque
+from contextlib import contextmanager
+from email.message import Message
+from smtplib import SMTP, SMTPException, SMTPServerDisconnected
+from threading import BoundedSemaphore, Lock
+from time import monotonic
+from typing import Iterator
+
+
+from .configs import (
+    SMTP_SERVER,
+    SMTP_PORT,
+    EMAIL_USERNAME,
+    EMAIL_PASSWORD,
+)
+
+
+class SMTPConnectionPool:
+    """
+    Pool de conexões SMTP autenticadas e reutilizáveis entre envios
+
+    Cada conexão paga o handshake TLS e o login apenas uma vez. Conexões ociosas há mais de `max_idle`
+    segundos são descartadas e uma conexão que caiu durante o envio é recriada automaticamente.
+    O pool é seguro para uso em várias threads.
+
+    - Args:
+        - host:: str: Endereço do servidor SMTP
+        - port:: int: Porta do servidor SMTP
+        - username:: str | None: Usuário para login, None para servidores sem autenticação
+        - password:: str | None: Senha do usuário
+        - max_connections:: int: Quantidade máxima de conexões abertas ao mesmo tempo
+        - use_tls:: bool: Se True, executa o STARTTLS ao abrir cada conexão
+        - max_idle:: float: Tempo em segundos que uma conexão pode ficar ociosa antes de ser descartada
+        - timeout:: float: Timeout dos sockets em segundos
+    """
+    def __init__(
+        self,
+        host: str = SMTP_SERVER,
+        port: int = SMTP_PORT,
+        username: str | None = EMAIL_USERNAME,
+        password: str | None = EMAIL_PASSWORD,
+        max_connections: int = 4,
+        use_tls: bool = True,
+        max_idle: float = 60.0,
+        timeout: float = 30.0
+    ):
+        self.host = host
+        self.port = port
+        self.username = username
+        self.password = password
+        self.max_connections = max_connections
+        self.use_tls = use_tls
+        self.max_idle = max_idle
+        self.timeout = timeout
+        self._idle: deque[tuple[SMTP, float]] = deque()
+        self._lock = Lock()
+        self._slots = BoundedSemaphore(max_connections)
+
+    def _create(self) -> SMTP:
+        server = SMTP(self.host, self.port, timeout=self.timeout)
+        try:
+            if self.use_tls:
+                server.starttls()
+            if self.username:
+                server.login(self.username, self.password)
+        except Exception:
+            _close(server)
+            raise
+        return server
+
+    def _checkout(self, fresh: bool = False) -> SMTP:
+        if fresh:
+            return self._create()
+        now = monotonic()
+        with self._lock:
+            while self._idle:
+                server, last_used = self._idle.pop()
+                if now - last_used <= self.max_idle:
+                    return server
+                _close(server)
+        return self._create()
+
+    def _checkin(self, server: SMTP):
+        with self._lock:
+            self._idle.append((server, monotonic()))
+
+    @contextmanager
+    def connection(self, fresh: bool = False) -> Iterator[SMTP]:
+        """
+        Empresta uma conexão autenticada do pool, bloqueando enquanto todas estiverem em uso
+
+        A conexão volta para o pool ao final do bloco, ou é fechada caso ocorra um erro.
+
+        - Args:
+            - fresh:: bool: Se True, abre uma nova conexão em vez de reutilizar uma ociosa
+
+        - Returns:
+            - Iterator[SMTP]: Conexão SMTP pronta para envio
+        """
+        self._slots.acquire()
+        try:
+            server = self._checkout(fresh)
+            try:
+                yield server
+            except BaseException:
+                _close(server)
+                raise
+            self._checkin(server)
+        finally:
+            self._slots.release()
+
+    def send(self, from_email: str, to_email: str | list[str], msg: Message | bytes | str):
+        """
+        Envia um email usando uma conexão do pool, reconectando uma vez caso o servidor tenha encerrado a sessão
+
+        - Args:
+            - from_email:: str: Email do remetente
+            - to_email:: str | list[str]: Email(s) do(s) destinatário(s)
+            - msg:: Message | bytes | str: Email formatado ou já serializado
+        """
+        if isinstance(msg, Message):
+            msg = msg.as_string().encode('utf-8')
+        elif isinstance(msg, str):
+            msg = msg.encode('utf-8')
+
+        for attempt in range(2):
+            try:
+                with self.connection(fresh=attempt > 0) as server:
+                    server.sendmail(from_email, to_email, msg)
+                return
+            except (SMTPServerDisconnected, ConnectionError):
+                # Conexão reaproveitada já estava fechada pelo servidor, tenta com uma nova
+                if attempt == 1:
+                    raise
+
+    def close(self):
+        """
+        Encerra todas as conexões ociosas do pool
+        """
+        with self._lock:
+            while self._idle:
+                server, _ = self._idle.pop()
+                _close(server)
+
+
+def _close(server: SMTP):
+    try:
+        server.quit()
+    except (SMTPException, OSError):
+        server.close()
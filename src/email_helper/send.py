@@ -8,20 +8,31 @@ from .configs import (
     EMAIL_USERNAME,
     EMAIL_PASSWORD,
 )
+from .pool import SMTPConnectionPool
 
 
-def send_email(to_email: str, msg: MIMEMultipart) -> bool:
+def send_email(to_email: str, msg: MIMEMultipart, pool: SMTPConnectionPool | None = None) -> bool:
     """
     Envia um email para um email de destino
 
     - Args:
         - to_email (str): Email do destinatário
         - msg (MIMEMultipart): Email formatado para envio
+        - pool (SMTPConnectionPool | None): Pool de conexões a reutilizar, sem ele uma nova conexão é aberta para este envio
 
     - Returns:
         - None
     """
     try:
+        if pool is not None:
+            pool.send(EMAIL_USERNAME, to_email, msg)
+
+            msg = f"Email enviado com sucesso para {to_email}"
+
+            print(msg)
+
+            return msg
+
         """
         Cria uma instância do objeto SMTP e conecta ao servidor SMTP especificado pelo endereço (smtp_server) e porta (smtp_port).
         """
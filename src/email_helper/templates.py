@@ -0,0 +1,146 @@
+from base64 import encodebytes
+from email.header import Header
+from html import escape
+from string import Template
+from typing import Iterable, Iterator
+from uuid import uuid4
+
+
+from .configs import EMAIL_USERNAME
+
+
+def compile_template(text: str) -> tuple[tuple[str, ...], tuple[str, ...]]:
+    """
+    Separa um template no formato do `string.Template` ($nome ou ${nome}) em trechos fixos e campos
+
+    - Args:
+        - text:: str: Texto do template
+
+    - Returns:
+        - tuple:
+            - statics: tuple[str, ...]: Trechos fixos, sempre um a mais que a quantidade de campos
+            - fields: tuple[str, ...]: Nome dos campos, na ordem em que aparecem
+
+    - Raises:
+        - ValueError: Caso o template tenha um placeholder inválido
+    """
+    statics = []
+    fields = []
+    current = []
+    last = 0
+    for match in Template.pattern.finditer(text):
+        current.append(text[last:match.start()])
+        last = match.end()
+        if match.group("escaped") is not None:
+            current.append("$")
+        elif match.group("invalid") is not None:
+            raise ValueError(f"Placeholder inválido no template na posição {match.start()}")
+        else:
+            statics.append("".join(current))
+            current = []
+            fields.append(match.group("named") or match.group("braced"))
+    current.append(text[last:])
+    statics.append("".join(current))
+    return tuple(statics), tuple(fields)
+
+
+def _render(statics: tuple[str, ...], fields: tuple[str, ...], values: dict, escape_values: bool) -> str:
+    if not fields:
+        return statics[0]
+    chunks = [statics[0]]
+    for name, static in zip(fields, statics[1:]):
+        try:
+            value = str(values[name])
+        except KeyError:
+            raise KeyError(f"Campo '{name}' não informado para o template") from None
+        chunks.append(escape(value) if escape_values else value)
+        chunks.append(static)
+    return "".join(chunks)
+
+
+def _header(name: str, value: str) -> bytes:
+    # Uma quebra de linha no valor permitiria injetar cabeçalhos ou o corpo do email
+    if "\r" in value or "\n" in value:
+        raise ValueError(f"O cabeçalho {name} não pode conter quebras de linha")
+    if not value.isascii():
+        value = Header(value, "utf-8").encode(linesep="\r\n")
+    return f"{name}: {value}\r\n".encode()
+
+
+class EmailTemplate:
+    """
+    Template de email HTML compilado uma única vez
+
+    Os trechos fixos do corpo, os cabeçalhos e a estrutura MIME são montados na criação do template.
+    Cada envio só substitui os campos do destinatário e concatena bytes, sem construir um `MIMEMultipart`
+    nem chamar `as_string()`. O resultado pode ser passado direto para `SMTP.sendmail`, para o
+    SMTPConnectionPool ou para o EmailDispatcher.
+
+    - Args:
+        - subject:: str: Assunto, pode conter campos ($nome)
+        - html:: str: Corpo HTML, pode conter campos ($nome)
+        - from_email:: str: Email do remetente
+        - escape_values:: bool: Se True, escapa os valores inseridos no HTML
+    """
+    def __init__(self, subject: str, html: str, from_email: str = EMAIL_USERNAME, escape_values: bool = True):
+        self.escape_values = escape_values
+        self._subject = compile_template(subject)
+        self._html = compile_template(html)
+        # O assunto sem campos é codificado uma única vez
+        self._static_subject = None if self._subject[1] else _header("Subject", subject)
+
+        boundary = f"==============={uuid4().hex}=="
+        self._head = (
+            f'Content-Type: multipart/mixed; boundary="{boundary}"\r\n'
+            "MIME-Version: 1.0\r\n"
+        ).encode() + _header("From", from_email)
+        self._part_head = (
+            f"\r\n--{boundary}\r\n"
+            'Content-Type: text/html; charset="utf-8"\r\n'
+            "MIME-Version: 1.0\r\n"
+            "Content-Transfer-Encoding: base64\r\n\r\n"
+        ).encode()
+        self._tail = f"\r\n--{boundary}--\r\n".encode()
+
+    def render_body(self, **values: object) -> str:
+        """
+        Gera apenas o corpo HTML com os campos substituídos
+
+        - Args:
+            - values:: object: Valor de cada campo do template
+
+        - Returns:
+            - str: Corpo HTML
+        """
+        return _render(*self._html, values, self.escape_values)
+
+    def render(self, to_email: str, **values: object) -> bytes:
+        """
+        Gera o email completo, pronto para envio, para um destinatário
+
+        - Args:
+            - to_email:: str: Email do destinatário
+            - values:: object: Valor de cada campo do template
+
+        - Returns:
+            - bytes: Email serializado
+
+        - Raises:
+            - ValueError: Caso o destinatário ou o assunto contenham quebras de linha
+        """
+        subject = self._static_subject or _header("Subject", _render(*self._subject, values, False))
+        body = encodebytes(self.render_body(**values).encode("utf-8")).replace(b"\n", b"\r\n")
+        return b"".join((self._head, _header("To", to_email), subject, self._part_head, body, self._tail))
+
+    def render_many(self, recipients: Iterable[tuple[str, dict]]) -> Iterator[tuple[str, bytes]]:
+        """
+        Gera os emails de uma mala direta sob demanda
+
+        - Args:
+            - recipients:: Iterable[tuple[str, dict]]: Pares (email do destinatário, valores dos campos)
+
+        - Returns:
+            - Iterator[tuple[str, bytes]]: Pares (email do destinatário, email serializado)
+        """
+        for to_email, values in recipients:
+            yield to_email, self.render(to_email, **values)
@@ -0,0 +1,20 @@
+from .._lazy import make_lazy
+
+
+# Nome exportado -> submódulo que o define, importado apenas no primeiro acesso (PEP 562)
+_EXPORTS = {
+    "Broker": ".brokers",
+    "MemoryBroker": ".brokers",
+    "RedisBroker": ".brokers",
+    "UnixSocketBroker": ".brokers",
+    "ConnectionManager": ".web_sockets",
+    "FastJSONResponse": ".responses",
+    "FastJSONRoute": ".responses",
+    "fast_json_app": ".responses",
+    "json_dumps": ".responses",
+    "json_array_response": ".streaming",
+    "ndjson_response": ".streaming",
+}
+
+__all__ = list(_EXPORTS)
+__getattr__, __dir__ = make_lazy(__name__, _EXPORTS)
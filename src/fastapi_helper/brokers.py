@@ -0,0 +1,278 @@
+from abc import ABC, abstractmethod
+from asyncio import (
+    Event,
+    IncompleteReadError,
+    Task,
+    StreamReader,
+    StreamWriter,
+    create_task,
+    open_unix_connection,
+    sleep,
+    start_unix_server,
+)
+from collections.abc import Awaitable, Callable
+from contextlib import suppress
+from fcntl import LOCK_EX, LOCK_NB, flock
+from logging import getLogger
+from os import unlink
+from os.path import exists
+from struct import Struct
+
+
+logger = getLogger(__name__)
+
+DEFAULT_CHANNEL = "nano-services:websockets"
+DEFAULT_SOCKET_PATH = "/tmp/nano-services-websockets.sock"
+RECONNECT_DELAY = 0.05
+
+# Cada mensagem no Unix socket é precedida do tamanho em 4 bytes (big-endian)
+FRAME_HEADER = Struct("!I")
+
+MessageHandler = Callable[[str], Awaitable[None]]
+
+
+class Broker(ABC):
+    """
+    Interface para distribuir mensagens do WebSocket entre processos ou nós.
+
+    Toda mensagem publicada é entregue a todos os handlers registrados em todos os processos,
+    inclusive no processo que a publicou.
+
+    - Args:
+        - channel:: str: Nome do canal compartilhado pelos processos
+    """
+    def __init__(self, channel: str = DEFAULT_CHANNEL):
+        self.channel = channel
+        self._handlers: list[MessageHandler] = []
+
+    def add_handler(self, handler: MessageHandler):
+        self._handlers.append(handler)
+
+    async def _dispatch(self, message: str):
+        for handler in self._handlers:
+            await handler(message)
+
+    @abstractmethod
+    async def start(self) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def publish(self, message: str) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def close(self) -> None:
+        raise NotImplementedError
+
+
+class MemoryBroker(Broker):
+    """
+    Broker dentro do próprio processo, útil para um único worker ou para testes.
+    """
+    async def start(self) -> None:
+        pass
+
+    async def publish(self, message: str) -> None:
+        await self._dispatch(message)
+
+    async def close(self) -> None:
+        pass
+
+
+class UnixSocketBroker(Broker):
+    """
+    Broker entre processos da mesma máquina usando um Unix socket.
+
+    O primeiro processo que obtém o lock do arquivo `<path>.lock` abre o hub que repassa cada mensagem
+    recebida para todos os processos conectados. Os demais apenas se conectam ao hub e, se ele cair,
+    reconectam e disputam o lock de novo para eleger outro hub.
+
+    - Args:
+        - path:: str: Caminho do Unix socket compartilhado pelos workers
+        - channel:: str: Nome do canal
+    """
+    def __init__(self, path: str = DEFAULT_SOCKET_PATH, channel: str = DEFAULT_CHANNEL):
+        super().__init__(channel)
+        self.path = path
+        self._lock_file = None
+        self._server = None
+        self._peers: set[StreamWriter] = set()
+        self._writer: StreamWriter | None = None
+        self._connected = Event()
+        self._reader_task: Task | None = None
+
+    async def start(self) -> None:
+        self._reader_task = create_task(self._run())
+        await self._connected.wait()
+
+    async def _run(self):
+        while True:
+            if self._server is None:
+                await self._try_serve()
+            try:
+                reader, writer = await open_unix_connection(self.path)
+            except (FileNotFoundError, ConnectionRefusedError):
+                await sleep(RECONNECT_DELAY)
+                continue
+
+            self._writer = writer
+            self._connected.set()
+            try:
+                while True:
+                    frame = await _read_frame(reader)
+                    await self._dispatch(frame[FRAME_HEADER.size:].decode())
+            except (OSError, IncompleteReadError):
+                # O hub caiu: volta ao início do laço para reconectar ou assumir o hub
+                pass
+            finally:
+                self._connected.clear()
+                self._writer = None
+                writer.close()
+
+    async def _try_serve(self):
+        # Apenas o processo que obtiver o lock se torna o hub
+        lock_file = open(f"{self.path}.lock", "w")
+        try:
+            flock(lock_file, LOCK_EX | LOCK_NB)
+        except BlockingIOError:
+            lock_file.close()
+            return
+        self._lock_file = lock_file
+        if exists(self.path):
+            unlink(self.path)
+        self._server = await start_unix_server(self._handle_peer, self.path)
+
+    async def _handle_peer(self, reader: StreamReader, writer: StreamWriter):
+        self._peers.add(writer)
+        try:
+            while True:
+                frame = await _read_frame(reader)
+                for peer in list(self._peers):
+                    try:
+                        peer.write(frame)
+                        # Aplica backpressure em vez de acumular o buffer de um peer lento
+                        await peer.drain()
+                    except OSError:
+                        self._peers.discard(peer)
+                        peer.close()
+        except (OSError, IncompleteReadError):
+            pass
+        finally:
+            self._peers.discard(writer)
+            writer.close()
+
+    async def publish(self, message: str) -> None:
+        payload = message.encode()
+        frame = FRAME_HEADER.pack(len(payload)) + payload
+        while True:
+            await self._connected.wait()
+            writer = self._writer
+            try:
+                writer.write(frame)
+                await writer.drain()
+                return
+            except OSError:
+                # A task de leitura percebe a queda do hub e reconecta
+                await sleep(RECONNECT_DELAY)
+
+    async def close(self) -> None:
+        if self._reader_task is not None:
+            self._reader_task.cancel()
+            with suppress(BaseException):
+                await self._reader_task
+        if self._server is not None:
+            self._server.close()
+            for peer in list(self._peers):
+                peer.close()
+            await self._server.wait_closed()
+            self._server = None
+            with suppress(FileNotFoundError):
+                unlink(self.path)
+        if self._lock_file is not None:
+            self._lock_file.close()
+            self._lock_file = None
+
+
+async def _read_frame(reader: StreamReader) -> bytes:
+    # Devolve o frame completo (cabeçalho + conteúdo) para o hub repassar sem remontar
+    header = await reader.readexactly(FRAME_HEADER.size)
+    (size,) = FRAME_HEADER.unpack(header)
+    return header + await reader.readexactly(size)
+
+
+class RedisBroker(Broker):
+    """
+    Broker entre nós usando o Pub/Sub do Redis.
+
+    Requer o pacote `redis` instalado, a menos que um cliente compatível (por exemplo, um substituto local
+    para testes) seja passado em `client`.
+
+    - Args:
+        - url:: str: URL de conexão com o Redis
+        - channel:: str: Canal Pub/Sub usado pelos processos
+        - client:: object: Cliente assíncrono com os métodos `publish` e `pubsub`
+    """
+    def __init__(self, url: str = "redis://localhost:6379/0", channel: str = DEFAULT_CHANNEL, client=None):
+        super().__init__(channel)
+        self.url = url
+        self.client = client
+        self._owns_client = False
+        self._pubsub = None
+        self._listener: Task | None = None
+
+    async def start(self) -> None:
+        if self.client is None:
+            try:
+                from redis.asyncio import from_url
+            except ImportError as e:
+                raise ImportError("RedisBroker requer o pacote 'redis' (pip install redis)") from e
+            self.client = from_url(self.url, decode_responses=True)
+            self._owns_client = True
+
+        self._pubsub = self.client.pubsub()
+        await self._pubsub.subscribe(self.channel)
+        self._listener = create_task(self._listen())
+
+    async def _listen(self):
+        while True:
+            try:
+                if self._pubsub is None:
+                    self._pubsub = self.client.pubsub()
+                    await self._pubsub.subscribe(self.channel)
+                async for item in self._pubsub.listen():
+                    if item["type"] != "message":
+                        continue
+                    data = item["data"]
+                    if isinstance(data, bytes):
+                        data = data.decode()
+                    await self._dispatch(data)
+            except Exception:
+                logger.exception("Conexão com o Redis perdida no canal %s, inscrevendo novamente", self.channel)
+            # A inscrição caiu: descarta o PubSub e se inscreve de novo após a espera
+            await self._close_pubsub()
+            await sleep(RECONNECT_DELAY)
+
+    async def _close_pubsub(self):
+        pubsub, self._pubsub = self._pubsub, None
+        if pubsub is None:
+            return
+        with suppress(Exception):
+            await pubsub.unsubscribe(self.channel)
+        with suppress(Exception):
+            await pubsub.aclose()
+
+    async def publish(self, message: str) -> None:
+        await self.client.publish(self.channel, message)
+
+    async def close(self) -> None:
+        if self._listener is not None:
+            self._listener.cancel()
+            with suppress(BaseException):
+                await self._listener
+            self._listener = None
+        await self._close_pubsub()
+        if self._owns_client:
+            # Cliente criado pelo próprio broker em `start`
+            await self.client.aclose()
+            self.client = None
+            self._owns_client = False
@@ -0,0 +1,16 @@
+from ..._lazy import make_lazy
+
+
+# Nome exportado -> submódulo que o define, importado apenas no primeiro acesso (PEP 562)
+_EXPORTS = {
+    "CompressionMiddleware": ".compression",
+    "CustomErrorMiddleware": ".main",
+    "MetricsMiddleware": ".metrics",
+    "ConcurrencyLimitMiddleware": ".rate_limit",
+    "MemoryTokenBucketStore": ".rate_limit",
+    "RateLimitMiddleware": ".rate_limit",
+    "RedisTokenBucketStore": ".rate_limit",
+}
+
+__all__ = list(_EXPORTS)
+__getattr__, __dir__ = make_lazy(__name__, _EXPORTS)
@@ -0,0 +1,176 @@
+from zlib import Z_SYNC_FLUSH, compressobj, MAX_WBITS
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+try:
+    import brotli
+except ImportError:  # brotli é opcional
+    brotli = None
+
+try:
+    import zstandard
+except ImportError:  # zstandard é opcional
+    zstandard = None
+
+
+# Tipos que já são comprimidos e não valem o custo de comprimir novamente
+INCOMPRESSIBLE_TYPES = ("image/", "video/", "audio/", "application/zip", "application/gzip")
+
+
+class _Gzip:
+    def __init__(self, level: int):
+        self._compressor = compressobj(level, wbits=MAX_WBITS | 16)
+
+    def compress(self, data: bytes) -> bytes:
+        return self._compressor.compress(data) + self._compressor.flush(Z_SYNC_FLUSH)
+
+    def finish(self, data: bytes) -> bytes:
+        return self._compressor.compress(data) + self._compressor.flush()
+
+
+class _Brotli:
+    def __init__(self, level: int):
+        self._compressor = brotli.Compressor(quality=level)
+
+    def compress(self, data: bytes) -> bytes:
+        return self._compressor.process(data) + self._compressor.flush()
+
+    def finish(self, data: bytes) -> bytes:
+        return self._compressor.process(data) + self._compressor.finish()
+
+
+class _Zstd:
+    def __init__(self, level: int):
+        self._compressor = zstandard.ZstdCompressor(level=level).compressobj()
+
+    def compress(self, data: bytes) -> bytes:
+        return self._compressor.compress(data) + self._compressor.flush(zstandard.COMPRESSOBJ_FLUSH_BLOCK)
+
+    def finish(self, data: bytes) -> bytes:
+        return self._compressor.compress(data) + self._compressor.flush()
+
+
+class CompressionMiddleware:
+    """
+    Middleware ASGI que comprime as respostas com zstd, brotli ou gzip, conforme o `Accept-Encoding`
+    do cliente e as bibliotecas instaladas (gzip sempre está disponível).
+
+    Respostas menores que `minimum_size` seguem sem compressão. Respostas em streaming são comprimidas
+    pedaço a pedaço e cada pedaço é enviado assim que comprimido, sem acumular o corpo inteiro.
+
+    - Args:
+        - app:: ASGIApp: Aplicação ASGI
+        - minimum_size:: int: Tamanho mínimo em bytes do corpo para aplicar a compressão
+        - gzip_level:: int: Nível de compressão do gzip (1 a 9)
+        - brotli_quality:: int: Qualidade do brotli (0 a 11)
+        - zstd_level:: int: Nível do zstd (1 a 22)
+    """
+    def __init__(
+        self,
+        app: ASGIApp,
+        minimum_size: int = 1024,
+        gzip_level: int = 6,
+        brotli_quality: int = 4,
+        zstd_level: int = 3
+    ):
+        self.app = app
+        self.minimum_size = minimum_size
+        self.encoders = {"gzip": lambda: _Gzip(gzip_level)}
+        if brotli is not None:
+            self.encoders["br"] = lambda: _Brotli(brotli_quality)
+        if zstandard is not None:
+            self.encoders["zstd"] = lambda: _Zstd(zstd_level)
+
+    def _choose_encoding(self, accept_encoding: str) -> str | None:
+        # Codificações com q=0 são recusadas pelo cliente (RFC 9110, seção 12.5.3)
+        qualities: dict[str, float] = {}
+        for item in accept_encoding.split(","):
+            coding, *params = item.split(";")
+            coding = coding.strip().lower()
+            if not coding:
+                continue
+            quality = 1.0
+            for param in params:
+                name, _, value = param.partition("=")
+                if name.strip().lower() == "q":
+                    try:
+                        quality = float(value)
+                    except ValueError:
+                        quality = 0.0
+            qualities[coding] = quality
+
+        # Entre as de maior q, vale a ordem de preferência do servidor
+        wildcard = qualities.get("*", 0.0)
+        chosen, chosen_quality = None, 0.0
+        for encoding in ("zstd", "br", "gzip"):
+            quality = qualities.get(encoding, wildcard)
+            if encoding in self.encoders and quality > chosen_quality:
+                chosen, chosen_quality = encoding, quality
+        return chosen
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        encoding = self._choose_encoding(Headers(scope=scope).get("accept-encoding", ""))
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+
+        start_message: Message | None = None
+        encoder = None
+        passthrough = False
+
+        async def send_wrapper(message: Message):
+            nonlocal start_message, encoder, passthrough
+
+            if message["type"] == "http.response.start":
+                # Segura o início da resposta até saber o tamanho do primeiro pedaço do corpo
+                start_message = message
+                return
+            if message["type"] != "http.response.body" or passthrough:
+                if start_message is not None and encoder is None and not passthrough:
+                    # Ex: pathsend ou trailers antes de qualquer corpo, a resposta segue sem compressão
+                    passthrough = True
+                    await send(start_message)
+                await send(message)
+                return
+
+            body = message.get("body", b"")
+            more_body = message.get("more_body", False)
+
+            if encoder is None:
+                headers = MutableHeaders(raw=start_message["headers"])
+                content_type = headers.get("content-type", "")
+                if (
+                    "content-encoding" in headers
+                    or content_type.startswith(INCOMPRESSIBLE_TYPES)
+                    or (not more_body and len(body) < self.minimum_size)
+                ):
+                    passthrough = True
+                    await send(start_message)
+                    await send(message)
+                    return
+
+                encoder = self.encoders[encoding]()
+                headers["Content-Encoding"] = encoding
+                headers.add_vary_header("Accept-Encoding")
+                if "content-length" in headers:
+                    del headers["content-length"]
+                if not more_body:
+                    body = encoder.finish(body)
+                    headers["Content-Length"] = str(len(body))
+                    await send(start_message)
+                    await send({"type": "http.response.body", "body": body, "more_body": False})
+                    return
+                await send(start_message)
+
+            body = encoder.compress(body) if more_body else encoder.finish(body)
+            await send({"type": "http.response.body", "body": body, "more_body": more_body})
+
+        await self.app(scope, receive, send_wrapper)
+        if start_message is not None and encoder is None and not passthrough:
+            # A aplicação terminou sem enviar corpo: o início da resposta ainda está retido
+            await send(start_message)
@@ -0,0 +1,59 @@
+from fastapi import Request, HTTPException
+from fastapi.exceptions import RequestValidationError
+from pydantic import BaseModel
+
+from src.fastapi_helper.middleware.main import CustomErrorMiddleware
+from src.fastapi_helper.middleware.metrics import MetricsMiddleware
+from src.fastapi_helper.responses import FastJSONResponse, fast_json_app
+
+# Aplicação de exemplo dos middlewares: python -m src.fastapi_helper.middleware.example
+app = fast_json_app()
+
+# Métricas no formato do Prometheus em /metrics.
+# Adicionado antes do CustomErrorMiddleware para ficar por dentro dele e ainda ver as exceções
+app.add_middleware(MetricsMiddleware)
+# Adicionando o middleware ao aplicativo
+app.add_middleware(CustomErrorMiddleware)
+
+# Sobrescrevendo o manipulador de exceções para erros de validação do Pydantic
+@app.exception_handler(RequestValidationError)
+async def validation_exception_handler(request: Request, exc: RequestValidationError):
+    pydantic_errors = exc.errors()
+    msg = pydantic_errors[0]["msg"]
+    loc, field = pydantic_errors[0]["loc"]
+    detail = f"{msg} {field} in {loc}"
+    
+    return FastJSONResponse(
+        status_code=422,
+        content={"detail": detail}
+    )
+    
+# Sobrescrevendo o manipulador de exceções para erros HTTP
+
+
+# Exemplo de rota para testar o middleware
+@app.post("/test")
+async def test_route(data: dict):
+    if "error" in data:
+        raise HTTPException(status_code=400, detail="Erro customizado")
+    return {"message": "Tudo certo!"}
+
+# Exemplo de rota para testar validação do Pydantic
+class Item(BaseModel):
+    name: str
+    price: float
+
+@app.post("/items/")
+async def create_item(item: Item):
+    return item
+
+
+
+if __name__ == "__main__":
+    import uvicorn
+
+    uvicorn.run(
+        app, 
+        host="0.0.0.0", 
+        port=8001
+    )
\ No newline at end of file
@@ -1,78 +1,67 @@
-from fastapi import FastAPI, Request, HTTPException
-from fastapi.exceptions import RequestValidationError
-from fastapi.responses import JSONResponse
+from fastapi import HTTPException
 from pydantic import ValidationError
-from starlette.middleware.base import BaseHTTPMiddleware
-import uvicorn
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
-app = FastAPI()
+from src.fastapi_helper.responses import json_dumps
+
+JSON_CONTENT_TYPE = (b"content-type", b"application/json")
+VALIDATION_ERROR_PREFIX = b'{"detail":"Validation Error","errors":'
+DETAIL_PREFIX = b'{"detail":'
 
-class CustomErrorMiddleware(BaseHTTPMiddleware):
-    async def dispatch(self, request: Request, call_next):
-        try:
-            response = await call_next(request)
-            return response
-        except ValidationError as e:
-            # Formatação de erro de validação do Pydantic
-            return JSONResponse(
-                status_code=422,
-                content={"detail": "Validation Error", "errors": e.errors()},
-            )
-        except HTTPException as e:
-            # Formatação de erro HTTP (por exemplo, 404, 400, etc.)
-            return JSONResponse(
-                status_code=e.status_code,
-                content={"detail": e.detail},
-            )
-        except Exception as e:
-            # Formatação de erro genérico
-            return JSONResponse(
-                status_code=500,
-                content={"detail": "Internal Server Error: " + str(e)},
-            )
 
-# Adicionando o middleware ao aplicativo
-app.add_middleware(CustomErrorMiddleware)
+def error_response(exc: Exception) -> tuple[int, bytes]:
+    """
+    Converte uma exceção no status e no corpo JSON da resposta de erro
 
-# Sobrescrevendo o manipulador de exceções para erros de validação do Pydantic
-@app.exception_handler(RequestValidationError)
-async def validation_exception_handler(request: Request, exc: RequestValidationError):
-    pydantic_errors = exc.errors()
-    msg = pydantic_errors[0]["msg"]
-    loc, field = pydantic_errors[0]["loc"]
-    detail = f"{msg} {field} in {loc}"
-    
-    return JSONResponse(
-        status_code=422,
-        content={"detail": detail}
-    )
-    
-# Sobrescrevendo o manipulador de exceções para erros HTTP
+    - Args:
+        - exc:: Exception: Exceção levantada durante a requisição
 
+    - Returns:
+        - tuple[int, bytes]: Status HTTP e corpo da resposta
+    """
+    if isinstance(exc, ValidationError):
+        # Formatação de erro de validação do Pydantic
+        return 422, VALIDATION_ERROR_PREFIX + json_dumps(exc.errors()) + b"}"
+    if isinstance(exc, HTTPException):
+        # Formatação de erro HTTP (por exemplo, 404, 400, etc.)
+        return exc.status_code, DETAIL_PREFIX + json_dumps(exc.detail) + b"}"
+    # Formatação de erro genérico
+    return 500, DETAIL_PREFIX + json_dumps("Internal Server Error: " + str(exc)) + b"}"
 
-# Exemplo de rota para testar o middleware
-@app.post("/test")
-async def test_route(data: dict):
-    if "error" in data:
-        raise HTTPException(status_code=400, detail="Erro customizado")
-    return {"message": "Tudo certo!"}
 
-# Exemplo de rota para testar validação do Pydantic
-from pydantic import BaseModel
+class CustomErrorMiddleware:
+    """
+    Middleware ASGI que converte exceções em respostas JSON.
 
-class Item(BaseModel):
-    name: str
-    price: float
+    Não usa o `BaseHTTPMiddleware`, então não cria tasks e streams extras por requisição e não
+    interfere em respostas em streaming.
+    """
+    def __init__(self, app: ASGIApp):
+        self.app = app
 
-@app.post("/items/")
-async def create_item(item: Item):
-    return item
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
 
+        response_started = False
 
+        async def send_wrapper(message: Message):
+            nonlocal response_started
+            if message["type"] == "http.response.start":
+                response_started = True
+            await send(message)
 
-if __name__ == "__main__":
-    uvicorn.run(
-        app, 
-        host="0.0.0.0", 
-        port=8001
-    )
\ No newline at end of file
+        try:
+            await self.app(scope, receive, send_wrapper)
+        except Exception as e:
+            # Se a resposta já começou a ser enviada não é possível trocá-la
+            if response_started:
+                raise
+            status_code, body = error_response(e)
+            await send({
+                "type": "http.response.start",
+                "status": status_code,
+                "headers": [JSON_CONTENT_TYPE, (b"content-length", str(len(body)).encode())],
+            })
+            await send({"type": "http.response.body", "body": body})
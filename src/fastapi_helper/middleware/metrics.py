@@ -0,0 +1,268 @@
+from bisect import bisect_left
+from collections import deque
+from io import StringIO
+from random import random
+from time import perf_counter_ns
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+
+# Limites dos buckets em escala logarítmica (1, 2, 5 por década), no estilo dos histogramas HDR
+LATENCY_BUCKETS = tuple(
+    base * 10 ** exponent
+    for exponent in range(-5, 1)
+    for base in (1, 2, 5)
+) + (10.0,)
+SIZE_BUCKETS = tuple(
+    base * 10 ** exponent
+    for exponent in range(2, 8)
+    for base in (1, 2, 5)
+)
+
+PROMETHEUS_CONTENT_TYPE = b"text/plain; version=0.0.4; charset=utf-8"
+UNMATCHED_ROUTE = "__unmatched__"
+
+
+class Histogram:
+    """
+    Histograma com buckets fixos. Cada registro incrementa apenas um contador, sem locks, pois o
+    middleware roda no event loop de um único worker.
+
+    - Args:
+        - bounds:: tuple[float, ...]: Limites superiores dos buckets, em ordem crescente
+    """
+    __slots__ = ("bounds", "counts", "total", "count")
+
+    def __init__(self, bounds: tuple[float, ...]):
+        self.bounds = bounds
+        self.counts = [0] * (len(bounds) + 1)
+        self.total = 0.0
+        self.count = 0
+
+    def record(self, value: float):
+        self.counts[bisect_left(self.bounds, value)] += 1
+        self.total += value
+        self.count += 1
+
+    def cumulative(self) -> list[tuple[str, int]]:
+        result = []
+        running = 0
+        for bound, count in zip(self.bounds, self.counts):
+            running += count
+            result.append((repr(float(bound)), running))
+        result.append(("+Inf", self.count))
+        return result
+
+
+class RouteMetrics:
+    """
+    Métricas de uma rota (método + caminho do template da rota)
+    """
+    __slots__ = ("latency", "response_size", "status_codes", "exceptions")
+
+    def __init__(self):
+        self.latency = Histogram(LATENCY_BUCKETS)
+        self.response_size = Histogram(SIZE_BUCKETS)
+        self.status_codes: dict[int, int] = {}
+        self.exceptions = 0
+
+
+class MetricsMiddleware:
+    """
+    Middleware ASGI que registra latência, tamanho das respostas, status e exceções por rota, além
+    das requisições em andamento, e expõe tudo no formato de texto do Prometheus em `metrics_path`.
+
+    As rotas são agrupadas pelo template (ex: `/items/{item_id}`), nunca pelo caminho bruto.
+
+    - Args:
+        - app:: ASGIApp: Aplicação ASGI
+        - metrics_path:: str: Caminho que responde com as métricas
+        - slow_request_threshold:: float | None: Duração em segundos a partir da qual uma requisição amostrada tem o perfil guardado
+        - profile_sample_rate:: float: Fração das requisições executadas sob o profiler (0 desativa)
+        - profiler:: str: "cprofile" ou "pyinstrument" (requer o pacote `pyinstrument`)
+        - max_profiles:: int: Quantidade de perfis de requisições lentas guardados em `slow_profiles`
+    """
+    def __init__(
+        self,
+        app: ASGIApp,
+        metrics_path: str = "/metrics",
+        slow_request_threshold: float | None = None,
+        profile_sample_rate: float = 0.0,
+        profiler: str = "cprofile",
+        max_profiles: int = 20
+    ):
+        if profiler not in ("cprofile", "pyinstrument"):
+            raise ValueError(f"Profiler inválido: {profiler}. Use 'cprofile' ou 'pyinstrument'")
+        if profile_sample_rate > 0 and profiler == "pyinstrument":
+            try:
+                import pyinstrument  # noqa: F401
+            except ImportError as e:
+                raise ImportError("O profiler 'pyinstrument' requer o pacote 'pyinstrument' (pip install pyinstrument)") from e
+
+        self.app = app
+        self.metrics_path = metrics_path
+        self.slow_request_threshold = slow_request_threshold
+        self.profile_sample_rate = profile_sample_rate
+        self.profiler = profiler
+        self.routes: dict[tuple[str, str], RouteMetrics] = {}
+        self.in_flight = 0
+        self.slow_profiles: deque[dict] = deque(maxlen=max_profiles)
+        # Só um profiler pode estar ativo por vez, requisições sorteadas enquanto isso rodam sem profiler
+        self._profiling = False
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        if scope["path"] == self.metrics_path:
+            await self._send_metrics(send)
+            return
+
+        if self.profile_sample_rate > 0 and not self._profiling and random() < self.profile_sample_rate:
+            await self._profiled_call(scope, receive, send)
+        else:
+            await self._call(scope, receive, send)
+
+    async def _call(self, scope: Scope, receive: Receive, send: Send) -> float:
+        status_code = 500
+        size = 0
+
+        async def send_wrapper(message: Message):
+            nonlocal status_code, size
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            elif message["type"] == "http.response.body":
+                size += len(message.get("body", b""))
+            await send(message)
+
+        self.in_flight += 1
+        start = perf_counter_ns()
+        failed = False
+        try:
+            await self.app(scope, receive, send_wrapper)
+        except Exception:
+            failed = True
+            raise
+        finally:
+            elapsed = (perf_counter_ns() - start) / 1e9
+            self.in_flight -= 1
+
+            route = scope.get("route")
+            key = (scope["method"], getattr(route, "path", UNMATCHED_ROUTE))
+            metrics = self.routes.get(key)
+            if metrics is None:
+                metrics = self.routes[key] = RouteMetrics()
+            metrics.latency.record(elapsed)
+            metrics.response_size.record(size)
+            metrics.status_codes[status_code] = metrics.status_codes.get(status_code, 0) + 1
+            if failed:
+                metrics.exceptions += 1
+
+        return elapsed
+
+    async def _profiled_call(self, scope: Scope, receive: Receive, send: Send):
+        # O profiler registra tudo o que roda no event loop durante a requisição, inclusive outras requisições concorrentes
+        if self.profiler == "pyinstrument":
+            from pyinstrument import Profiler
+
+            profiler = Profiler(async_mode="enabled")
+        else:
+            from cProfile import Profile
+
+            profiler = Profile()
+
+        try:
+            if self.profiler == "pyinstrument":
+                profiler.start()
+            else:
+                profiler.enable()
+        except (RuntimeError, ValueError):
+            # Outro profiler já está ativo no processo, a requisição segue sem profiler
+            await self._call(scope, receive, send)
+            return
+
+        self._profiling = True
+        elapsed = None
+        try:
+            elapsed = await self._call(scope, receive, send)
+        finally:
+            self._profiling = False
+            if self.profiler == "pyinstrument":
+                profiler.stop()
+            else:
+                profiler.disable()
+            if elapsed is not None and (self.slow_request_threshold is None or elapsed >= self.slow_request_threshold):
+                self.slow_profiles.append({
+                    "method": scope["method"],
+                    "path": scope["path"],
+                    "duration": elapsed,
+                    "profile": self._render_profile(profiler),
+                })
+
+    def _render_profile(self, profiler) -> str:
+        if self.profiler == "pyinstrument":
+            return profiler.output_text()
+
+        from pstats import Stats
+
+        output = StringIO()
+        Stats(profiler, stream=output).sort_stats("cumulative").print_stats(30)
+        return output.getvalue()
+
+    async def _send_metrics(self, send: Send):
+        body = self.render_prometheus().encode()
+        await send({
+            "type": "http.response.start",
+            "status": 200,
+            "headers": [(b"content-type", PROMETHEUS_CONTENT_TYPE), (b"content-length", str(len(body)).encode())],
+        })
+        await send({"type": "http.response.body", "body": body})
+
+    def render_prometheus(self) -> str:
+        """
+        Gera as métricas no formato de texto do Prometheus
+
+        - Returns:
+            - str: Métricas de todas as rotas registradas
+        """
+        lines = [
+            "# HELP http_requests_in_flight Requisições em andamento",
+            "# TYPE http_requests_in_flight gauge",
+            f"http_requests_in_flight {self.in_flight}",
+            "# HELP http_request_duration_seconds Latência das requisições",
+            "# TYPE http_request_duration_seconds histogram",
+        ]
+        items = sorted(self.routes.items())
+        for (method, path), metrics in items:
+            lines.extend(_histogram_lines("http_request_duration_seconds", _labels(method, path), metrics.latency))
+
+        lines.append("# HELP http_response_size_bytes Tamanho do corpo das respostas")
+        lines.append("# TYPE http_response_size_bytes histogram")
+        for (method, path), metrics in items:
+            lines.extend(_histogram_lines("http_response_size_bytes", _labels(method, path), metrics.response_size))
+
+        lines.append("# HELP http_responses_total Respostas por status")
+        lines.append("# TYPE http_responses_total counter")
+        for (method, path), metrics in items:
+            labels = _labels(method, path)
+            for status_code, count in sorted(metrics.status_codes.items()):
+                lines.append(f'http_responses_total{{{labels},status="{status_code}"}} {count}')
+
+        lines.append("# HELP http_request_exceptions_total Exceções não tratadas")
+        lines.append("# TYPE http_request_exceptions_total counter")
+        for (method, path), metrics in items:
+            lines.append(f"http_request_exceptions_total{{{_labels(method, path)}}} {metrics.exceptions}")
+
+        return "\n".join(lines) + "\n"
+
+
+def _labels(method: str, path: str) -> str:
+    path = path.replace("\\", "\\\\").replace('"', '\\"')
+    return f'method="{method}",route="{path}"'
+
+
+def _histogram_lines(name: str, labels: str, histogram: Histogram) -> list[str]:
+    lines = [f'{name}_bucket{{{labels},le="{bound}"}} {count}' for bound, count in histogram.cumulative()]
+    lines.append(f"{name}_sum{{{labels}}} {histogram.total}")
+    lines.append(f"{name}_count{{{labels}}} {histogram.count}")
+    return lines
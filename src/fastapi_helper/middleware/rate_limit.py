@@ -0,0 +1,265 @@
+from abc import ABC, abstractmethod
+from asyncio import Semaphore, wait_for
+from collections import OrderedDict
+from collections.abc import Callable
+from math import ceil
+from time import monotonic
+
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+
+TOO_MANY_REQUESTS_BODY = b'{"detail":"Too Many Requests"}'
+SERVICE_UNAVAILABLE_BODY = b'{"detail":"Service Unavailable"}'
+
+REDIS_TOKEN_BUCKET_SCRIPT = """
+local rate = tonumber(ARGV[1])
+local capacity = tonumber(ARGV[2])
+local cost = tonumber(ARGV[3])
+local time = redis.call('TIME')
+local now = tonumber(time[1]) + tonumber(time[2]) / 1000000
+local bucket = redis.call('HMGET', KEYS[1], 'tokens', 'ts')
+local tokens = tonumber(bucket[1]) or capacity
+local ts = tonumber(bucket[2]) or now
+tokens = math.min(capacity, tokens + (now - ts) * rate)
+local allowed = 0
+local retry_after = 0
+if tokens >= cost then
+    tokens = tokens - cost
+    allowed = 1
+else
+    retry_after = (cost - tokens) / rate
+end
+redis.call('HSET', KEYS[1], 'tokens', tokens, 'ts', now)
+redis.call('EXPIRE', KEYS[1], math.ceil(capacity / rate) + 1)
+return {allowed, tostring(retry_after)}
+"""
+
+REDIS_TOKEN_REFUND_SCRIPT = """
+local capacity = tonumber(ARGV[1])
+local cost = tonumber(ARGV[2])
+local tokens = tonumber(redis.call('HGET', KEYS[1], 'tokens'))
+if tokens then
+    redis.call('HSET', KEYS[1], 'tokens', math.min(capacity, tokens + cost))
+end
+return 1
+"""
+
+
+async def send_rejection(send: Send, status_code: int, body: bytes, retry_after: float):
+    """
+    Envia uma resposta de rejeição (429/503) com o cabeçalho Retry-After
+
+    - Args:
+        - send:: Send: Função `send` do ASGI
+        - status_code:: int: Status HTTP
+        - body:: bytes: Corpo JSON já serializado
+        - retry_after:: float: Segundos até o cliente poder tentar novamente
+    """
+    await send({
+        "type": "http.response.start",
+        "status": status_code,
+        "headers": [
+            (b"content-type", b"application/json"),
+            (b"content-length", str(len(body)).encode()),
+            (b"retry-after", str(max(1, ceil(retry_after))).encode()),
+        ],
+    })
+    await send({"type": "http.response.body", "body": body})
+
+
+class TokenBucketStore(ABC):
+    """
+    Armazena os token buckets usados pelo RateLimitMiddleware
+    """
+    @abstractmethod
+    async def acquire(self, key: str, rate: float, capacity: int, cost: int = 1) -> tuple[bool, float]:
+        """
+        Tenta consumir `cost` tokens do bucket
+
+        - Args:
+            - key:: str: Identificador do bucket
+            - rate:: float: Tokens repostos por segundo
+            - capacity:: int: Quantidade máxima de tokens do bucket
+            - cost:: int: Tokens consumidos pela requisição
+
+        - Returns:
+            - tuple[bool, float]: Se a requisição foi permitida e, caso não, em quantos segundos haverá tokens
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    async def refund(self, key: str, capacity: int, cost: int = 1) -> None:
+        """
+        Devolve ao bucket tokens consumidos por uma requisição que acabou rejeitada por outro limite
+
+        - Args:
+            - key:: str: Identificador do bucket
+            - capacity:: int: Quantidade máxima de tokens do bucket
+            - cost:: int: Tokens devolvidos
+        """
+        raise NotImplementedError
+
+
+class MemoryTokenBucketStore(TokenBucketStore):
+    """
+    Buckets em memória, válidos apenas para o worker atual. Consulta e atualização são O(1) e os
+    buckets menos usados são descartados quando `max_keys` é atingido.
+
+    - Args:
+        - max_keys:: int: Quantidade máxima de buckets mantidos
+    """
+    def __init__(self, max_keys: int = 100_000):
+        self.max_keys = max_keys
+        self._buckets: OrderedDict[str, list[float]] = OrderedDict()
+
+    async def acquire(self, key: str, rate: float, capacity: int, cost: int = 1) -> tuple[bool, float]:
+        now = monotonic()
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            bucket = self._buckets[key] = [float(capacity), now]
+            if len(self._buckets) > self.max_keys:
+                self._buckets.popitem(last=False)
+        else:
+            self._buckets.move_to_end(key)
+            bucket[0] = min(capacity, bucket[0] + (now - bucket[1]) * rate)
+            bucket[1] = now
+
+        if bucket[0] >= cost:
+            bucket[0] -= cost
+            return True, 0.0
+        return False, (cost - bucket[0]) / rate
+
+    async def refund(self, key: str, capacity: int, cost: int = 1) -> None:
+        bucket = self._buckets.get(key)
+        if bucket is not None:
+            bucket[0] = min(capacity, bucket[0] + cost)
+
+
+class RedisTokenBucketStore(TokenBucketStore):
+    """
+    Buckets compartilhados entre workers e nós em um Redis, atualizados atomicamente por um script Lua.
+
+    - Args:
+        - client:: object: Cliente assíncrono do Redis (ex: `redis.asyncio.Redis`) ou compatível
+        - prefix:: str: Prefixo das chaves no Redis
+    """
+    def __init__(self, client, prefix: str = "nano-services:rate-limit:"):
+        self.client = client
+        self.prefix = prefix
+
+    async def acquire(self, key: str, rate: float, capacity: int, cost: int = 1) -> tuple[bool, float]:
+        allowed, retry_after = await self.client.eval(
+            REDIS_TOKEN_BUCKET_SCRIPT, 1, self.prefix + key, rate, capacity, cost
+        )
+        return bool(int(allowed)), float(retry_after)
+
+    async def refund(self, key: str, capacity: int, cost: int = 1) -> None:
+        await self.client.eval(REDIS_TOKEN_REFUND_SCRIPT, 1, self.prefix + key, capacity, cost)
+
+
+def client_key(scope: Scope) -> str:
+    # Identifica o cliente pelo IP da conexão
+    client = scope.get("client")
+    return client[0] if client else "unknown"
+
+
+class RateLimitMiddleware:
+    """
+    Middleware ASGI que limita as requisições com token buckets por cliente e por rota,
+    respondendo 429 com Retry-After quando o limite é atingido.
+
+    - Args:
+        - app:: ASGIApp: Aplicação ASGI
+        - rate:: float: Requisições por segundo permitidas para cada cliente
+        - capacity:: int: Rajada máxima de requisições de cada cliente
+        - route_limits:: dict[str, tuple[float, int]]: Limites (rate, capacity) compartilhados por todos os clientes, por prefixo de caminho
+        - store:: TokenBucketStore: Onde os buckets são guardados, use RedisTokenBucketStore para limites entre workers
+        - key_func:: Callable[[Scope], str]: Função que identifica o cliente
+    """
+    def __init__(
+        self,
+        app: ASGIApp,
+        rate: float = 10.0,
+        capacity: int = 20,
+        route_limits: dict[str, tuple[float, int]] | None = None,
+        store: TokenBucketStore | None = None,
+        key_func: Callable[[Scope], str] = client_key
+    ):
+        self.app = app
+        self.rate = rate
+        self.capacity = capacity
+        self.route_limits = route_limits or {}
+        self.store = store or MemoryTokenBucketStore()
+        self.key_func = key_func
+
+    def _route_limit(self, path: str) -> tuple[str, float, int] | None:
+        for prefix, (rate, capacity) in self.route_limits.items():
+            if path.startswith(prefix):
+                return prefix, rate, capacity
+        return None
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        client = f"client:{self.key_func(scope)}"
+        allowed, retry_after = await self.store.acquire(client, self.rate, self.capacity)
+        if allowed:
+            route_limit = self._route_limit(scope["path"])
+            if route_limit is not None:
+                prefix, rate, capacity = route_limit
+                allowed, retry_after = await self.store.acquire(f"route:{prefix}", rate, capacity)
+                if not allowed:
+                    # Rejeitada pelo limite da rota: a requisição não conta na cota do cliente
+                    await self.store.refund(client, self.capacity)
+
+        if not allowed:
+            await send_rejection(send, 429, TOO_MANY_REQUESTS_BODY, retry_after)
+            return
+        await self.app(scope, receive, send)
+
+
+class ConcurrencyLimitMiddleware:
+    """
+    Middleware ASGI de descarte de carga: no máximo `max_concurrency` requisições rodam ao mesmo tempo,
+    até `max_queue` aguardam por no máximo `queue_timeout` segundos e as demais recebem 503 na hora.
+
+    - Args:
+        - app:: ASGIApp: Aplicação ASGI
+        - max_concurrency:: int: Requisições processadas simultaneamente
+        - max_queue:: int: Requisições que podem aguardar por uma vaga
+        - queue_timeout:: float: Tempo máximo de espera na fila, em segundos
+    """
+    def __init__(self, app: ASGIApp, max_concurrency: int = 100, max_queue: int = 100, queue_timeout: float = 5.0):
+        self.app = app
+        self.max_concurrency = max_concurrency
+        self.max_queue = max_queue
+        self.queue_timeout = queue_timeout
+        self.waiting = 0
+        self._semaphore = Semaphore(max_concurrency)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        if self._semaphore.locked():
+            if self.waiting >= self.max_queue:
+                await send_rejection(send, 503, SERVICE_UNAVAILABLE_BODY, self.queue_timeout)
+                return
+            self.waiting += 1
+            try:
+                await wait_for(self._semaphore.acquire(), self.queue_timeout)
+            except TimeoutError:
+                await send_rejection(send, 503, SERVICE_UNAVAILABLE_BODY, self.queue_timeout)
+                return
+            finally:
+                self.waiting -= 1
+        else:
+            await self._semaphore.acquire()
+
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            self._semaphore.release()
@@ -0,0 +1,162 @@
+from datetime import date, datetime, time
+from decimal import Decimal
+from functools import wraps
+from inspect import isasyncgenfunction, iscoroutinefunction, isgeneratorfunction
+from json import dumps
+from typing import Any, Callable
+from uuid import UUID
+
+from fastapi import FastAPI
+from fastapi.dependencies.models import Dependant
+from fastapi.responses import JSONResponse, Response
+from fastapi.routing import APIRoute
+from fastapi.utils import is_body_allowed_for_status_code
+from pydantic import BaseModel
+
+try:
+    import orjson
+except ImportError:  # orjson vem no extra "fast", sem ele usamos o json da biblioteca padrão
+    orjson = None
+
+
+ORJSON_OPTIONS = 0 if orjson is None else orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+
+
+def json_default(obj: Any) -> Any:
+    """
+    Converte objetos que o serializador JSON não conhece nativamente
+
+    - Args:
+        - obj:: Any: Objeto a ser convertido
+
+    - Returns:
+        - Any: Valor serializável em JSON
+
+    - Raises:
+        - TypeError: Caso o tipo não seja suportado
+    """
+    if isinstance(obj, BaseModel):
+        return obj.model_dump(mode="json")
+    if isinstance(obj, (datetime, date, time)):
+        return obj.isoformat()
+    if isinstance(obj, Decimal):
+        return float(obj)
+    if isinstance(obj, UUID):
+        return str(obj)
+    if isinstance(obj, (set, frozenset)):
+        return list(obj)
+    if isinstance(obj, Exception):
+        # Aparece no "ctx" dos erros de validação do Pydantic
+        return str(obj)
+    # Escalares e arrays do NumPy e Series do pandas, sem importar as bibliotecas
+    tolist = getattr(obj, "tolist", None)
+    if tolist is not None:
+        return tolist()
+    raise TypeError(f"Objeto do tipo {type(obj).__name__} não é serializável em JSON")
+
+
+def json_dumps(content: Any) -> bytes:
+    """
+    Serializa um conteúdo em JSON compacto e UTF-8, o mesmo formato do JSONResponse
+
+    Usa o orjson quando está instalado e o json da biblioteca padrão caso contrário.
+
+    - Args:
+        - content:: Any: Conteúdo a ser serializado (dicts, listas, modelos Pydantic, datas, escalares NumPy...)
+
+    - Returns:
+        - bytes: JSON serializado
+    """
+    if orjson is not None:
+        return orjson.dumps(content, default=json_default, option=ORJSON_OPTIONS)
+    return dumps(
+        content,
+        ensure_ascii=False,
+        allow_nan=False,
+        indent=None,
+        separators=(",", ":"),
+        default=json_default,
+    ).encode("utf-8")
+
+
+class FastJSONResponse(JSONResponse):
+    """
+    JSONResponse que serializa com `json_dumps`.
+
+    Retornar a resposta diretamente da rota (ex: `return FastJSONResponse(data)`) também evita a passagem
+    pelo `jsonable_encoder` do FastAPI, o que faz diferença em payloads grandes de análises.
+    """
+    def render(self, content: Any) -> bytes:
+        return json_dumps(content)
+
+
+def _uses_response_param(dependant: Dependant) -> bool:
+    # Rotas que recebem o `Response` injetado (ou dependências que o recebem) ajustam headers e status
+    # que o FastAPI só aplica quando ele mesmo cria a resposta
+    if dependant.response_param_name is not None:
+        return True
+    return any(_uses_response_param(sub) for sub in dependant.dependencies)
+
+
+def _wrap_endpoint(call: Callable[..., Any], status_code: int) -> Callable[..., Any]:
+    # Mantém a rota síncrona ou assíncrona para o FastAPI continuar usando o threadpool nas síncronas
+    if iscoroutinefunction(call):
+        @wraps(call)
+        async def endpoint(**kwargs: Any) -> Any:
+            content = await call(**kwargs)
+            return content if isinstance(content, Response) else FastJSONResponse(content, status_code)
+    else:
+        @wraps(call)
+        def endpoint(**kwargs: Any) -> Any:
+            content = call(**kwargs)
+            return content if isinstance(content, Response) else FastJSONResponse(content, status_code)
+    endpoint.__fast_json__ = True
+    return endpoint
+
+
+class FastJSONRoute(APIRoute):
+    """
+    APIRoute que entrega o retorno da rota direto ao FastJSONResponse, sem passar pelo `jsonable_encoder`.
+
+    Sem isso o FastAPI converte o valor retornado com o `jsonable_encoder` antes do `render`, o que custa
+    caro em payloads grandes e falha com escalares do NumPy. Só vale para rotas sem `response_model`
+    (com ele a validação e o filtro do Pydantic continuam valendo), que respondem com FastJSONResponse,
+    não são geradores e não usam o `Response` injetado.
+    """
+    def __init__(self, path: str, endpoint: Callable[..., Any], **kwargs: Any):
+        super().__init__(path, endpoint, **kwargs)
+        response_class = getattr(self.response_class, "value", self.response_class)
+        status_code = self.status_code or 200
+        if (
+            getattr(endpoint, "__fast_json__", False)
+            or self.response_field is not None
+            or not issubclass(response_class, FastJSONResponse)
+            or not is_body_allowed_for_status_code(status_code)
+            or isgeneratorfunction(endpoint)
+            or isasyncgenfunction(endpoint)
+            or _uses_response_param(self.dependant)
+        ):
+            return
+        # O FastAPI recria as rotas de routers incluídos a partir do `endpoint`, então é ele que muda.
+        # O wrapper mantém assinatura e anotações, e o `response_model` inferido continua o mesmo.
+        super().__init__(path, _wrap_endpoint(endpoint, status_code), **kwargs)
+
+
+def fast_json_app(**kwargs: Any) -> FastAPI:
+    """
+    Cria uma aplicação FastAPI que usa o FastJSONResponse como classe de resposta padrão
+
+    As rotas declaradas na aplicação usam o FastJSONRoute. Routers incluídos depois mantêm a própria
+    classe de rota e de resposta, então crie-os com
+    `APIRouter(route_class=FastJSONRoute, default_response_class=FastJSONResponse)`.
+
+    - Args:
+        - kwargs:: Any: Argumentos repassados para o FastAPI
+
+    - Returns:
+        - FastAPI: Aplicação configurada
+    """
+    kwargs.setdefault("default_response_class", FastJSONResponse)
+    app = FastAPI(**kwargs)
+    app.router.route_class = FastJSONRoute
+    return app
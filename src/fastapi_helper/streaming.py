@@ -0,0 +1,126 @@
+from collections.abc import AsyncIterable, AsyncIterator, Iterable, Iterator
+from typing import Any
+
+from fastapi.responses import StreamingResponse
+
+from src.fastapi_helper.responses import json_dumps
+
+
+CHUNK_SIZE = 64 * 1024
+
+
+def series_rows(keys: Iterable[str], columns: Iterable[Iterable[Any]]) -> Iterator[dict[str, Any]]:
+    """
+    Transforma as listas paralelas retornadas pelas funções de análise (ex: `sales_per_day`) em linhas
+
+    - Args:
+        - keys:: Iterable[str]: Nome de cada coluna (ex: ["date", "total_value", "total_sales"])
+        - columns:: Iterable[Iterable[Any]]: Listas com os valores de cada coluna, na mesma ordem de `keys`
+
+    - Returns:
+        - Iterator[dict[str, Any]]: Um dicionário por linha, gerado sob demanda
+    """
+    keys = tuple(keys)
+    for values in zip(*columns):
+        yield dict(zip(keys, values))
+
+
+def _chunks(
+    items: Iterable[Any],
+    prefix: bytes,
+    separator: bytes,
+    suffix: bytes,
+    item_end: bytes,
+    chunk_size: int
+) -> Iterator[bytes]:
+    # Agrupa os itens em pedaços de ~chunk_size bytes para evitar um write por item
+    buffer = bytearray(prefix)
+    first = True
+    for item in items:
+        if not first:
+            buffer += separator
+        first = False
+        buffer += json_dumps(item)
+        buffer += item_end
+        if len(buffer) >= chunk_size:
+            yield bytes(buffer)
+            buffer.clear()
+    buffer += suffix
+    if buffer:
+        yield bytes(buffer)
+
+
+async def _async_chunks(
+    items: AsyncIterable[Any],
+    prefix: bytes,
+    separator: bytes,
+    suffix: bytes,
+    item_end: bytes,
+    chunk_size: int
+) -> AsyncIterator[bytes]:
+    buffer = bytearray(prefix)
+    first = True
+    async for item in items:
+        if not first:
+            buffer += separator
+        first = False
+        buffer += json_dumps(item)
+        buffer += item_end
+        if len(buffer) >= chunk_size:
+            yield bytes(buffer)
+            buffer.clear()
+    buffer += suffix
+    if buffer:
+        yield bytes(buffer)
+
+
+def _stream(items, prefix: bytes, separator: bytes, suffix: bytes, item_end: bytes, chunk_size: int):
+    if isinstance(items, AsyncIterable):
+        return _async_chunks(items, prefix, separator, suffix, item_end, chunk_size)
+    return _chunks(items, prefix, separator, suffix, item_end, chunk_size)
+
+
+def ndjson_response(
+    items: Iterable[Any] | AsyncIterable[Any],
+    chunk_size: int = CHUNK_SIZE,
+    status_code: int = 200
+) -> StreamingResponse:
+    """
+    Envia os itens como NDJSON (um JSON por linha), à medida que são produzidos
+
+    - Args:
+        - items:: Iterable | AsyncIterable: Itens serializáveis com `json_dumps`
+        - chunk_size:: int: Tamanho aproximado em bytes de cada pedaço enviado
+        - status_code:: int: Status HTTP da resposta
+
+    - Returns:
+        - StreamingResponse: Resposta com media type `application/x-ndjson`
+    """
+    return StreamingResponse(
+        _stream(items, b"", b"", b"", b"\n", chunk_size),
+        status_code=status_code,
+        media_type="application/x-ndjson",
+    )
+
+
+def json_array_response(
+    items: Iterable[Any] | AsyncIterable[Any],
+    chunk_size: int = CHUNK_SIZE,
+    status_code: int = 200
+) -> StreamingResponse:
+    """
+    Envia os itens como um único array JSON, em pedaços, sem montar o corpo inteiro em memória
+
+    - Args:
+        - items:: Iterable | AsyncIterable: Itens serializáveis com `json_dumps`
+        - chunk_size:: int: Tamanho aproximado em bytes de cada pedaço enviado
+        - status_code:: int: Status HTTP da resposta
+
+    - Returns:
+        - StreamingResponse: Resposta com media type `application/json`
+    """
+    return StreamingResponse(
+        _stream(items, b"[", b",", b"]", b"", chunk_size),
+        status_code=status_code,
+        media_type="application/json",
+    )
@@ -1,8 +1,29 @@
-from fastapi import FastAPI, WebSocket, WebSocketDisconnect
+from asyncio import CancelledError, Queue, QueueFull, Task, create_task, current_task, sleep
+from contextlib import asynccontextmanager, suppress
+from json import dumps, loads
+from time import monotonic
+
+from fastapi import FastAPI, WebSocket, WebSocketDisconnect, status
 from fastapi.responses import HTMLResponse
-from uvicorn import run
 
-app = FastAPI()
+from src.fastapi_helper.brokers import Broker
+
+
+FRAME_FORMATS = ("text", "json", "json-binary", "msgpack")
+HEARTBEAT_PING = "__ping__"
+HEARTBEAT_PONG = "__pong__"
+
+Message = str | dict
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    await manager.start()
+    yield
+    await manager.stop()
+
+
+app = FastAPI(lifespan=lifespan)
 
 html = """
 <!DOCTYPE html>
@@ -24,6 +45,10 @@ html = """
             document.querySelector("#ws-id").textContent = client_id;
             var ws = new WebSocket(`ws://localhost:8002/ws/${client_id}`);
             ws.onmessage = function(event) {
+                if (event.data === "__ping__") {
+                    ws.send("__pong__")
+                    return
+                }
                 var messages = document.getElementById('messages')
                 var message = document.createElement('li')
                 var content = document.createTextNode(event.data)
@@ -43,25 +68,395 @@ html = """
 
 
 class ConnectionManager:
-    def __init__(self):
-        self.active_connections: list[WebSocket] = []
+    """
+    Gerencia as conexões WebSocket ativas.
+
+    Cada conexão possui uma fila de envio limitada e uma task própria que a consome, assim o
+    `broadcast` apenas enfileira a mensagem e um cliente lento não atrasa os demais.
+
+    Com um `broker`, broadcasts, salas e mensagens por ID passam pelo broker e chegam aos clientes
+    conectados em qualquer worker.
+
+    - Args:
+        - max_queue_size:: int: Quantidade máxima de mensagens pendentes por conexão
+        - disconnect_on_overflow:: bool: Se True, desconecta o cliente cuja fila encheu, caso contrário apenas descarta a mensagem
+        - broker:: Broker | None: Broker usado para distribuir as mensagens entre processos
+        - batch_window:: float: Tempo em segundos que o envio aguarda para agrupar mensagens em um único frame (0 desativa). Requer um formato de lista, no "text" cada mensagem segue em seu próprio frame
+        - max_batch_size:: int: Quantidade máxima de mensagens por frame agrupado
+        - frame_format:: str: Formato dos frames enviados ("text", "json", "json-binary" ou "msgpack"). Nos três últimos o frame é uma lista com as mensagens, e os dicts seguem como objetos
+        - max_connections:: int | None: Limite de conexões simultâneas, as excedentes são recusadas antes do handshake
+        - heartbeat_interval:: float | None: Intervalo em segundos para enviar `HEARTBEAT_PING` às conexões ociosas
+        - idle_timeout:: float | None: Tempo em segundos sem receber mensagens após o qual a conexão é encerrada
+    """
+    def __init__(
+        self,
+        max_queue_size: int = 100,
+        disconnect_on_overflow: bool = True,
+        broker: Broker | None = None,
+        batch_window: float = 0.0,
+        max_batch_size: int = 100,
+        frame_format: str = "text",
+        max_connections: int | None = None,
+        heartbeat_interval: float | None = None,
+        idle_timeout: float | None = None
+    ):
+        if frame_format not in FRAME_FORMATS:
+            raise ValueError(f"Formato de frame inválido: {frame_format}. Use um de {FRAME_FORMATS}")
+        if frame_format == "text" and batch_window > 0:
+            # Juntar textos com um separador seria ambíguo para mensagens que o contêm (e esconderia o ping)
+            raise ValueError("O agrupamento de mensagens requer frame_format 'json', 'json-binary' ou 'msgpack'")
+        if frame_format == "msgpack":
+            try:
+                from msgpack import packb
+            except ImportError as e:
+                raise ImportError("O formato 'msgpack' requer o pacote 'msgpack' (pip install msgpack)") from e
+            self._packb = packb
+
+        self.max_queue_size = max_queue_size
+        self.disconnect_on_overflow = disconnect_on_overflow
+        self.batch_window = batch_window
+        self.max_batch_size = max_batch_size
+        self.frame_format = frame_format
+        self.max_connections = max_connections
+        self.heartbeat_interval = heartbeat_interval
+        self.idle_timeout = idle_timeout
+        self.metrics = WebSocketMetrics()
+        self.broker = broker
+        if broker is not None:
+            broker.add_handler(self._on_broker_message)
+        self.active_connections: dict[WebSocket, Queue[Message]] = {}
+        self._senders: dict[WebSocket, Task] = {}
+        self.clients: dict[int | str, WebSocket] = {}
+        self._client_ids: dict[WebSocket, int | str] = {}
+        self.rooms: dict[str, set[WebSocket]] = {}
+        self._memberships: dict[WebSocket, set[str]] = {}
+        self._last_seen: dict[WebSocket, float] = {}
+        self._monitor_task: Task | None = None
+        # Referências às tasks de fechamento, para não serem coletadas antes de enviar o close frame
+        self._close_tasks: set[Task] = set()
+        # Handshakes em andamento já ocupam uma vaga do `max_connections`
+        self._handshakes = 0
+
+    async def start(self):
+        if self.broker is not None:
+            await self.broker.start()
+        if self.heartbeat_interval or self.idle_timeout:
+            self._monitor_task = create_task(self._monitor())
+
+    async def stop(self):
+        if self._monitor_task is not None:
+            self._monitor_task.cancel()
+            self._monitor_task = None
+        if self.broker is not None:
+            await self.broker.close()
+
+    async def connect(self, websocket: WebSocket, client_id: int | str | None = None) -> bool:
+        """
+        Aceita uma conexão, ou a recusa caso o limite de conexões tenha sido atingido
+
+        - Args:
+            - websocket:: WebSocket: Conexão a ser aceita
+            - client_id:: int | str | None: ID do cliente, usado para enviar mensagens pessoais
 
-    async def connect(self, websocket: WebSocket):
-        await websocket.accept()
-        self.active_connections.append(websocket)
+        - Return:
+            - bool: True se a conexão foi aceita
+        """
+        if self.max_connections is not None and len(self.active_connections) + self._handshakes >= self.max_connections:
+            self.metrics.rejected_connections += 1
+            await websocket.close(code=status.WS_1013_TRY_AGAIN_LATER)
+            return False
+
+        # A vaga é reservada antes do `accept` para que handshakes simultâneos não passem do limite
+        self._handshakes += 1
+        try:
+            await websocket.accept()
+        finally:
+            self._handshakes -= 1
+        queue: Queue[Message] = Queue(maxsize=self.max_queue_size)
+        self.active_connections[websocket] = queue
+        self._last_seen[websocket] = monotonic()
+        self._senders[websocket] = create_task(self._sender(websocket, queue))
+        if client_id is not None:
+            self.clients[client_id] = websocket
+            self._client_ids[websocket] = client_id
+        return True
+
+    def touch(self, websocket: WebSocket):
+        """
+        Registra atividade do cliente, deve ser chamado a cada mensagem recebida
+
+        - Args:
+            - websocket:: WebSocket: Conexão que enviou a mensagem
+        """
+        if websocket in self._last_seen:
+            self._last_seen[websocket] = monotonic()
 
     def disconnect(self, websocket: WebSocket):
-        self.active_connections.remove(websocket)
+        self.active_connections.pop(websocket, None)
+        self._last_seen.pop(websocket, None)
+        task = self._senders.pop(websocket, None)
+        if task is not None and task is not current_task():
+            task.cancel()
+        client_id = self._client_ids.pop(websocket, None)
+        if client_id is not None and self.clients.get(client_id) is websocket:
+            del self.clients[client_id]
+        for room in self._memberships.pop(websocket, ()):
+            self._discard_member(room, websocket)
+
+    def subscribe(self, websocket: WebSocket, room: str):
+        """
+        Inscreve uma conexão em uma sala/tópico
+
+        - Args:
+            - websocket:: WebSocket: Conexão que receberá as mensagens da sala
+            - room:: str: Nome da sala
+        """
+        self.rooms.setdefault(room, set()).add(websocket)
+        self._memberships.setdefault(websocket, set()).add(room)
+
+    def unsubscribe(self, websocket: WebSocket, room: str):
+        """
+        Remove a inscrição de uma conexão em uma sala/tópico
+
+        - Args:
+            - websocket:: WebSocket: Conexão inscrita
+            - room:: str: Nome da sala
+        """
+        memberships = self._memberships.get(websocket)
+        if memberships is not None:
+            memberships.discard(room)
+            if not memberships:
+                del self._memberships[websocket]
+        self._discard_member(room, websocket)
+
+    def _discard_member(self, room: str, websocket: WebSocket):
+        members = self.rooms.get(room)
+        if members is None:
+            return
+        members.discard(websocket)
+        if not members:
+            del self.rooms[room]
+
+    async def _sender(self, websocket: WebSocket, queue: Queue[Message]):
+        try:
+            while True:
+                messages = [await queue.get()]
+                if self.batch_window > 0:
+                    await sleep(self.batch_window)
+                    while len(messages) < self.max_batch_size and not queue.empty():
+                        messages.append(queue.get_nowait())
+                await self._send_frame(websocket, messages)
+        except CancelledError:
+            raise
+        except Exception:
+            # O cliente caiu durante o envio
+            self.disconnect(websocket)
+
+    async def _send_frame(self, websocket: WebSocket, messages: list[Message]):
+        if self.frame_format == "text":
+            # Sem agrupamento, cada frame de texto leva uma única mensagem
+            frame = messages[0]
+            await websocket.send_text(frame)
+            size = len(frame) if frame.isascii() else len(frame.encode())
+        elif self.frame_format == "json":
+            frame = dumps(messages, separators=(",", ":"))
+            await websocket.send_text(frame)
+            size = len(frame)
+        elif self.frame_format == "json-binary":
+            frame = dumps(messages, separators=(",", ":")).encode()
+            await websocket.send_bytes(frame)
+            size = len(frame)
+        else:
+            frame = self._packb(messages)
+            await websocket.send_bytes(frame)
+            size = len(frame)
+        self.metrics.record(len(messages), size)
+
+    def _enqueue(self, websocket: WebSocket, queue: Queue[Message], message: Message) -> bool:
+        try:
+            queue.put_nowait(message)
+            return True
+        except QueueFull:
+            self.metrics.dropped_messages += 1
+            if self.disconnect_on_overflow:
+                self.disconnect(websocket)
+                self._schedule_close(websocket, status.WS_1008_POLICY_VIOLATION)
+            return False
+
+    def _schedule_close(self, websocket: WebSocket, code: int):
+        task = create_task(self._close(websocket, code))
+        self._close_tasks.add(task)
+        task.add_done_callback(self._close_tasks.discard)
+
+    async def _close(self, websocket: WebSocket, code: int):
+        with suppress(Exception):
+            await websocket.close(code=code)
+
+    async def _monitor(self):
+        interval = min(value for value in (self.heartbeat_interval, self.idle_timeout) if value)
+        while True:
+            await sleep(interval)
+            now = monotonic()
+            for websocket, last_seen in list(self._last_seen.items()):
+                idle = now - last_seen
+                if self.idle_timeout and idle > self.idle_timeout:
+                    self.metrics.evicted_connections += 1
+                    self.disconnect(websocket)
+                    self._schedule_close(websocket, status.WS_1001_GOING_AWAY)
+                elif self.heartbeat_interval and idle >= self.heartbeat_interval:
+                    self._send_local(websocket, HEARTBEAT_PING)
+
+    def stats(self) -> dict[str, float]:
+        """
+        Retorna o estado atual do gerenciador
+
+        - Return:
+            - dict[str, float]: Conexões ativas, salas, profundidade das filas de envio e os contadores de `metrics`
+        """
+        depths = [queue.qsize() for queue in self.active_connections.values()]
+        return {
+            "active_connections": len(self.active_connections),
+            "rooms": len(self.rooms),
+            "queued_messages": sum(depths),
+            "max_queue_depth": max(depths, default=0),
+            **self.metrics.snapshot(),
+        }
 
-    async def send_personal_message(self, message: str, websocket: WebSocket):
-        await websocket.send_text(message)
+    async def send_personal_message(self, message: str | dict, websocket: WebSocket | int | str):
+        """
+        Envia uma mensagem para um único cliente
 
-    async def broadcast(self, message: str):
-        for connection in self.active_connections:
-            await connection.send_text(message)
+        Se o cliente for informado pelo ID e não estiver conectado neste processo, a mensagem é
+        repassada pelo broker para os demais processos.
 
+        - Args:
+            - message:: str | dict: Mensagem a ser enviada
+            - websocket:: WebSocket | int | str: Conexão do cliente ou o seu ID
+        """
+        message = self._prepare(message)
+        if not isinstance(websocket, (int, str)):
+            self._send_local(websocket, message)
+        elif websocket in self.clients or self.broker is None:
+            self._send_local(self.clients.get(websocket), message)
+        else:
+            await self._publish_envelope("client", websocket, message)
 
-manager = ConnectionManager()
+    async def broadcast(self, message: str | dict):
+        message = self._prepare(message)
+        if self.broker is None:
+            self._broadcast_local(message)
+        else:
+            await self._publish_envelope("broadcast", None, message)
+
+    async def publish(self, room: str, message: str | dict):
+        """
+        Envia uma mensagem apenas para os inscritos em uma sala/tópico
+
+        - Args:
+            - room:: str: Nome da sala
+            - message:: str | dict: Mensagem a ser enviada
+        """
+        message = self._prepare(message)
+        if self.broker is None:
+            self._publish_local(room, message)
+        else:
+            await self._publish_envelope("room", room, message)
+
+    def _prepare(self, message: Message) -> Message:
+        # No formato "text" a mensagem é serializada uma única vez para todos os clientes.
+        # Nos demais ela segue como objeto e é codificada uma única vez, junto com o frame.
+        if self.frame_format == "text":
+            return serialize_message(message)
+        return message
+
+    def _send_local(self, websocket: WebSocket | None, message: Message):
+        queue = self.active_connections.get(websocket)
+        if queue is not None:
+            self._enqueue(websocket, queue, message)
+
+    def _broadcast_local(self, message: Message):
+        for websocket, queue in list(self.active_connections.items()):
+            self._enqueue(websocket, queue, message)
+
+    def _publish_local(self, room: str, message: Message):
+        members = self.rooms.get(room)
+        if not members:
+            return
+        for websocket in list(members):
+            self._send_local(websocket, message)
+
+    async def _publish_envelope(self, target: str, key: int | str | None, message: Message):
+        await self.broker.publish(dumps({"target": target, "key": key, "message": message}))
+
+    async def _on_broker_message(self, data: str):
+        envelope = loads(data)
+        target, key, message = envelope["target"], envelope["key"], envelope["message"]
+        if target == "broadcast":
+            self._broadcast_local(message)
+        elif target == "room":
+            self._publish_local(key, message)
+        elif target == "client":
+            self._send_local(self.clients.get(key), message)
+
+
+class WebSocketMetrics:
+    """
+    Contadores de tráfego de saída do ConnectionManager, usados para ajustar o agrupamento de mensagens.
+    """
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        self.started_at = monotonic()
+        self.messages_sent = 0
+        self.frames_sent = 0
+        self.bytes_sent = 0
+        self.dropped_messages = 0
+        self.rejected_connections = 0
+        self.evicted_connections = 0
+
+    def record(self, messages: int, size: int):
+        self.messages_sent += messages
+        self.frames_sent += 1
+        self.bytes_sent += size
+
+    def snapshot(self) -> dict[str, float]:
+        """
+        Retorna os contadores e as taxas desde o último reset
+
+        - Return:
+            - dict[str, float]: Mensagens, frames e bytes enviados, suas taxas por segundo e os descartes
+        """
+        elapsed = max(monotonic() - self.started_at, 1e-9)
+        return {
+            "messages_sent": self.messages_sent,
+            "frames_sent": self.frames_sent,
+            "bytes_sent": self.bytes_sent,
+            "dropped_messages": self.dropped_messages,
+            "rejected_connections": self.rejected_connections,
+            "evicted_connections": self.evicted_connections,
+            "messages_per_second": self.messages_sent / elapsed,
+            "frames_per_second": self.frames_sent / elapsed,
+            "bytes_per_second": self.bytes_sent / elapsed,
+        }
+
+
+def serialize_message(message: str | dict) -> str:
+    """
+    Converte uma mensagem para o formato texto enviado pelo WebSocket
+
+    - Args:
+        - message:: str | dict: Mensagem em texto ou um objeto serializável em JSON
+
+    - Return:
+        - str: Mensagem pronta para envio
+    """
+    if isinstance(message, str):
+        return message
+    return dumps(message, separators=(",", ":"))
+
+
+manager = ConnectionManager(max_connections=10_000, heartbeat_interval=20, idle_timeout=60)
 
 
 @app.get("/")
@@ -69,22 +464,52 @@ async def get():
     return HTMLResponse(html)
 
 
+@app.get("/ws-metrics")
+async def ws_metrics():
+    return manager.stats()
+
+
 @app.websocket("/ws/{client_id}")
 async def websocket_endpoint(websocket: WebSocket, client_id: int):
-    await manager.connect(websocket)
+    if not await manager.connect(websocket, client_id):
+        return
     try:
         while True:
             data = await websocket.receive_text()
+            manager.touch(websocket)
+            if data == HEARTBEAT_PONG:
+                continue
             await manager.send_personal_message(f"You wrote: {data}", websocket)
             await manager.broadcast(f"Client #{client_id} says: {data}")
     except WebSocketDisconnect:
         manager.disconnect(websocket)
         await manager.broadcast(f"Client #{client_id} left the chat")
-        
-        
-run(
-    app,
-    host="localhost",
-    port=8002,
-    log_level="info"
-)
\ No newline at end of file
+
+
+@app.websocket("/ws/{client_id}/{room}")
+async def room_websocket_endpoint(websocket: WebSocket, client_id: int, room: str):
+    if not await manager.connect(websocket, client_id):
+        return
+    manager.subscribe(websocket, room)
+    try:
+        while True:
+            data = await websocket.receive_text()
+            manager.touch(websocket)
+            if data == HEARTBEAT_PONG:
+                continue
+            await manager.publish(room, f"Client #{client_id} says: {data}")
+    except WebSocketDisconnect:
+        manager.disconnect(websocket)
+        await manager.publish(room, f"Client #{client_id} left the room")
+
+
+if __name__ == "__main__":
+    from uvicorn import run
+
+    run(
+        app,
+        host="localhost",
+        port=8002,
+        log_level="info",
+        ws_per_message_deflate=True
+    )
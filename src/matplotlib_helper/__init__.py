@@ -0,0 +1,27 @@
+from .._lazy import make_lazy
+
+
+# Nome exportado -> submódulo que o define, importado apenas no primeiro acesso (PEP 562)
+_EXPORTS = {
+    "custom_bar_chart": ".chart",
+    "custom_donut_chart": ".chart",
+    "custom_line_chart": ".chart",
+    "custom_pie_chart": ".chart",
+    "plot_fig": ".chart",
+    "render_chart": ".render",
+    "render_charts": ".render",
+    "render_figure": ".render",
+    "ChartCache": ".cache",
+    "chart_key": ".cache",
+    "decimate_indices": ".decimate",
+    "decimate_series": ".decimate",
+    "LiveBarChart": ".live",
+    "LiveLineChart": ".live",
+    "LivePieChart": ".live",
+    "color_lut": ".palette",
+    "generate_color_palette": ".palette",
+    "lut_colors": ".palette",
+}
+
+__all__ = list(_EXPORTS)
+__getattr__, __dir__ = make_lazy(__name__, _EXPORTS)
@@ -0,0 +1,263 @@
+from collections import OrderedDict
+from datetime import date, datetime
+from functools import cache
+from hashlib import blake2b
+from importlib.metadata import version
+from json import dumps
+from os import getpid, listdir, makedirs, remove, replace, stat, utime
+from os.path import join
+from threading import Lock
+from time import monotonic, time
+from uuid import uuid4
+
+
+CACHE_VERSION = 1
+
+
+@cache
+def _matplotlib_version() -> str:
+    # Lido dos metadados para não importar o matplotlib quando o gráfico já está na cache
+    return version("matplotlib")
+
+
+def _canonical(value):
+    # Converte os argumentos dos gráficos em valores serializáveis de forma estável.
+    # Arrays e escalares do NumPy são reconhecidos pelo `dtype`, sem importar o NumPy.
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if hasattr(value, "dtype") and hasattr(value, "tobytes"):
+        if value.ndim == 0:
+            return value.item()
+        if value.dtype.kind == "O":
+            # Os bytes de um array de objetos são ponteiros, então os valores entram na chave
+            return {"dtype": "object", "shape": value.shape, "values": value.tolist()}
+        return {"dtype": str(value.dtype), "shape": value.shape, "hash": blake2b(value.tobytes()).hexdigest()}
+    if hasattr(value, "to_numpy"):
+        # Index, Series e DataFrames do pandas: o repr é truncado, então a chave usa os valores
+        index, columns = getattr(value, "index", None), getattr(value, "columns", None)
+        return {
+            "type": type(value).__name__,
+            "columns": None if columns is None else _canonical(columns.to_numpy()),
+            "index": None if index is None else _canonical(index.to_numpy()),
+            "values": _canonical(value.to_numpy()),
+        }
+    if isinstance(value, (set, frozenset)):
+        return sorted(value, key=repr)
+    raise TypeError(f"Objeto do tipo {type(value).__name__} não pode ser usado na chave da cache")
+
+
+def chart_key(kind: str, format: str = "png", dpi: int = 100, **kwargs) -> str:
+    """
+    Gera a chave de cache de um gráfico a partir do tipo, formato e de todos os argumentos de dados e estilo
+
+    - Args:
+        - kind:: str: Tipo do gráfico ("bar", "pie", "donut" ou "line")
+        - format:: str: "png" ou "svg"
+        - dpi:: int: Resolução da imagem
+        - kwargs:: Argumentos da função `custom_*_chart` correspondente
+
+    - Returns:
+        - str: Hash hexadecimal dos argumentos
+
+    - Raises:
+        - TypeError: Caso algum argumento não tenha uma representação estável
+    """
+    payload = dumps(
+        [CACHE_VERSION, _matplotlib_version(), kind, format, dpi, kwargs],
+        sort_keys=True,
+        default=_canonical,
+    )
+    return blake2b(payload.encode(), digest_size=20).hexdigest()
+
+
+class ChartCache:
+    """
+    Cache de gráficos renderizados, em memória e opcionalmente em disco, com LRU e TTL
+
+    A memória guarda os gráficos mais usados até `max_bytes`. O disco, quando configurado, é compartilhado
+    entre processos e sobrevive a reinícios, limitado a `max_disk_bytes`. Gráficos mais antigos que `ttl`
+    segundos são renderizados de novo.
+
+    - Args:
+        - ttl:: float: Tempo de vida de um gráfico em segundos
+        - max_bytes:: int: Tamanho máximo da cache em memória
+        - directory:: str | None: Pasta da cache em disco, None para usar apenas memória
+        - max_disk_bytes:: int: Tamanho máximo da cache em disco
+    """
+    def __init__(
+        self,
+        ttl: float = 300.0,
+        max_bytes: int = 64 * 1024 * 1024,
+        directory: str | None = None,
+        max_disk_bytes: int = 512 * 1024 * 1024
+    ):
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self.directory = directory
+        self.max_disk_bytes = max_disk_bytes
+        self.current_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self._memory: OrderedDict[str, tuple[float, bytes]] = OrderedDict()
+        self._lock = Lock()
+        self._disk_bytes = 0
+        if directory:
+            makedirs(directory, exist_ok=True)
+            self._disk_bytes = sum(stat(join(directory, name)).st_size for name in listdir(directory))
+
+    def get(self, key: str) -> bytes | None:
+        """
+        Busca um gráfico na memória e depois no disco
+
+        - Args:
+            - key:: str: Chave gerada por `chart_key`
+
+        - Returns:
+            - bytes | None: Gráfico renderizado, None caso não exista ou tenha expirado
+        """
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None:
+                expires_at, data = entry
+                if expires_at > monotonic():
+                    self._memory.move_to_end(key)
+                    self.hits += 1
+                    return data
+                self._pop_memory(key)
+
+        entry = self._read_disk(key)
+        with self._lock:
+            if entry is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            data, ttl = entry
+            # Na memória o gráfico vive apenas o que resta do seu tempo de vida no disco
+            self._store_memory(key, data, ttl)
+        return data
+
+    def set(self, key: str, data: bytes):
+        """
+        Guarda um gráfico renderizado
+
+        - Args:
+            - key:: str: Chave gerada por `chart_key`
+            - data:: bytes: Gráfico renderizado
+        """
+        with self._lock:
+            self._store_memory(key, data)
+        self._write_disk(key, data)
+
+    def render(self, kind: str, format: str = "png", dpi: int = 100, **kwargs) -> bytes:
+        """
+        Retorna o gráfico da cache ou o renderiza com `render_chart` e o guarda
+
+        - Args:
+            - kind:: str: Tipo do gráfico ("bar", "pie", "donut" ou "line")
+            - format:: str: "png" ou "svg"
+            - dpi:: int: Resolução da imagem
+            - kwargs:: Argumentos da função `custom_*_chart` correspondente
+
+        - Returns:
+            - bytes: Gráfico renderizado
+        """
+        key = chart_key(kind, format, dpi, **kwargs)
+        data = self.get(key)
+        if data is None:
+            # Só importa o matplotlib quando precisa renderizar
+            from .render import render_chart
+
+            data = render_chart(kind, format, dpi, **kwargs)
+            self.set(key, data)
+        return data
+
+    def clear(self):
+        with self._lock:
+            self._memory.clear()
+            self.current_bytes = 0
+        if self.directory:
+            for name in listdir(self.directory):
+                self._remove_file(join(self.directory, name))
+
+    def _store_memory(self, key: str, data: bytes, ttl: float | None = None):
+        if len(data) > self.max_bytes:
+            return
+        self._pop_memory(key)
+        self._memory[key] = (monotonic() + (self.ttl if ttl is None else ttl), data)
+        self.current_bytes += len(data)
+        while self.current_bytes > self.max_bytes:
+            _, (_, evicted) = self._memory.popitem(last=False)
+            self.current_bytes -= len(evicted)
+
+    def _pop_memory(self, key: str):
+        entry = self._memory.pop(key, None)
+        if entry is not None:
+            self.current_bytes -= len(entry[1])
+
+    def _read_disk(self, key: str) -> tuple[bytes, float] | None:
+        # Retorna o gráfico e o tempo de vida restante, contado a partir da escrita no disco
+        if not self.directory:
+            return None
+        path = join(self.directory, key)
+        try:
+            ttl = stat(path).st_mtime + self.ttl - time()
+            if ttl <= 0:
+                self._remove_file(path)
+                return None
+            with open(path, "rb") as file:
+                data = file.read()
+            # O último acesso fica no atime, usado para descartar os gráficos menos usados
+            utime(path, (time(), stat(path).st_mtime))
+        except FileNotFoundError:
+            # Descartado por outro processo durante a leitura
+            return None
+        return data, ttl
+
+    def _write_disk(self, key: str, data: bytes):
+        if not self.directory or len(data) > self.max_disk_bytes:
+            return
+        path = join(self.directory, key)
+        # Nome único entre processos e threads que escrevem o mesmo gráfico
+        tmp_path = f"{path}.{getpid()}.{uuid4().hex}.tmp"
+        with open(tmp_path, "wb") as file:
+            file.write(data)
+        try:
+            previous = stat(path).st_size
+        except FileNotFoundError:
+            previous = 0
+        replace(tmp_path, path)
+        with self._lock:
+            self._disk_bytes += len(data) - previous
+            over_limit = self._disk_bytes > self.max_disk_bytes
+        if over_limit:
+            self._evict_disk()
+
+    def _evict_disk(self):
+        entries = []
+        for name in listdir(self.directory):
+            if name.endswith(".tmp"):
+                # Gráfico ainda sendo escrito por outro processo
+                continue
+            try:
+                info = stat(join(self.directory, name))
+            except FileNotFoundError:
+                continue
+            entries.append((info.st_atime, info.st_size, name))
+        entries.sort()
+        total = sum(size for _, size, _ in entries)
+        for _, size, name in entries:
+            if total <= self.max_disk_bytes:
+                break
+            self._remove_file(join(self.directory, name))
+            total -= size
+        with self._lock:
+            self._disk_bytes = total
+
+    def _remove_file(self, path: str):
+        try:
+            size = stat(path).st_size
+            remove(path)
+        except FileNotFoundError:
+            return
+        with self._lock:
+            self._disk_bytes -= size
@@ -1,6 +1,19 @@
 from datetime import datetime
+from matplotlib import rcParams
 from matplotlib.figure import Figure
-import matplotlib.pyplot as plt
+
+from .decimate import decimate_series
+
+
+def _prepare_figure(fig: Figure | None, figsize: tuple[float, float] | None = None) -> Figure:
+    # Cria uma Figure fora do pyplot ou limpa uma já existente para ser reaproveitada
+    figsize = figsize or tuple(rcParams["figure.figsize"])
+    if fig is None:
+        return Figure(figsize=figsize)
+    fig.clear()
+    fig.set_size_inches(figsize)
+    return fig
+
 
 
 def custom_bar_chart(
@@ -9,8 +22,9 @@ def custom_bar_chart(
     title: str,
     legend: list[str], 
     y_label: str, 
-    color_bar: list
-) -> plt.Figure:
+    color_bar: list,
+    fig: Figure | None = None
+) -> Figure:
     """
     Cria um gráfico de barras usando dados processados
     
@@ -21,12 +35,14 @@ def custom_bar_chart(
         - legend:: str: Legenda do Gráfico
         - y_label:: str: Legenda do eixo y do gráfico
         - color_bar:: list[Strings]: Lista contendo a cor de cada item na - - legenda (ex: ["red", "blue", "orange"])
+        - fig:: Figure | None: Figura reaproveitada, limpa antes de desenhar (padrão: uma nova Figure, fora do pyplot)
         
     - Return:
         - fig: Figure: Gráfico de barras criado com os dados passados
     """
     
-    fig, ax = plt.subplots()
+    fig = _prepare_figure(fig)
+    ax = fig.subplots()
     
     
     bars = ax.bar(items_name, items_quantity, label=items_name,color=color_bar)
@@ -59,8 +75,9 @@ def custom_pie_chart(
     items_quantity: list, 
     title: str,
     legend: list[str], 
-    color_pie: list
-) -> plt.Figure:
+    color_pie: list,
+    fig: Figure | None = None
+) -> Figure:
     """
     Cria um gráfico de pizza usando dados processados
     
@@ -70,6 +87,7 @@ def custom_pie_chart(
         - title:: str: Título do Gráfico 
         - legend:: list[str]: Legenda do Gráfico
         - color_pie:: list[Strings]: Lista contendo a cor de cada item na - legenda (ex: ["red", "blue", "orange"])
+        - fig:: Figure | None: Figura reaproveitada, limpa antes de desenhar (padrão: uma nova Figure, fora do pyplot)
         
     - Return:
         - fig: Figure: Gráfico de pizza criado com os dados passados
@@ -78,7 +96,8 @@ def custom_pie_chart(
         if items_quantity[idx] < 0:
             del items_name[idx]
             del items_quantity[idx]
-    fig, ax = plt.subplots()
+    fig = _prepare_figure(fig)
+    ax = fig.subplots()
     
     wedges, texts, autotexts = ax.pie(
         items_quantity, 
@@ -104,8 +123,9 @@ def custom_donut_chart(
     items_quantity: list, 
     title: str,
     legend: list[str], 
-    color_donut: list
-) -> plt.Figure:
+    color_donut: list,
+    fig: Figure | None = None
+) -> Figure:
     """
     Cria um gráfico de rosca usando dados processados
     
@@ -115,6 +135,7 @@ def custom_donut_chart(
         - title:: str: Título do Gráfico 
         - legend:: list[str]: Legenda do Gráfico
         - color_donut:: list[str]: Lista contendo a cor de cada item na - legenda (ex: ["red", "blue", "orange", #ffff])
+        - fig:: Figure | None: Figura reaproveitada, limpa antes de desenhar (padrão: uma nova Figure, fora do pyplot)
         
     - Return:
         - fig: Figure: Gráfico de rosca criado com os dados passados
@@ -124,7 +145,8 @@ def custom_donut_chart(
             del items_name[idx]
             del items_quantity[idx]
 
-    fig, ax = plt.subplots()
+    fig = _prepare_figure(fig)
+    ax = fig.subplots()
     
     wedges, texts, autotexts = ax.pie(
         items_quantity, 
@@ -154,8 +176,12 @@ def custom_line_chart(
     y_label: str = "Número de Vendas",
     color_line: str = 'b',
     marker: str = 'o',
-    linestyle: str = '-'
-) -> plt.Figure:
+    linestyle: str = '-',
+    max_points: int | None = 2000,
+    decimation: str = "lttb",
+    marker_threshold: int = 500,
+    fig: Figure | None = None
+) -> Figure:
     """
     Cria um gráfico de linha usando dados processados
     
@@ -168,24 +194,33 @@ def custom_line_chart(
         - color_line:: str: Cor da linha do gráfico (ex: 'b' para azul)
         - marker:: str: Simbolo usado para representar os pontos no gráfico (ex: 'o' para círculo)
         - linestyle:: str: Estilo da linha do gráfico (ex: '-' para uma linha contínua)
+        - max_points:: int | None: Séries maiores são reduzidas para essa quantidade de pontos antes de desenhar, None desenha todos
+        - decimation:: str: Método de redução: "lttb" preserva a forma da série, "minmax" preserva picos e vales
+        - marker_threshold:: int: Acima dessa quantidade de pontos desenhados, os marcadores são omitidos
+        - fig:: Figure | None: Figura reaproveitada, limpa antes de desenhar (padrão: uma nova Figure, fora do pyplot)
         
     - Return:
         - fig: Figure: Gráfico de linha criado com os dados passados
     """
     
-    fig = plt.figure(figsize=(10, 5))
-    plt.plot(date, sales, marker=marker, linestyle=linestyle, color=color_line)
+    fig = _prepare_figure(fig, (10, 5))
+    ax = fig.subplots()
+    # O gráfico tem ~1000 pixels de largura, pontos além disso não mudam a imagem e só custam tempo
+    date, sales = decimate_series(date, sales, max_points, decimation)
+    if len(sales) > marker_threshold:
+        marker = None
+    ax.plot(date, sales, marker=marker, linestyle=linestyle, color=color_line)
 
     # Adicionar título e rótulos aos eixos
     if len(title) > 0:
-        plt.title(title)
+        ax.set_title(title)
     if len(x_label) > 0:
-        plt.xlabel(x_label)
+        ax.set_xlabel(x_label)
     if len(y_label) > 0:
-        plt.ylabel(y_label)
+        ax.set_ylabel(y_label)
 
     # Mostrar o gráfico
-    plt.grid(True)
+    ax.grid(True)
     #plt.show()
     
     return fig
@@ -200,5 +235,11 @@ def plot_fig(fig:Figure):
     - Returns:
         - None
     """
-    plt.figure(fig)
+    # O pyplot só é importado aqui, para os gráficos poderem ser gerados em servidores sem interface
+    import matplotlib.pyplot as plt
+
+    # As figuras não são criadas pelo pyplot, então ganham um gerenciador de janela emprestado
+    manager = plt.figure().canvas.manager
+    manager.canvas.figure = fig
+    fig.set_canvas(manager.canvas)
     plt.show()
\ No newline at end of file
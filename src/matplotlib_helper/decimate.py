@@ -0,0 +1,129 @@
+from datetime import date, datetime
+
+import numpy as np
+
+
+DECIMATIONS = ("lttb", "minmax")
+
+
+def as_numeric(values) -> np.ndarray:
+    """
+    Converte o eixo x (números, datetimes ou datetime64) em float64 para os cálculos da redução
+
+    - Args:
+        - values:: Sequência de valores do eixo x
+
+    - Returns:
+        - np.ndarray: Valores numéricos, na mesma ordem
+    """
+    if len(values) and isinstance(values[0], (datetime, date)):
+        # Converter objetos datetime um a um é bem mais rápido que o `astype` do NumPy para datetime64
+        to_number = datetime.timestamp if isinstance(values[0], datetime) else date.toordinal
+        return np.fromiter(map(to_number, values), dtype=np.float64, count=len(values))
+    array = np.asarray(values)
+    if np.issubdtype(array.dtype, np.datetime64):
+        array = array.astype("datetime64[us]").astype(np.int64)
+    return array.astype(np.float64)
+
+
+def lttb_indices(x: np.ndarray, y: np.ndarray, n_out: int) -> np.ndarray:
+    """
+    Seleciona `n_out` pontos que preservam a forma da série (Largest-Triangle-Three-Buckets)
+
+    O primeiro e o último ponto são mantidos. Os demais são divididos em `n_out - 2` grupos, e de cada grupo
+    fica o ponto que forma o maior triângulo com o ponto escolhido no grupo anterior e a média do próximo.
+
+    - Args:
+        - x:: np.ndarray: Eixo x numérico e crescente
+        - y:: np.ndarray: Valores da série
+        - n_out:: int: Quantidade de pontos mantidos
+
+    - Returns:
+        - np.ndarray: Índices dos pontos mantidos, em ordem crescente
+    """
+    n = len(x)
+    if n_out >= n or n_out < 3:
+        return np.arange(n)
+
+    edges = np.linspace(1, n - 1, n_out - 1).astype(np.intp)
+    indices = np.empty(n_out, dtype=np.intp)
+    indices[0], indices[-1] = 0, n - 1
+    selected = 0
+    for bucket in range(n_out - 2):
+        start, end = edges[bucket], edges[bucket + 1]
+        if bucket + 2 < len(edges):
+            next_x = x[end:edges[bucket + 2]].mean()
+            next_y = y[end:edges[bucket + 2]].mean()
+        else:
+            next_x, next_y = x[-1], y[-1]
+        x_a, y_a = x[selected], y[selected]
+        area = np.abs((x_a - next_x) * (y[start:end] - y_a) - (x_a - x[start:end]) * (next_y - y_a))
+        selected = start + int(np.argmax(area))
+        indices[bucket + 1] = selected
+    return indices
+
+
+def min_max_indices(y: np.ndarray, n_buckets: int) -> np.ndarray:
+    """
+    Mantém o menor e o maior valor de cada grupo de pontos, preservando picos e vales
+
+    - Args:
+        - y:: np.ndarray: Valores da série
+        - n_buckets:: int: Quantidade de grupos, normalmente a largura do gráfico em pixels
+
+    - Returns:
+        - np.ndarray: Índices dos pontos mantidos (até 2 por grupo, mais o primeiro e o último), em ordem crescente
+    """
+    n = len(y)
+    if 2 * n_buckets >= n:
+        return np.arange(n)
+
+    buckets = np.arange(n) * n_buckets // n
+    order = np.lexsort((y, buckets))
+    ends = np.flatnonzero(np.diff(buckets)) + 1
+    starts = np.concatenate(([0], ends))
+    ends = np.concatenate((ends, [n]))
+    return np.unique(np.concatenate((order[starts], order[ends - 1], [0, n - 1])))
+
+
+def decimate_indices(x, y, max_points: int, method: str = "lttb") -> np.ndarray:
+    """
+    Reduz uma série para no máximo `max_points` pontos
+
+    - Args:
+        - x:: Valores do eixo x
+        - y:: Valores da série
+        - max_points:: int: Quantidade máxima de pontos
+        - method:: str: "lttb" ou "minmax"
+
+    - Returns:
+        - np.ndarray: Índices dos pontos mantidos
+
+    - Raises:
+        - ValueError: Caso o método não exista
+    """
+    if method not in DECIMATIONS:
+        raise ValueError(f"Método de redução inválido: {method}. Use um de {DECIMATIONS}")
+    y = np.asarray(y, dtype=np.float64)
+    if method == "minmax":
+        return min_max_indices(y, max(1, (max_points - 2) // 2))
+    return lttb_indices(as_numeric(x), y, max_points)
+
+
+def decimate_series(x, y, max_points: int | None, method: str = "lttb") -> tuple:
+    """
+    Reduz a série apenas quando ela tem mais que `max_points` pontos
+
+    - Args:
+        - x:: Valores do eixo x
+        - y:: Valores da série
+        - max_points:: int | None: Quantidade máxima de pontos, None mantém todos
+        - method:: str: "lttb" ou "minmax"
+
+    - Returns:
+        - tuple: (x, y) reduzidos, ou os originais
+    """
+    if max_points is None or len(y) <= max_points:
+        return x, y
+    indices = decimate_indices(x, y, max_points, method)
+    return np.asarray(x)[indices], np.asarray(y)[indices]
@@ -0,0 +1,251 @@
+from io import BytesIO
+from math import cos, hypot, radians, sin
+
+from matplotlib.artist import Artist
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+from PIL import Image
+
+from .chart import custom_bar_chart, custom_donut_chart, custom_line_chart, custom_pie_chart
+from .decimate import decimate_series
+from .render import render_figure
+
+
+# Mesmos valores usados pelo `ax.pie` dos gráficos de pizza e rosca
+PIE_START_ANGLE = 90
+PIE_LABEL_DISTANCE = 1.1
+PIE_PCT_DISTANCE = 0.6
+
+
+class LiveChart:
+    """
+    Gráfico montado uma única vez e atualizado no lugar entre renderizações
+
+    Eixos, títulos e grades ficam em uma imagem de fundo guardada após o primeiro desenho.
+    Cada renderização em PNG restaura esse fundo e redesenha apenas os artistas que mudam (blitting).
+    As legendas são redesenhadas por último, por cima dos artistas e na posição calculada para os dados atuais.
+    Quando os limites dos eixos mudam, o fundo é desenhado de novo.
+
+    - Args:
+        - fig:: Figure: Figura já montada
+        - artists:: list[Artist]: Artistas atualizados a cada renderização
+    """
+    def __init__(self, fig: Figure, artists: list[Artist]):
+        self.fig = fig
+        # Fora do fundo as legendas não são cobertas pelos artistas, e o `loc="best"` pode movê-las livremente
+        legends = [ax.get_legend() for ax in fig.axes if ax.get_legend() is not None] + list(fig.legends)
+        self.artists = artists + legends
+        self._background = None
+        FigureCanvasAgg(fig)
+        for artist in self.artists:
+            artist.set_animated(True)
+
+    def invalidate(self):
+        # Força o próximo desenho a refazer o fundo
+        self._background = None
+
+    def _autoscale(self, ax):
+        limits = (ax.get_xlim(), ax.get_ylim())
+        ax.relim()
+        ax.autoscale_view()
+        if (ax.get_xlim(), ax.get_ylim()) != limits:
+            self.invalidate()
+
+    def _draw(self):
+        canvas = self.fig.canvas
+        if self._background is None:
+            canvas.draw()
+            self._background = canvas.copy_from_bbox(self.fig.bbox)
+        else:
+            canvas.restore_region(self._background)
+        for artist in self.artists:
+            self.fig.draw_artist(artist)
+
+    def render(self, format: str = "png") -> bytes:
+        """
+        Renderiza o estado atual do gráfico
+
+        - Args:
+            - format:: str: "png" usa o blitting, "svg" desenha a figura inteira
+
+        - Returns:
+            - bytes: Gráfico renderizado
+        """
+        if format == "png":
+            self._draw()
+            canvas = self.fig.canvas
+            buffer = BytesIO()
+            Image.frombuffer("RGBA", canvas.get_width_height(), canvas.buffer_rgba(), "raw", "RGBA", 0, 1).save(buffer, "png")
+            return buffer.getvalue()
+
+        # Artistas animados ficam fora do desenho normal da figura
+        for artist in self.artists:
+            artist.set_animated(False)
+        try:
+            return render_figure(self.fig, format, self.fig.dpi, close=False)
+        finally:
+            for artist in self.artists:
+                artist.set_animated(True)
+            self.invalidate()
+
+
+class LiveBarChart(LiveChart):
+    """
+    Gráfico de barras (`custom_bar_chart`) que atualiza a altura das barras e os rótulos de valor no lugar
+
+    - Args:
+        - items_name:: list[str]: Rótulo de cada item
+        - items_quantity:: list[Numbers]: Quantidade inicial de cada item
+        - title:: str: Título do Gráfico
+        - legend:: list[str]: Legenda do Gráfico
+        - y_label:: str: Legenda do eixo y do gráfico
+        - color_bar:: list[str]: Cor de cada item
+    """
+    def __init__(
+        self,
+        items_name: list,
+        items_quantity: list,
+        title: str,
+        legend: list[str],
+        y_label: str,
+        color_bar: list
+    ):
+        fig = custom_bar_chart(items_name, items_quantity, title, legend, y_label, color_bar)
+        self.ax = fig.axes[0]
+        self.bars = list(self.ax.containers[0])
+        self.labels = list(self.ax.texts)
+        super().__init__(fig, self.bars + self.labels)
+
+    def update(self, items_quantity: list):
+        """
+        Atualiza a quantidade de cada item
+
+        - Args:
+            - items_quantity:: list[Numbers]: Nova quantidade de cada item, na mesma ordem
+
+        - Raises:
+            - ValueError: Caso a quantidade de itens seja diferente da original
+        """
+        if len(items_quantity) != len(self.bars):
+            raise ValueError(f"Esperadas {len(self.bars)} quantidades, recebidas {len(items_quantity)}")
+        for bar, label, height in zip(self.bars, self.labels, items_quantity):
+            bar.set_height(height)
+            label.set_y(height)
+            label.set_text(f'{height}')
+
+        bottom, top = self.ax.get_ylim()
+        highest = max(items_quantity, default=0)
+        # Só muda a escala se as barras saírem do gráfico ou ficarem pequenas demais
+        if highest > top or min(items_quantity, default=0) < bottom or highest < top / 2:
+            self._autoscale(self.ax)
+
+
+class LivePieChart(LiveChart):
+    """
+    Gráfico de pizza ou rosca (`custom_pie_chart` / `custom_donut_chart`) que atualiza o ângulo das fatias
+    e os percentuais no lugar
+
+    - Args:
+        - items_name:: list[str]: Rótulo de cada item
+        - items_quantity:: list[Numbers]: Quantidade inicial de cada item
+        - title:: str: Título do Gráfico
+        - legend:: list[str]: Legenda do Gráfico
+        - colors:: list[str]: Cor de cada item
+        - donut:: bool: Se True, cria um gráfico de rosca
+    """
+    def __init__(
+        self,
+        items_name: list,
+        items_quantity: list,
+        title: str,
+        legend: list[str],
+        colors: list,
+        donut: bool = False
+    ):
+        chart = custom_donut_chart if donut else custom_pie_chart
+        fig = chart(list(items_name), list(items_quantity), title, legend, colors)
+        self.ax = fig.axes[0]
+        self.wedges = list(self.ax.patches)
+        # Rótulos ficam fora da pizza e percentuais dentro
+        self.labels = [text for text in self.ax.texts if hypot(*text.get_position()) > 1]
+        self.percentages = [text for text in self.ax.texts if hypot(*text.get_position()) <= 1]
+        super().__init__(fig, self.wedges + self.labels + self.percentages)
+
+    def update(self, items_quantity: list):
+        """
+        Atualiza a quantidade de cada item
+
+        - Args:
+            - items_quantity:: list[Numbers]: Nova quantidade de cada item, na mesma ordem
+
+        - Raises:
+            - ValueError: Caso a quantidade de itens seja diferente da original ou haja valores negativos
+        """
+        if len(items_quantity) != len(self.wedges):
+            raise ValueError(f"Esperadas {len(self.wedges)} quantidades, recebidas {len(items_quantity)}")
+        if any(quantity < 0 for quantity in items_quantity):
+            raise ValueError("As quantidades de um gráfico de pizza não podem ser negativas")
+
+        total = sum(items_quantity) or 1
+        theta1 = PIE_START_ANGLE
+        for idx, (wedge, quantity) in enumerate(zip(self.wedges, items_quantity)):
+            fraction = quantity / total
+            theta2 = theta1 + 360 * fraction
+            wedge.set_theta1(theta1)
+            wedge.set_theta2(theta2)
+
+            middle = radians((theta1 + theta2) / 2)
+            x, y = cos(middle), sin(middle)
+            if idx < len(self.labels):
+                self.labels[idx].set_position((PIE_LABEL_DISTANCE * x, PIE_LABEL_DISTANCE * y))
+                self.labels[idx].set_horizontalalignment("left" if x > 0 else "right")
+            if idx < len(self.percentages):
+                self.percentages[idx].set_position((PIE_PCT_DISTANCE * x, PIE_PCT_DISTANCE * y))
+                self.percentages[idx].set_text('%1.1f%%' % (100 * fraction))
+            theta1 = theta2
+
+
+class LiveLineChart(LiveChart):
+    """
+    Gráfico de linha (`custom_line_chart`) que atualiza os pontos da linha no lugar, com a mesma redução de pontos
+
+    - Args:
+        - date:: list[datetime]: Datas iniciais
+        - sales:: list[float]: Vendas iniciais
+        - max_points:: int | None: Quantidade máxima de pontos desenhados, None desenha todos
+        - decimation:: str: Método de redução, "lttb" ou "minmax"
+        - marker_threshold:: int: Acima dessa quantidade de pontos desenhados, os marcadores são omitidos
+        - kwargs:: Demais argumentos do `custom_line_chart` (título, rótulos e estilo)
+    """
+    def __init__(
+        self,
+        date: list,
+        sales: list[float],
+        max_points: int | None = 2000,
+        decimation: str = "lttb",
+        marker_threshold: int = 500,
+        **kwargs
+    ):
+        fig = custom_line_chart(
+            date, sales, max_points=max_points, decimation=decimation, marker_threshold=marker_threshold, **kwargs
+        )
+        self.max_points = max_points
+        self.decimation = decimation
+        self.marker_threshold = marker_threshold
+        self.marker = kwargs.get("marker", "o")
+        self.ax = fig.axes[0]
+        self.line = self.ax.lines[0]
+        super().__init__(fig, [self.line])
+
+    def update(self, date: list, sales: list[float]):
+        """
+        Substitui os pontos da linha
+
+        - Args:
+            - date:: list[datetime]: Novas datas
+            - sales:: list[float]: Novas vendas
+        """
+        date, sales = decimate_series(date, sales, self.max_points, self.decimation)
+        self.line.set_data(date, sales)
+        self.line.set_marker("None" if len(sales) > self.marker_threshold else self.marker)
+        self._autoscale(self.ax)
@@ -1,4 +1,7 @@
+from functools import lru_cache
+
 import matplotlib.colors as mcolors
+import numpy as np
 
 # Definindo as cores fornecidas
 """colors = [
@@ -17,25 +20,80 @@ EXAMPLE_COLORS = [
     "#fffac8"   
 ]
 
+@lru_cache(maxsize=64)
+def _colormap(colors: tuple[str, ...]) -> mcolors.LinearSegmentedColormap:
+    # Colormap interpolando as cores, criado uma única vez por lista de cores
+    return mcolors.LinearSegmentedColormap.from_list("custom_palette", colors)
+
+
+@lru_cache(maxsize=64)
+def color_lut(colors: tuple[str, ...] = tuple(EXAMPLE_COLORS), size: int = 256) -> np.ndarray:
+    """
+    Tabela com `size` cores RGBA interpoladas da paleta, para gráficos com muitas séries
+
+    A tabela é calculada uma vez por paleta e é somente leitura. Use `lut_colors` para escolher as cores.
+
+    - Args:
+        - colors:: tuple[str, ...]: Cores da paleta, da mais forte para a mais fraca
+        - size:: int: Quantidade de cores da tabela
+
+    - Returns:
+        - np.ndarray: Array (size, 4) com as cores RGBA entre 0 e 1
+    """
+    lut = _colormap(tuple(colors))(np.linspace(0, 1, size))
+    lut.flags.writeable = False
+    return lut
+
+
+def lut_colors(lut: np.ndarray, n: int, ascending: bool = False) -> np.ndarray:
+    """
+    Escolhe N cores igualmente espaçadas de uma tabela de cores, sem interpolar
+
+    - Args:
+        - lut:: np.ndarray: Tabela gerada por `color_lut`
+        - n:: int: Número de cores
+        - ascending:: bool: Se True, a ordem das cores será invertida
+
+    - Returns:
+        - np.ndarray: Array (n, 4) com as cores RGBA
+    """
+    indices = np.linspace(0, len(lut) - 1, n).round().astype(np.intp)
+    if ascending:
+        indices = indices[::-1]
+    return lut[indices]
+
+
+def to_hex(rgba: np.ndarray) -> list[str]:
+    # Converte todas as cores de uma vez, com o mesmo arredondamento do `rgb2hex`
+    channels = np.round(np.asarray(rgba)[:, :3] * 255).astype(np.uint8)
+    return [f"#{red:02x}{green:02x}{blue:02x}" for red, green, blue in channels.tolist()]
+
+
+@lru_cache(maxsize=1024)
+def _palette(n: int, ascending: bool, colors: tuple[str, ...]) -> tuple[str, ...]:
+    if n <= 0:
+        return ()
+    # Com apenas uma cor, a paleta começa e termina na cor mais forte
+    palette = to_hex(_colormap(colors)(np.linspace(0, 1, n) if n > 1 else np.zeros(1)))
+    if ascending:
+        palette.reverse()
+    return tuple(palette)
+
+
 def generate_color_palette(n, ascending=False, colors: list[str] = EXAMPLE_COLORS) -> list[str]:
     """
     Gera uma lista de N cores seguindo a paleta fornecida, onde cada item mais à esquerda
     da lista tem a intensidade mais forte e cada item à direita tem menos intensidade.
+
+    O colormap de cada paleta e o resultado de cada combinação (n, ascending, colors) ficam em cache.
     
     - Args:
         - n:: int : Número de cores a serem geradas.
         - ascending:: bool : Se True, a lista de cores será invertida.
-        
+        - colors:: list[str] : Cores da paleta, da mais forte para a mais fraca.
         
     
     - Returns:
         - list: Lista de N cores em formato hexadecimal.
     """
-    # Interpolando as cores
-    cmap = mcolors.LinearSegmentedColormap.from_list("custom_palette", colors)
-    palette = [mcolors.rgb2hex(cmap(i / (n - 1))) for i in range(n)]
-    
-    if ascending:
-        palette = list(reversed(palette))
-    
-    return palette
\ No newline at end of file
+    return list(_palette(n, ascending, tuple(colors)))
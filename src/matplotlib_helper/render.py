@@ -0,0 +1,107 @@
+from concurrent.futures import ProcessPoolExecutor
+from io import BytesIO
+from os import cpu_count
+from threading import local
+from typing import Callable
+
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+
+from .chart import custom_bar_chart, custom_donut_chart, custom_line_chart, custom_pie_chart
+
+
+CHARTS: dict[str, Callable[..., Figure]] = {
+    "bar": custom_bar_chart,
+    "pie": custom_pie_chart,
+    "donut": custom_donut_chart,
+    "line": custom_line_chart,
+}
+FORMATS = ("png", "svg")
+
+_figures = local()
+
+
+def _recycled_figure() -> Figure:
+    # Uma Figure por thread, limpa e reaproveitada a cada gráfico
+    fig = getattr(_figures, "fig", None)
+    if fig is None:
+        fig = _figures.fig = Figure()
+        FigureCanvasAgg(fig)
+    return fig
+
+
+def render_figure(fig: Figure, format: str = "png", dpi: int = 100, close: bool = True) -> bytes:
+    """
+    Renderiza uma Figure com o backend Agg, sem passar pelo pyplot
+
+    - Args:
+        - fig:: Figure: Figura a ser renderizada
+        - format:: str: "png" ou "svg"
+        - dpi:: int: Resolução da imagem
+        - close:: bool: Se True, limpa a figura após renderizar, liberando os artistas na hora
+
+    - Returns:
+        - bytes: Imagem renderizada
+
+    - Raises:
+        - ValueError: Caso o formato não seja suportado
+    """
+    if format not in FORMATS:
+        raise ValueError(f"Formato inválido: {format}. Use um de {FORMATS}")
+    if not isinstance(fig.canvas, FigureCanvasAgg):
+        FigureCanvasAgg(fig)
+    buffer = BytesIO()
+    fig.savefig(buffer, format=format, dpi=dpi)
+    if close:
+        fig.clear()
+    return buffer.getvalue()
+
+
+def render_chart(kind: str, format: str = "png", dpi: int = 100, **kwargs) -> bytes:
+    """
+    Cria e renderiza um gráfico reaproveitando a Figure da thread atual
+
+    - Args:
+        - kind:: str: Tipo do gráfico ("bar", "pie", "donut" ou "line")
+        - format:: str: "png" ou "svg"
+        - dpi:: int: Resolução da imagem
+        - kwargs:: Argumentos da função `custom_*_chart` correspondente
+
+    - Returns:
+        - bytes: Gráfico renderizado
+
+    - Raises:
+        - ValueError: Caso o tipo de gráfico não exista
+    """
+    if kind not in CHARTS:
+        raise ValueError(f"Gráfico inválido: {kind}. Use um de {list(CHARTS)}")
+    fig = CHARTS[kind](**kwargs, fig=_recycled_figure())
+    return render_figure(fig, format, dpi)
+
+
+def _render_spec(spec: dict) -> bytes:
+    spec = dict(spec)
+    return render_chart(spec.pop("kind"), **spec)
+
+
+def render_charts(specs: list[dict], workers: int | None = None) -> list[bytes]:
+    """
+    Renderiza vários gráficos em paralelo, em processos
+
+    Cada especificação tem o tipo do gráfico em "kind" e os argumentos de `render_chart`.
+    Ex: [{"kind": "bar", "format": "svg", "items_name": [...], "items_quantity": [...], ...}]
+
+    - Args:
+        - specs:: list[dict]: Especificações dos gráficos
+        - workers:: int | None: Quantidade de processos (padrão: núcleos da máquina), 1 renderiza no processo atual
+
+    - Returns:
+        - list[bytes]: Gráficos renderizados, na ordem das especificações
+    """
+    workers = workers or cpu_count() or 1
+    if workers == 1 or len(specs) <= 1:
+        return [_render_spec(spec) for spec in specs]
+
+    chunksize = max(1, min(32, len(specs) // (workers * 4)))
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(_render_spec, specs, chunksize=chunksize))
@@ -0,0 +1,21 @@
+from .._lazy import make_lazy
+
+
+# Nome exportado -> submódulo que o define, importado apenas no primeiro acesso (PEP 562)
+_EXPORTS = {
+    "expenditure": ".analytics",
+    "filter_rows_by_date": ".analytics",
+    "profit": ".analytics",
+    "sales_per_day": ".analytics",
+    "sales_per_hour": ".analytics",
+    "sales_per_month": ".analytics",
+    "sales_per_weekday": ".analytics",
+    "sales_per_year": ".analytics",
+    "top_profitable_product": ".analytics",
+    "top_selling_product": ".analytics",
+    "total_revenue": ".analytics",
+    "models_to_df": ".convert",
+}
+
+__all__ = list(_EXPORTS)
+__getattr__, __dir__ = make_lazy(__name__, _EXPORTS)
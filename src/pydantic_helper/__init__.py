@@ -0,0 +1,15 @@
+from .._lazy import make_lazy
+
+
+# Nome exportado -> submódulo que o define, importado apenas no primeiro acesso (PEP 562)
+_EXPORTS = {
+    "BaseSchema": ".schemas.base",
+    "User": ".schemas.user",
+    "validate_users": ".schemas.user",
+    "validate_users_json": ".schemas.user",
+    "validate_users_partial": ".schemas.user",
+    "ValidationError": ".validators.base",
+}
+
+__all__ = list(_EXPORTS)
+__getattr__, __dir__ = make_lazy(__name__, _EXPORTS)
@@ -28,4 +28,7 @@ def value_field(title: str = "Valor", description: str = "Valor", example: float
     
     return base_field(title, description, example)
 
-    
\ No newline at end of file
+    
+def username_field(title: str = "Usuário", description: str = "Usuário", example: str = "jose.silva") -> Field:
+    
+    return base_field(title, description, example)
@@ -1,21 +1,161 @@
-from pydantic import BaseModel
+from functools import cache, lru_cache
+from typing import Iterable, Sequence
+
+from pydantic import BaseModel, TypeAdapter
+from pydantic_core import to_json
+
+
+FieldNames = Iterable[str] | None
+
+
+@lru_cache(maxsize=1024)
+def _cached_field_set(fields: tuple[str, ...]) -> set[str]:
+    # pydantic-core handles a plain set faster than a frozenset. The cached sets are never mutated.
+    return set(fields)
+
+
+def field_set(fields: FieldNames) -> set[str] | None:
+    """
+    A function that converts a list of field names into a set for include/exclude, cached per list content.
+
+    - Args:
+        - fields: Iterable[str] | None: The field names.
+    - Returns:
+        - set[str] | None: The field names as a set, or None when no fields are given.
+    """
+    if not fields:
+        return None
+    if isinstance(fields, set):
+        return fields
+    return _cached_field_set(tuple(fields))
+
+
+@cache
+def _list_adapter(schema: type["BaseSchema"]) -> TypeAdapter:
+    return TypeAdapter(list[schema])
+
+
+def _each(fields: set[str] | None) -> dict | None:
+    # Applies include/exclude to every item of a list
+    return None if fields is None else {"__all__": fields}
 
 
 class BaseSchema(BaseModel):
-    
-    
+    """
+    A base class for schemas with fast export methods.
+
+    Include, exclude and exclude_none are handled by pydantic-core while serializing, so excluded fields
+    are never dumped.
+    """
+
     def to_dict(
         self,
-        exclude_fields: list[str] = [],
-        include_fields: dict = {},
+        exclude_fields: FieldNames = None,
+        include_fields: dict | None = None,
         exclude_none: bool = False,
+        only_fields: FieldNames = None,
     ) -> dict:
-        
-        data = self.model_dump()
-        
-        data = {k: v for k, v in data.items() if k not in exclude_fields and (not exclude_none or v is not None)}
-        
-        data.update(include_fields)
-        
+        """
+        A method that exports the schema as a dict.
+
+        - Args:
+            - exclude_fields: Iterable[str] | None: The fields left out of the dict.
+            - include_fields: dict | None: Extra keys added to the dict, overriding fields with the same name.
+            - exclude_none: bool: Whether fields with None values are left out.
+            - only_fields: Iterable[str] | None: When given, only these fields are exported.
+        - Returns:
+            - dict: The exported data.
+        """
+        data = self.model_dump(
+            include=field_set(only_fields),
+            exclude=field_set(exclude_fields),
+            exclude_none=exclude_none,
+        )
+        if include_fields:
+            data.update(include_fields)
         return data
-        
\ No newline at end of file
+
+    def to_json(
+        self,
+        exclude_fields: FieldNames = None,
+        include_fields: dict | None = None,
+        exclude_none: bool = False,
+        only_fields: FieldNames = None,
+    ) -> str:
+        """
+        A method that exports the schema as JSON, serialized directly by pydantic-core.
+
+        - Args:
+            - exclude_fields: Iterable[str] | None: The fields left out of the JSON.
+            - include_fields: dict | None: Extra keys added to the JSON, overriding fields with the same name.
+            - exclude_none: bool: Whether fields with None values are left out.
+            - only_fields: Iterable[str] | None: When given, only these fields are exported.
+        - Returns:
+            - str: The exported JSON.
+        """
+        exclude = field_set(exclude_fields)
+        if include_fields:
+            # Overridden fields are excluded so the extra keys are not duplicated
+            exclude = (exclude or set()) | include_fields.keys()
+        data = self.model_dump_json(
+            include=field_set(only_fields),
+            exclude=exclude,
+            exclude_none=exclude_none,
+        )
+        if not include_fields:
+            return data
+        # Extra keys use pydantic-core too, so datetimes and other values match the format of the fields
+        extra = to_json(include_fields, fallback=str).decode()[1:]
+        return f"{data[:-1]},{extra}" if len(data) > 2 else "{" + extra
+
+    @classmethod
+    def dump_many(
+        cls,
+        items: Sequence["BaseSchema"],
+        exclude_fields: FieldNames = None,
+        exclude_none: bool = False,
+        only_fields: FieldNames = None,
+    ) -> list[dict]:
+        """
+        A method that exports a list of schemas as dicts in a single pydantic-core call.
+
+        - Args:
+            - items: Sequence[BaseSchema]: The schemas to export.
+            - exclude_fields: Iterable[str] | None: The fields left out of each dict.
+            - exclude_none: bool: Whether fields with None values are left out.
+            - only_fields: Iterable[str] | None: When given, only these fields are exported.
+        - Returns:
+            - list[dict]: The exported data.
+        """
+        return _list_adapter(cls).dump_python(
+            items,
+            include=_each(field_set(only_fields)),
+            exclude=_each(field_set(exclude_fields)),
+            exclude_none=exclude_none,
+        )
+
+    @classmethod
+    def dump_many_json(
+        cls,
+        items: Sequence["BaseSchema"],
+        exclude_fields: FieldNames = None,
+        exclude_none: bool = False,
+        only_fields: FieldNames = None,
+    ) -> bytes:
+        """
+        A method that exports a list of schemas as a JSON array in a single pydantic-core call.
+
+        - Args:
+            - items: Sequence[BaseSchema]: The schemas to export.
+            - exclude_fields: Iterable[str] | None: The fields left out of each object.
+            - exclude_none: bool: Whether fields with None values are left out.
+            - only_fields: Iterable[str] | None: When given, only these fields are exported.
+        - Returns:
+            - bytes: The exported JSON array.
+        """
+        return _list_adapter(cls).dump_json(
+            items,
+            include=_each(field_set(only_fields)),
+            exclude=_each(field_set(exclude_fields)),
+            exclude_none=exclude_none,
+        )
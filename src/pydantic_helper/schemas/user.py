@@ -0,0 +1,90 @@
+from typing import Sequence
+
+from pydantic import TypeAdapter, ValidationError as PydanticValidationError
+
+from src.pydantic_helper.fields.user import (
+    email_field,
+    name_field,
+    password_field,
+    phone_field,
+    username_field,
+)
+from src.pydantic_helper.schemas.base import BaseSchema
+from src.pydantic_helper.validators.user import (
+    Email,
+    IsAdmin,
+    Name,
+    Password,
+    Phone,
+    Username,
+)
+
+
+class User(BaseSchema):
+    """
+    A class that represents a user, validated with pydantic-core constraints.
+
+    Applies the same rules and messages as the validators in `pydantic_helper.validators.user`, but a
+    validation error reports every invalid field instead of only the first one. Non-string values are
+    rejected with pydantic's "Input should be a valid string" instead of the `ERROR_*_TYPE` messages.
+    """
+    email: Email = email_field()
+    password: Password = password_field()
+    name: Name = name_field()
+    phone: Phone = phone_field()
+    username: Username = username_field()
+    is_admin: IsAdmin = False
+
+
+USERS_ADAPTER = TypeAdapter(list[User])
+
+
+def validate_users(payloads: Sequence[dict]) -> list[User]:
+    """
+    A function that validates a list of user payloads in a single pydantic-core call.
+
+    - Args:
+        - payloads: Sequence[dict]: The user payloads.
+    - Returns:
+        - list[User]: The validated users.
+    - Raises:
+        - pydantic.ValidationError: With the errors of every invalid user, located by index and field.
+    """
+    return USERS_ADAPTER.validate_python(payloads)
+
+
+def validate_users_json(data: str | bytes) -> list[User]:
+    """
+    A function that validates a JSON array of users without building intermediate dicts.
+
+    - Args:
+        - data: str | bytes: The JSON array.
+    - Returns:
+        - list[User]: The validated users.
+    - Raises:
+        - pydantic.ValidationError: With the errors of every invalid user, located by index and field.
+    """
+    return USERS_ADAPTER.validate_json(data)
+
+
+def validate_users_partial(payloads: Sequence[dict]) -> tuple[list[User], dict[int, list[dict]]]:
+    """
+    A function that validates a list of user payloads, keeping the valid ones and collecting all errors.
+
+    - Args:
+        - payloads: Sequence[dict]: The user payloads.
+    - Returns:
+        - tuple:
+            - users: list[User]: The valid users, in the original order.
+            - errors: dict[int, list[dict]]: The errors of each invalid payload, by index.
+    """
+    try:
+        return USERS_ADAPTER.validate_python(payloads), {}
+    except PydanticValidationError as e:
+        errors: dict[int, list[dict]] = {}
+        for error in e.errors(include_url=False):
+            index, *loc = error["loc"]
+            errors.setdefault(index, []).append({**error, "loc": tuple(loc)})
+
+    valid = [payload for index, payload in enumerate(payloads) if index not in errors]
+    return USERS_ADAPTER.validate_python(valid), errors
@@ -1,5 +1,8 @@
-from pydantic import field_validator
-from re import match
+from typing import Annotated
+
+from pydantic import AfterValidator, Strict, StringConstraints, field_validator
+from pydantic_core import PydanticCustomError
+from re import compile
 
 from src.pydantic_helper.validators.base import ValidationError
 
@@ -23,6 +26,43 @@ ERROR_PHONE_INVALID_FORMAT_LENGTH = "Phone must be at least 11 characters"
 ERROR_USERNAME_INVALID_FORMAT_TYPE = "Username must be a string"
 ERROR_USERNAME_INVALID_FORMAT_MIN_LENGTH = "Username must be at least 2 characters with no spaces"
 
+EMAIL_REGEX = r"^[^@]+@[^@]+\.[^@]+"
+EMAIL_PATTERN = compile(EMAIL_REGEX)
+PASSWORD_SPECIAL_CHARACTERS = frozenset("!@#$%&*()_+-=[]{};:,.<>?/")
+
+
+def password_error(value: str) -> str | None:
+    """
+    A function that checks the password character classes in a single pass over the string.
+
+    - Args:
+        - value: The password value.
+    - Returns:
+        - str | None: The message of the first missing character class, in the same order as validate_password, or None.
+    """
+    has_digit = has_lower = has_upper = has_special = False
+    for char in value:
+        if char.isdigit():
+            has_digit = True
+        elif char.islower():
+            has_lower = True
+        elif char.isupper():
+            has_upper = True
+        elif char in PASSWORD_SPECIAL_CHARACTERS:
+            has_special = True
+        else:
+            continue
+        if has_digit and has_lower and has_upper and has_special:
+            return None
+
+    if not has_digit:
+        return ERROR_PASSWORD_INVALID_FORMAT_DIGIT
+    if not has_lower:
+        return ERROR_PASSWORD_INVALID_FORMAT_LOWERCASE
+    if not has_upper:
+        return ERROR_PASSWORD_INVALID_FORMAT_UPPERCASE
+    return ERROR_PASSWORD_INVALID_FORMAT_SPECIAL_CHARACTER
+
 @field_validator("email", mode="before")
 def validate_email(cls, value: str) -> str:
     """
@@ -39,7 +79,7 @@ def validate_email(cls, value: str) -> str:
     
     value = value.strip()
     
-    if not match(r"[^@]+@[^@]+\.[^@]+", value):
+    if not EMAIL_PATTERN.match(value):
         raise ValidationError(field="email", detail=ERROR_EMAIL_INVALID_FORMAT_MASK)
     
     return value
@@ -104,17 +144,9 @@ def validate_password(cls, value: str) -> str:
     if len(value) > 255:
         raise ValidationError(field="password", detail=ERROR_PASSWORD_INVALID_FORMAT_MAX_LENGTH)
     
-    if not any(char.isdigit() for char in value):
-        raise ValidationError(field="password", detail=ERROR_PASSWORD_INVALID_FORMAT_DIGIT)
-    
-    if not any(char.islower() for char in value):
-        raise ValidationError(field="password", detail=ERROR_PASSWORD_INVALID_FORMAT_LOWERCASE)
-    
-    if not any(char.isupper() for char in value):
-        raise ValidationError(field="password", detail=ERROR_PASSWORD_INVALID_FORMAT_UPPERCASE)
-    
-    if not any(char in "!@#$%&*()_+-=[]{};:,.<>?/" for char in value):
-        raise ValidationError(field="password", detail=ERROR_PASSWORD_INVALID_FORMAT_SPECIAL_CHARACTER)
+    error = password_error(value)
+    if error is not None:
+        raise ValidationError(field="password", detail=error)
     
     return value
 
@@ -134,7 +166,7 @@ def validate_phone(cls, value: str) -> str:
     
     value = value.strip()
     
-    value = "".join([char for char in value if char.isdigit()])
+    value = "".join(filter(str.isdigit, value))
     
     if len(value) < 11:
         raise ValidationError(field="phone", detail=ERROR_PHONE_INVALID_FORMAT_LENGTH)
@@ -161,4 +193,58 @@ def validate_username(cls, value: str) -> str:
     if len(value) <= 1:
         raise ValidationError(field="username", detail=ERROR_USERNAME_INVALID_FORMAT_MIN_LENGTH)
     
-    return value
\ No newline at end of file
+    return value
+
+
+# Core-level rules: the same checks as the validators above, with the type check and whitespace
+# stripping done by pydantic-core and only the format checks calling Python. Errors are regular pydantic
+# errors that carry the messages above, so validating a list collects the errors of every item instead of
+# stopping at the first one. A non-string value fails with pydantic's "string_type" error.
+
+def _check_email(value: str) -> str:
+    if not EMAIL_PATTERN.match(value):
+        raise PydanticCustomError("email_format", ERROR_EMAIL_INVALID_FORMAT_MASK)
+    return value
+
+
+def _check_password(value: str) -> str:
+    if len(value) < 8:
+        raise PydanticCustomError("password_format", ERROR_PASSWORD_INVALID_FORMAT_MIN_LENGTH)
+    if len(value) > 255:
+        raise PydanticCustomError("password_format", ERROR_PASSWORD_INVALID_FORMAT_MAX_LENGTH)
+    error = password_error(value)
+    if error is not None:
+        raise PydanticCustomError("password_format", error)
+    return value
+
+
+def _check_name(value: str) -> str:
+    if len(value) <= 1:
+        raise PydanticCustomError("name_format", ERROR_NAME_INVALID_FORMAT_MIN_LENGTH)
+    return value
+
+
+def _check_phone(value: str) -> str:
+    value = "".join(filter(str.isdigit, value))
+    if len(value) < 11:
+        raise PydanticCustomError("phone_format", ERROR_PHONE_INVALID_FORMAT_LENGTH)
+    return value
+
+
+def _check_username(value: str) -> str:
+    if len(value) <= 1:
+        raise PydanticCustomError("username_format", ERROR_USERNAME_INVALID_FORMAT_MIN_LENGTH)
+    return value
+
+
+Email = Annotated[str, Strict(), StringConstraints(strip_whitespace=True), AfterValidator(_check_email)]
+Password = Annotated[str, Strict(), StringConstraints(strip_whitespace=True), AfterValidator(_check_password)]
+Name = Annotated[
+    str,
+    Strict(),
+    StringConstraints(strip_whitespace=True, to_upper=True),
+    AfterValidator(_check_name),
+]
+Phone = Annotated[str, Strict(), StringConstraints(strip_whitespace=True), AfterValidator(_check_phone)]
+Username = Annotated[str, Strict(), StringConstraints(strip_whitespace=True), AfterValidator(_check_username)]
+IsAdmin = Annotated[bool, Strict()]
@@ -0,0 +1,13 @@
+from .._lazy import make_lazy
+
+
+# Nome exportado -> submódulo que o define, importado apenas no primeiro acesso (PEP 562)
+_EXPORTS = {
+    "Repository": ".repository",
+    "str_to_date": ".date",
+    "br_date_to_american_date": ".date",
+    "american_date_to_br_date": ".date",
+}
+
+__all__ = list(_EXPORTS)
+__getattr__, __dir__ = make_lazy(__name__, _EXPORTS)
@@ -0,0 +1,18 @@
+from .._lazy import make_lazy
+
+
+# Nome exportado -> submódulo que o define, importado apenas no primeiro acesso (PEP 562)
+_EXPORTS = {
+    "generate_image_dataset": ".config_images",
+    "load_image": ".config_images",
+    "process_image": ".config_images",
+    "AugmentationPipeline": ".augment",
+    "DecodedImageCache": ".augment",
+    "augment_dataset": ".augment",
+    "read_labels": ".augment",
+    "write_labels": ".augment",
+    "DatasetManifest": ".manifest",
+}
+
+__all__ = list(_EXPORTS)
+__getattr__, __dir__ = make_lazy(__name__, _EXPORTS)
@@ -0,0 +1,465 @@
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from math import cos, radians, sin
+from os import makedirs, stat
+from os.path import basename, exists, join, splitext
+
+import numpy as np
+from PIL import Image
+
+from .config_images import get_image_paths, load_image
+
+
+YOLO_SIZE = 640
+LETTERBOX_COLOR = 114
+
+# Cada imagem do lote carrega suas caixas no formato YOLO: array (k, 5) com classe, cx, cy, w, h normalizados
+Boxes = list[np.ndarray]
+
+
+class DecodedImageCache:
+    """
+    Cache LRU de imagens já decodificadas (com `load_image`) e convertidas para RGB, limitado em bytes
+
+    Evita decodificar a mesma imagem de novo quando ela passa por vários pipelines ou épocas.
+    A entrada é invalidada quando o tamanho ou a data de modificação do arquivo mudam.
+
+    - Args:
+        - max_bytes:: int: Memória máxima ocupada pelos pixels das imagens guardadas
+        - size:: int: Lado mínimo usado na decodificação reduzida
+    """
+    def __init__(self, max_bytes: int = 512 * 1024 * 1024, size: int = YOLO_SIZE):
+        self.max_bytes = max_bytes
+        self.size = size
+        self.current_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self._images: OrderedDict[tuple[str, int, int], Image.Image] = OrderedDict()
+
+    def get(self, path: str) -> Image.Image:
+        info = stat(path)
+        key = (path, info.st_size, info.st_mtime_ns)
+        image = self._images.get(key)
+        if image is not None:
+            self._images.move_to_end(key)
+            self.hits += 1
+            return image
+
+        self.misses += 1
+        image = decode_rgb(path, self.size)
+        image_bytes = _image_bytes(image)
+        if image_bytes <= self.max_bytes:
+            self._images[key] = image
+            self.current_bytes += image_bytes
+            while self.current_bytes > self.max_bytes:
+                _, evicted = self._images.popitem(last=False)
+                self.current_bytes -= _image_bytes(evicted)
+        return image
+
+    def clear(self):
+        self._images.clear()
+        self.current_bytes = 0
+
+
+def _image_bytes(image: Image.Image) -> int:
+    return image.width * image.height * len(image.getbands())
+
+
+def decode_rgb(path: str, size: int = YOLO_SIZE) -> Image.Image:
+    # Decodifica já reduzida para perto de `size` e em RGB, formato usado pelo letterbox
+    with load_image(path, (size, size)) as image:
+        return image.copy() if image.mode == "RGB" else image.convert("RGB")
+
+
+def empty_boxes() -> np.ndarray:
+    return np.zeros((0, 5), dtype=np.float32)
+
+
+def read_labels(path: str) -> np.ndarray:
+    """
+    Lê um arquivo de labels no formato YOLO (uma caixa por linha: classe cx cy w h)
+
+    - Args:
+        - path:: str: Caminho do arquivo .txt
+
+    - Returns:
+        - np.ndarray: Array (k, 5), vazio caso o arquivo não exista
+    """
+    if not exists(path):
+        return empty_boxes()
+    boxes = np.loadtxt(path, dtype=np.float32, ndmin=2)
+    return boxes.reshape(-1, 5) if boxes.size else empty_boxes()
+
+
+def write_labels(path: str, boxes: np.ndarray):
+    """
+    Escreve as caixas no formato YOLO
+
+    - Args:
+        - path:: str: Caminho do arquivo .txt
+        - boxes:: np.ndarray: Array (k, 5) com classe, cx, cy, w, h normalizados
+    """
+    with open(path, "w") as file:
+        for cls, cx, cy, w, h in boxes:
+            file.write(f"{int(cls)} {cx:.6f} {cy:.6f} {w:.6f} {h:.6f}\n")
+
+
+def _boxes_to_corners(boxes: np.ndarray, size: int) -> np.ndarray:
+    # (k, 4) x1, y1, x2, y2 em pixels
+    cx, cy, w, h = (boxes[:, 1:5] * size).T
+    return np.stack([cx - w / 2, cy - h / 2, cx + w / 2, cy + h / 2], axis=1)
+
+
+def _corners_to_boxes(classes: np.ndarray, corners: np.ndarray, size: int, min_size: float = 1.0) -> np.ndarray:
+    corners = np.clip(corners, 0, size)
+    w = corners[:, 2] - corners[:, 0]
+    h = corners[:, 3] - corners[:, 1]
+    keep = (w >= min_size) & (h >= min_size)
+    boxes = np.stack([
+        classes,
+        (corners[:, 0] + w / 2) / size,
+        (corners[:, 1] + h / 2) / size,
+        w / size,
+        h / size,
+    ], axis=1)
+    return boxes[keep].astype(np.float32)
+
+
+def letterbox(images: list[Image.Image], boxes: Boxes, size: int = YOLO_SIZE, keep_ratio: bool = True) -> tuple[np.ndarray, Boxes]:
+    """
+    Redimensiona as imagens para `size` x `size` e as empilha em um único array
+
+    Com `keep_ratio`, a proporção é mantida e as bordas são preenchidas (letterbox), ajustando as caixas.
+    Sem ele, a imagem é esticada como no `resize_image_to_yolo`.
+
+    - Args:
+        - images:: list[Image.Image]: Imagens decodificadas
+        - boxes:: Boxes: Caixas de cada imagem
+        - size:: int: Lado da imagem de saída
+        - keep_ratio:: bool: Se True, mantém a proporção da imagem
+
+    - Returns:
+        - tuple[np.ndarray, Boxes]: Lote (N, size, size, 3) uint8 e as caixas ajustadas
+    """
+    batch = np.full((len(images), size, size, 3), LETTERBOX_COLOR, dtype=np.uint8)
+    result = []
+    for idx, (image, image_boxes) in enumerate(zip(images, boxes)):
+        if image.mode != "RGB":
+            image = image.convert("RGB")
+        if not keep_ratio:
+            batch[idx] = np.asarray(image.resize((size, size), Image.BILINEAR))
+            result.append(image_boxes.copy())
+            continue
+
+        width, height = image.size
+        ratio = size / max(width, height)
+        new_width, new_height = max(1, round(width * ratio)), max(1, round(height * ratio))
+        pad_x, pad_y = (size - new_width) // 2, (size - new_height) // 2
+        batch[idx, pad_y:pad_y + new_height, pad_x:pad_x + new_width] = np.asarray(
+            image.resize((new_width, new_height), Image.BILINEAR)
+        )
+
+        adjusted = image_boxes.copy()
+        adjusted[:, 1] = (image_boxes[:, 1] * new_width + pad_x) / size
+        adjusted[:, 2] = (image_boxes[:, 2] * new_height + pad_y) / size
+        adjusted[:, 3] = image_boxes[:, 3] * new_width / size
+        adjusted[:, 4] = image_boxes[:, 4] * new_height / size
+        result.append(adjusted)
+    return batch, result
+
+
+class Transform(ABC):
+    """
+    Transformação aplicada a um lote inteiro de imagens do mesmo tamanho.
+
+    Recebe e devolve (imagens (N, S, S, 3), caixas, tags). Transformações que geram variantes
+    devolvem mais imagens que recebem e acrescentam uma tag ao nome de cada variante.
+    """
+    @abstractmethod
+    def __call__(self, images: np.ndarray, boxes: Boxes, tags: list[str]) -> tuple[np.ndarray, Boxes, list[str]]:
+        raise NotImplementedError
+
+
+def _tag(tag: str, suffix: str) -> str:
+    return f"{tag}_{suffix}" if tag else suffix
+
+
+class Rotate(Transform):
+    """
+    Gera uma variante por ângulo (anti-horário, como o `Image.rotate`), mantendo o tamanho da imagem.
+
+    Múltiplos de 90° usam `np.rot90`. Os demais ângulos usam uma grade de coordenadas calculada uma
+    única vez por ângulo e aplicada ao lote inteiro. As caixas viram o retângulo que envolve a caixa rotacionada.
+
+    - Args:
+        - angles:: list[float]: Ângulos em graus
+    """
+    def __init__(self, angles: list[float]):
+        self.angles = angles
+        self._grids: dict[tuple[float, int], tuple[np.ndarray, np.ndarray, np.ndarray]] = {}
+
+    def _grid(self, angle: float, size: int) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        key = (angle, size)
+        if key not in self._grids:
+            theta = radians(angle)
+            center = (size - 1) / 2
+            v, u = np.mgrid[0:size, 0:size].astype(np.float32) - center
+            src_x = np.rint(u * cos(theta) - v * sin(theta) + center).astype(np.intp)
+            src_y = np.rint(u * sin(theta) + v * cos(theta) + center).astype(np.intp)
+            valid = (src_x >= 0) & (src_x < size) & (src_y >= 0) & (src_y < size)
+            self._grids[key] = (valid, src_y[valid], src_x[valid])
+        return self._grids[key]
+
+    def _rotate_boxes(self, boxes: np.ndarray, angle: float, size: int) -> np.ndarray:
+        if not len(boxes):
+            return boxes.copy()
+        theta = radians(angle)
+        center = size / 2
+        x1, y1, x2, y2 = _boxes_to_corners(boxes, size).T
+        xs = np.stack([x1, x2, x2, x1], axis=1) - center
+        ys = np.stack([y1, y1, y2, y2], axis=1) - center
+        rx = xs * cos(theta) + ys * sin(theta) + center
+        ry = -xs * sin(theta) + ys * cos(theta) + center
+        corners = np.stack([rx.min(axis=1), ry.min(axis=1), rx.max(axis=1), ry.max(axis=1)], axis=1)
+        return _corners_to_boxes(boxes[:, 0], corners, size)
+
+    def __call__(self, images, boxes, tags):
+        size = images.shape[1]
+        outputs, out_boxes, out_tags = [], [], []
+        for angle in self.angles:
+            turns = angle / 90
+            if turns == int(turns):
+                rotated = np.rot90(images, int(turns) % 4, axes=(1, 2))
+            else:
+                valid, src_y, src_x = self._grid(angle, size)
+                rotated = np.full_like(images, LETTERBOX_COLOR)
+                rotated[:, valid] = images[:, src_y, src_x]
+            outputs.append(rotated)
+            out_boxes.extend(self._rotate_boxes(image_boxes, angle, size) for image_boxes in boxes)
+            out_tags.extend(_tag(tag, f"r{angle:g}") for tag in tags)
+        return np.concatenate(outputs), out_boxes, out_tags
+
+
+class Flip(Transform):
+    """
+    Espelha as imagens na horizontal ou na vertical.
+
+    - Args:
+        - direction:: str: "horizontal" ou "vertical"
+        - keep_original:: bool: Se True, mantém as imagens originais e acrescenta as espelhadas como variantes
+    """
+    def __init__(self, direction: str = "horizontal", keep_original: bool = True):
+        if direction not in ("horizontal", "vertical"):
+            raise ValueError(f"Direção inválida: {direction}. Use 'horizontal' ou 'vertical'")
+        self.direction = direction
+        self.keep_original = keep_original
+
+    def __call__(self, images, boxes, tags):
+        horizontal = self.direction == "horizontal"
+        flipped = images[:, :, ::-1] if horizontal else images[:, ::-1]
+        column = 1 if horizontal else 2
+        flipped_boxes = []
+        for image_boxes in boxes:
+            image_boxes = image_boxes.copy()
+            image_boxes[:, column] = 1 - image_boxes[:, column]
+            flipped_boxes.append(image_boxes)
+        flipped_tags = [_tag(tag, "fh" if horizontal else "fv") for tag in tags]
+
+        if not self.keep_original:
+            return np.ascontiguousarray(flipped), flipped_boxes, flipped_tags
+        return np.concatenate([images, flipped]), boxes + flipped_boxes, tags + flipped_tags
+
+
+class ColorJitter(Transform):
+    """
+    Varia brilho, contraste e saturação de cada imagem com fatores aleatórios, em uma única operação sobre o lote.
+
+    - Args:
+        - brightness:: float: Variação máxima do brilho (0.2 = fator entre 0.8 e 1.2)
+        - contrast:: float: Variação máxima do contraste
+        - saturation:: float: Variação máxima da saturação
+        - seed:: int | None: Semente do gerador aleatório
+    """
+    def __init__(self, brightness: float = 0.2, contrast: float = 0.2, saturation: float = 0.2, seed: int | None = None):
+        self.brightness = brightness
+        self.contrast = contrast
+        self.saturation = saturation
+        self.rng = np.random.default_rng(seed)
+
+    def _factors(self, amount: float, count: int) -> np.ndarray:
+        return self.rng.uniform(1 - amount, 1 + amount, size=(count, 1, 1, 1)).astype(np.float32)
+
+    def __call__(self, images, boxes, tags):
+        count = len(images)
+        result = images.astype(np.float32)
+        result *= self._factors(self.brightness, count)
+        mean = result.mean(axis=(1, 2, 3), keepdims=True)
+        result = (result - mean) * self._factors(self.contrast, count) + mean
+        gray = result @ np.array([0.299, 0.587, 0.114], dtype=np.float32)
+        result = (result - gray[..., None]) * self._factors(self.saturation, count) + gray[..., None]
+        return np.clip(result, 0, 255).astype(np.uint8), boxes, tags
+
+
+class RandomCrop(Transform):
+    """
+    Recorta uma janela de `scale` do lado da imagem em posição aleatória e a amplia de volta ao tamanho original.
+
+    - Args:
+        - scale:: float: Fração do lado da imagem mantida no recorte
+        - min_visibility:: float: Fração mínima da área de uma caixa que deve continuar visível para ela ser mantida
+        - seed:: int | None: Semente do gerador aleatório
+    """
+    def __init__(self, scale: float = 0.8, min_visibility: float = 0.3, seed: int | None = None):
+        self.scale = scale
+        self.min_visibility = min_visibility
+        self.rng = np.random.default_rng(seed)
+
+    def __call__(self, images, boxes, tags):
+        count, size = len(images), images.shape[1]
+        crop = max(1, int(size * self.scale))
+        offsets_x = self.rng.integers(0, size - crop + 1, size=count)
+        offsets_y = self.rng.integers(0, size - crop + 1, size=count)
+
+        # Ampliação por vizinho mais próximo, feita para o lote inteiro com indexação avançada
+        index = (np.arange(size) * crop // size).astype(np.intp)
+        rows = offsets_y[:, None] + index[None, :]
+        cols = offsets_x[:, None] + index[None, :]
+        cropped = images[np.arange(count)[:, None, None], rows[:, :, None], cols[:, None, :]]
+
+        cropped_boxes = []
+        for image_boxes, offset_x, offset_y in zip(boxes, offsets_x, offsets_y):
+            if not len(image_boxes):
+                cropped_boxes.append(image_boxes.copy())
+                continue
+            corners = _boxes_to_corners(image_boxes, size) - np.array([offset_x, offset_y, offset_x, offset_y])
+            area = (corners[:, 2] - corners[:, 0]) * (corners[:, 3] - corners[:, 1])
+            clipped = np.clip(corners, 0, crop)
+            visible = (clipped[:, 2] - clipped[:, 0]) * (clipped[:, 3] - clipped[:, 1])
+            keep = visible >= self.min_visibility * np.maximum(area, 1e-6)
+            cropped_boxes.append(_corners_to_boxes(image_boxes[keep, 0], clipped[keep] * size / crop, size))
+        return cropped, cropped_boxes, tags
+
+
+TRANSFORMS: dict[str, type[Transform]] = {
+    "rotate": Rotate,
+    "flip": Flip,
+    "color_jitter": ColorJitter,
+    "crop": RandomCrop,
+}
+
+
+class AugmentationPipeline:
+    """
+    Pipeline de aumento de dados para datasets YOLO
+
+    As imagens de um lote são decodificadas e redimensionadas (letterbox) uma única vez em um array NumPy,
+    e todas as transformações trabalham sobre esse array, transformando as caixas junto.
+
+    - Args:
+        - transforms:: list[Transform]: Transformações aplicadas em ordem
+        - size:: int: Lado das imagens geradas
+        - keep_ratio:: bool: Se True, usa letterbox, caso contrário estica a imagem
+    """
+    def __init__(self, transforms: list[Transform], size: int = YOLO_SIZE, keep_ratio: bool = True):
+        self.transforms = transforms
+        self.size = size
+        self.keep_ratio = keep_ratio
+
+    @classmethod
+    def from_config(cls, config: dict) -> "AugmentationPipeline":
+        """
+        Cria o pipeline a partir de uma configuração declarativa
+
+        Ex: {"size": 640, "steps": [{"type": "rotate", "angles": [0, 90, 180, 270]}, {"type": "flip"}]}
+
+        - Args:
+            - config:: dict: Configuração com `size`, `keep_ratio` e a lista `steps`
+
+        - Returns:
+            - AugmentationPipeline: Pipeline configurado
+        """
+        transforms = []
+        for step in config.get("steps", []):
+            params = dict(step)
+            name = params.pop("type")
+            if name not in TRANSFORMS:
+                raise ValueError(f"Transformação desconhecida: {name}. Use uma de {list(TRANSFORMS)}")
+            transforms.append(TRANSFORMS[name](**params))
+        return cls(transforms, size=config.get("size", YOLO_SIZE), keep_ratio=config.get("keep_ratio", True))
+
+    def __call__(
+        self,
+        images: list[Image.Image],
+        boxes: Boxes | None = None
+    ) -> tuple[np.ndarray, Boxes, list[tuple[int, str]]]:
+        """
+        Aplica o pipeline a um lote de imagens
+
+        - Args:
+            - images:: list[Image.Image]: Imagens decodificadas
+            - boxes:: Boxes | None: Caixas de cada imagem no formato YOLO
+
+        - Returns:
+            - tuple:
+                - images: np.ndarray: Variantes geradas (M, size, size, 3)
+                - boxes: Boxes: Caixas de cada variante
+                - sources: list[tuple[int, str]]: Índice da imagem de origem e tag de cada variante
+        """
+        if boxes is None:
+            boxes = [empty_boxes() for _ in images]
+        batch, batch_boxes = letterbox(images, boxes, self.size, self.keep_ratio)
+        tags = [f"{idx}:" for idx in range(len(images))]
+        for transform in self.transforms:
+            batch, batch_boxes, tags = transform(batch, batch_boxes, tags)
+        sources = []
+        for tag in tags:
+            idx, _, suffix = tag.partition(":")
+            sources.append((int(idx), suffix.lstrip("_")))
+        return batch, batch_boxes, sources
+
+
+def augment_dataset(
+    images_folder: str,
+    output: str,
+    pipeline: AugmentationPipeline,
+    labels_folder: str | None = None,
+    batch_size: int = 16,
+    cache: DecodedImageCache | None = None
+) -> int:
+    """
+    Gera um dataset YOLO aumentado, com as imagens em `output/images` e os labels em `output/labels`
+
+    - Args:
+        - images_folder:: str: Pasta com as imagens originais
+        - output:: str: Pasta de saída
+        - pipeline:: AugmentationPipeline: Pipeline aplicado às imagens
+        - labels_folder:: str | None: Pasta com os labels YOLO (mesmo nome da imagem, extensão .txt)
+        - batch_size:: int: Quantidade de imagens originais processadas por lote
+        - cache:: DecodedImageCache | None: Cache das imagens decodificadas, compartilhável entre execuções
+
+    - Returns:
+        - int: Quantidade de imagens geradas
+    """
+    images_output = join(output, "images")
+    labels_output = join(output, "labels")
+    makedirs(images_output, exist_ok=True)
+    makedirs(labels_output, exist_ok=True)
+
+    image_paths = get_image_paths(images_folder)
+    generated = 0
+    for start in range(0, len(image_paths), batch_size):
+        paths = image_paths[start:start + batch_size]
+        names = [splitext(basename(path))[0] for path in paths]
+        images = [cache.get(path) if cache else decode_rgb(path, pipeline.size) for path in paths]
+        boxes = [
+            read_labels(join(labels_folder, f"{name}.txt")) if labels_folder else empty_boxes()
+            for name in names
+        ]
+
+        batch, batch_boxes, sources = pipeline(images, boxes)
+        for image, image_boxes, (idx, tag) in zip(batch, batch_boxes, sources):
+            name = f"{names[idx]}_{tag}" if tag else names[idx]
+            Image.fromarray(image).save(join(images_output, f"{name}.jpg"))
+            write_labels(join(labels_output, f"{name}.txt"), image_boxes)
+        generated += len(batch)
+    return generated
@@ -1,6 +1,9 @@
 # redimensionar_imagem.py
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
 from glob import glob
-from os import mkdir
+from io import BytesIO
+from os import cpu_count, makedirs, mkdir
 from os.path import (
     basename, 
     exists,
@@ -9,10 +12,15 @@ from os.path import (
 
 )
 
+from typing import Callable
+
 from PIL import Image
 
+from .manifest import DatasetManifest, read_source
+
 
 ROTATES = [45,90,135,180,225, 270,315,360]
+MANIFEST_SAVE_EVERY = 50
 
 
 def get_image_paths(folder: str) -> list[str]:
@@ -22,6 +30,27 @@ def get_image_paths(folder: str) -> list[str]:
 def get_image(image_path: str) -> Image.Image:
     return Image.open(image_path)
 
+def load_image(image_path: str | BytesIO, size: tuple[int, int] = (640, 640)) -> Image.Image:
+    """
+    Abre uma imagem já decodificada próxima do tamanho final
+
+    Em JPEGs, o `draft` faz o decoder reduzir a imagem por 1/2, 1/4 ou 1/8 durante a decodificação,
+    sem nunca ficar menor que `size`. Uma foto de 12 megapixels redimensionada para 640x640 é decodificada
+    em ~1/16 dos pixels. Outros formatos são decodificados normalmente.
+
+    - Args:
+        - image_path:: str | BytesIO: Caminho da imagem ou o seu conteúdo já lido
+        - size:: tuple[int, int]: Tamanho mínimo (largura, altura) após a decodificação
+
+    - Returns:
+        - Image.Image: Imagem carregada
+    """
+    image = Image.open(image_path)
+    if image.format == "JPEG":
+        image.draft("RGB", size)
+    image.load()
+    return image
+
 def resize_image_to_yolo(image: Image.Image) -> Image.Image:
     return image.resize((640, 640))
 
@@ -55,15 +84,103 @@ def save_image(image: Image.Image, output_folder: str, filename: str, label: str
         mkdir(output_folder)
     image.save(join(output_folder, basename(filename)))
 
-def generate_image_dataset(folder: str, output: str, rotates: list[int] = ROTATES):
-    
-    image_paths = get_image_paths(folder)
+def output_names(image_path: str, rotates: list[int] = ROTATES) -> list[str]:
+    # Nome dos arquivos gerados para uma imagem, um por rotação
+    name, _ = splitext(basename(image_path))
+    return [f"{name}_{rotate}.jpg" for rotate in rotates]
 
-    for image_path in image_paths:
-        image = get_image(image_path)
-        resized_image = resize_image_to_yolo(image)
-        rotated_images = rotate_image(resized_image)
-        for idx in range(len(rotated_images)):
-            # Salvar a imagem rotacionada
-            save_image(rotated_images[idx], output, image_path, str(rotates[idx]))
+def process_image(image_path: str, output: str, rotates: list[int] = ROTATES) -> dict:
+    """
+    Redimensiona uma imagem e salva cada variante rotacionada direto no disco, sem manter a lista de variantes em memória
+
+    A pasta de saída deve existir. O arquivo é lido uma única vez e o hash é calculado sobre o mesmo conteúdo
+    decodificado, aqui no worker, para o processo principal apenas registrá-lo no manifesto.
 
+    - Args:
+        - image_path:: str: Caminho da imagem original
+        - output:: str: Pasta de saída
+        - rotates:: list[int]: Ângulos de rotação
+
+    - Returns:
+        - dict: Tamanho, data de modificação e hash da imagem original processada
+    """
+    data, info = read_source(image_path)
+    with load_image(BytesIO(data)) as image:
+        resized_image = resize_image_to_yolo(image)
+    # JPEG não suporta transparência nem paleta
+    if resized_image.mode not in ("RGB", "L"):
+        resized_image = resized_image.convert("RGB")
+
+    for rotate, filename in zip(rotates, output_names(image_path, rotates)):
+        resized_image.rotate(rotate).save(join(output, filename))
+    return info
+
+
+def generate_image_dataset(
+    folder: str,
+    output: str,
+    rotates: list[int] = ROTATES,
+    workers: int | None = None,
+    progress: Callable[[int, int], None] | None = None,
+    incremental: bool = True,
+    prune: bool = False
+):
+    """
+    Gera o dataset YOLO: cada imagem da pasta é redimensionada e salva em todas as rotações
+
+    As imagens são distribuídas entre processos, então o tempo escala com a quantidade de núcleos.
+    No modo incremental, um manifesto na pasta de saída registra cada imagem (tamanho, data e hash) e os
+    parâmetros usados: imagens inalteradas são puladas, e uma execução interrompida continua de onde parou.
+
+    - Args:
+        - folder:: str: Pasta com as imagens originais
+        - output:: str: Pasta de saída, criada caso não exista
+        - rotates:: list[int]: Ângulos de rotação
+        - workers:: int | None: Quantidade de processos (padrão: núcleos da máquina), 1 processa no processo atual
+        - progress:: Callable[[int, int], None] | None: Chamada a cada imagem concluída com (concluídas, total)
+        - incremental:: bool: Se True, processa apenas imagens novas, alteradas ou com saídas faltando
+        - prune:: bool: No modo incremental, remove da pasta de saída as imagens geradas a partir de originais que não estão mais na pasta
+    """
+    rotates = rotates or ROTATES
+    image_paths = get_image_paths(folder)
+    makedirs(output, exist_ok=True)
+    outputs_of = partial(output_names, rotates=rotates)
+
+    manifest = None
+    if incremental:
+        manifest = DatasetManifest(output, {"rotates": rotates, "size": [640, 640]})
+        image_paths = manifest.pending(image_paths, outputs_of, prune)
+    total = len(image_paths)
+    process = partial(process_image, output=output, rotates=rotates)
+
+    workers = workers or cpu_count() or 1
+    try:
+        if workers == 1 or total <= 1:
+            _collect(map(process, image_paths), image_paths, manifest, outputs_of, progress)
+            return
+
+        chunksize = max(1, min(64, total // (workers * 4)))
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            results = executor.map(process, image_paths, chunksize=chunksize)
+            _collect(results, image_paths, manifest, outputs_of, progress)
+    finally:
+        if manifest is not None:
+            manifest.save()
+
+
+def _collect(
+    results,
+    image_paths: list[str],
+    manifest: DatasetManifest | None,
+    outputs_of: Callable[[str], list[str]],
+    progress: Callable[[int, int], None] | None
+):
+    # Registra cada imagem concluída no manifesto, salvando periodicamente para permitir retomar a geração
+    total = len(image_paths)
+    for done, (image_path, info) in enumerate(zip(image_paths, results), start=1):
+        if manifest is not None:
+            manifest.record(image_path, outputs_of(image_path), info)
+            if done % MANIFEST_SAVE_EVERY == 0:
+                manifest.save()
+        if progress is not None:
+            progress(done, total)
@@ -0,0 +1,141 @@
+from hashlib import blake2b
+from json import JSONDecodeError, dump, dumps, load
+from os import remove, replace, stat
+from os.path import basename, exists, join
+
+
+MANIFEST_NAME = ".manifest.json"
+MANIFEST_VERSION = 1
+
+
+def read_source(path: str) -> tuple[bytes, dict]:
+    """
+    Lê uma imagem original e descreve exatamente o conteúdo lido, para ser registrado no manifesto
+
+    O `stat` é feito antes da leitura: se o arquivo mudar durante a geração, a data registrada fica mais antiga
+    que a do arquivo e a imagem é processada de novo na próxima execução.
+
+    - Args:
+        - path:: str: Caminho do arquivo
+
+    - Returns:
+        - tuple:
+            - data: bytes: Conteúdo do arquivo
+            - source: dict: Tamanho, data de modificação e hash do conteúdo
+    """
+    info = stat(path)
+    with open(path, "rb") as file:
+        data = file.read()
+    digest = blake2b(data, digest_size=16).hexdigest()
+    return data, {"size": info.st_size, "mtime_ns": info.st_mtime_ns, "hash": digest}
+
+
+def params_hash(params: dict) -> str:
+    # Hash estável dos parâmetros usados para gerar as saídas
+    return blake2b(dumps(params, sort_keys=True).encode(), digest_size=16).hexdigest()
+
+
+class DatasetManifest:
+    """
+    Manifesto de uma geração de dataset, salvo na pasta de saída
+
+    Guarda, para cada imagem original, o tamanho, a data de modificação e o hash do conteúdo lido, o hash dos
+    parâmetros e os arquivos gerados. Uma imagem só é processada de novo se o tamanho, a data ou os parâmetros
+    mudarem ou se alguma saída estiver faltando. Decidir pela data evita ler todas as imagens no processo
+    principal; o hash é calculado pelos workers durante o processamento (ver `read_source`).
+
+    - Args:
+        - output:: str: Pasta de saída do dataset
+        - params:: dict: Parâmetros da geração (ex: ângulos de rotação), serializáveis em JSON
+    """
+    def __init__(self, output: str, params: dict):
+        self.output = output
+        self.path = join(output, MANIFEST_NAME)
+        self.params = params_hash(params)
+        self.entries: dict[str, dict] = {}
+        self.load()
+
+    def load(self):
+        if not exists(self.path):
+            return
+        try:
+            with open(self.path) as file:
+                data = load(file)
+        except (OSError, JSONDecodeError):
+            # Manifesto corrompido (ex: execução interrompida durante a escrita), tudo será regerado
+            return
+        if data.get("version") == MANIFEST_VERSION:
+            self.entries = data.get("entries", {})
+
+    def save(self):
+        # Escreve em um arquivo temporário e troca, para nunca deixar um manifesto pela metade
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, "w") as file:
+            dump({"version": MANIFEST_VERSION, "entries": self.entries}, file)
+        replace(tmp_path, self.path)
+
+    def is_fresh(self, source: str, outputs: list[str]) -> bool:
+        """
+        Indica se as saídas de uma imagem estão atualizadas
+
+        - Args:
+            - source:: str: Caminho da imagem original
+            - outputs:: list[str]: Nome dos arquivos gerados a partir dela
+
+        - Returns:
+            - bool: True se a imagem pode ser pulada
+        """
+        entry = self.entries.get(basename(source))
+        if entry is None:
+            return False
+        info = stat(source)
+        return (
+            entry["size"] == info.st_size
+            and entry["mtime_ns"] == info.st_mtime_ns
+            and entry["params"] == self.params
+            and sorted(entry["outputs"]) == sorted(outputs)
+            and all(exists(join(self.output, name)) for name in outputs)
+        )
+
+    def pending(self, sources: list[str], outputs_of, prune: bool = False) -> list[str]:
+        """
+        Filtra as imagens que precisam ser processadas
+
+        Imagens do manifesto que não estão em `sources` são mantidas, pois a pasta de saída pode ser
+        compartilhada por datasets de outras pastas. Com `prune`, elas saem do manifesto e suas saídas são removidas.
+
+        - Args:
+            - sources:: list[str]: Caminhos das imagens originais
+            - outputs_of:: Callable[[str], list[str]]: Nome dos arquivos gerados para cada imagem
+            - prune:: bool: Se True, remove as saídas de imagens que não estão em `sources`
+
+        - Returns:
+            - list[str]: Imagens novas, alteradas ou com saídas faltando
+        """
+        if prune:
+            names = {basename(source) for source in sources}
+            for name in [name for name in self.entries if name not in names]:
+                self._remove_outputs(self.entries.pop(name)["outputs"])
+        return [source for source in sources if not self.is_fresh(source, outputs_of(source))]
+
+    def record(self, source: str, outputs: list[str], info: dict):
+        """
+        Registra uma imagem processada
+
+        - Args:
+            - source:: str: Caminho da imagem original
+            - outputs:: list[str]: Nome dos arquivos gerados a partir dela
+            - info:: dict: Descrição do conteúdo processado, retornada por `read_source`
+        """
+        name = basename(source)
+        previous = self.entries.get(name)
+        if previous:
+            # Saídas de parâmetros antigos (ex: um ângulo removido) deixam de fazer parte do dataset
+            self._remove_outputs(set(previous["outputs"]) - set(outputs))
+        self.entries[name] = {**info, "params": self.params, "outputs": outputs}
+
+    def _remove_outputs(self, outputs):
+        for output_name in outputs:
+            path = join(self.output, output_name)
+            if exists(path):
+                remove(path)
@@ -0,0 +1,68 @@
+from email.message import EmailMessage
+from socket import socket
+
+import pytest
+from aiosmtpd.controller import Controller
+
+from src.email_helper.pool import SMTPConnectionPool
+
+
+class RecordingHandler:
+    """
+    Handler do aiosmtpd que registra os emails aceitos e permite simular respostas de erro
+    """
+    def __init__(self):
+        # Endereço do cliente de cada email aceito, um por conexão
+        self.peers: list[tuple[str, int]] = []
+        self.sessions = []
+        # Respostas ao DATA usadas uma a uma antes de aceitar (ex: "451 ..." para uma falha temporária)
+        self.data_responses: list[str] = []
+        self.refused: set[str] = set()
+        self.data_attempts = 0
+
+    async def handle_RCPT(self, server, session, envelope, address, rcpt_options):
+        if address in self.refused:
+            return "550 5.1.1 Mailbox unavailable"
+        envelope.rcpt_tos.append(address)
+        return "250 OK"
+
+    async def handle_DATA(self, server, session, envelope):
+        self.data_attempts += 1
+        if self.data_responses:
+            return self.data_responses.pop(0)
+        self.peers.append(session.peer)
+        self.sessions.append(server)
+        return "250 OK"
+
+
+def free_port() -> int:
+    with socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def make_pool(controller: Controller) -> SMTPConnectionPool:
+    return SMTPConnectionPool(
+        host=controller.hostname,
+        port=controller.port,
+        username=None,
+        use_tls=False,
+        max_connections=2,
+        timeout=5,
+    )
+
+
+def make_message(subject: str) -> EmailMessage:
+    msg = EmailMessage()
+    msg["Subject"] = subject
+    msg.set_content("corpo")
+    return msg
+
+
+@pytest.fixture
+def smtp_server():
+    handler = RecordingHandler()
+    controller = Controller(handler, hostname="127.0.0.1", port=free_port())
+    controller.start()
+    yield controller, handler
+    controller.stop()
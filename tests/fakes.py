@@ -0,0 +1,81 @@
+from asyncio import Queue
+
+
+class FakePubSub:
+    """
+    Substituto local do `PubSub` assíncrono do redis-py, com apenas o que o RedisBroker usa
+    """
+    def __init__(self, server: "FakeRedis"):
+        self.server = server
+        self.channels: set[str] = set()
+        self._queue: Queue[dict | Exception | None] = Queue()
+
+    async def subscribe(self, channel: str):
+        self.channels.add(channel)
+        self.server.subscribers.setdefault(channel, set()).add(self)
+        self._queue.put_nowait({"type": "subscribe", "channel": channel, "data": 1})
+
+    async def unsubscribe(self, channel: str):
+        self.channels.discard(channel)
+        self.server.subscribers.get(channel, set()).discard(self)
+
+    async def listen(self):
+        while (item := await self._queue.get()) is not None:
+            if isinstance(item, Exception):
+                raise item
+            yield item
+
+    async def aclose(self):
+        for channel in list(self.channels):
+            await self.unsubscribe(channel)
+        self._queue.put_nowait(None)
+
+
+class FakeRedis:
+    """
+    Substituto local de um cliente `redis.asyncio`. Os brokers que compartilham a instância
+    se comportam como processos conectados ao mesmo servidor Redis.
+    """
+    def __init__(self):
+        self.subscribers: dict[str, set[FakePubSub]] = {}
+        self.closed = False
+
+    def pubsub(self) -> FakePubSub:
+        return FakePubSub(self)
+
+    def disconnect(self):
+        # Simula a queda da conexão: os `listen` em andamento levantam ConnectionError
+        for subscribers in self.subscribers.values():
+            for pubsub in list(subscribers):
+                subscribers.discard(pubsub)
+                pubsub._queue.put_nowait(ConnectionError("Connection closed by server."))
+
+    async def aclose(self):
+        self.closed = True
+
+    async def publish(self, channel: str, message: str) -> int:
+        subscribers = self.subscribers.get(channel, set())
+        for pubsub in subscribers:
+            # O Redis com `decode_responses=False` entrega bytes
+            pubsub._queue.put_nowait({"type": "message", "channel": channel, "data": message.encode()})
+        return len(subscribers)
+
+
+class FakeWebSocket:
+    """
+    Substituto do `WebSocket` do FastAPI que guarda os frames enviados
+    """
+    def __init__(self):
+        self.received: list[str | bytes] = []
+
+    async def accept(self):
+        pass
+
+    async def close(self, code: int | None = None):
+        pass
+
+    async def send_text(self, data: str):
+        self.received.append(data)
+
+    async def send_bytes(self, data: bytes):
+        self.received.append(data)
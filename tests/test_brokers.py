@@ -0,0 +1,148 @@
+from asyncio import run, sleep
+from os.path import join
+
+import pytest
+
+from src.fastapi_helper.brokers import RedisBroker, UnixSocketBroker
+from src.fastapi_helper.web_sockets import ConnectionManager
+from tests.fakes import FakeRedis, FakeWebSocket
+
+
+def redis_brokers(tmp_path) -> tuple[RedisBroker, RedisBroker]:
+    client = FakeRedis()
+    return RedisBroker(client=client), RedisBroker(client=client)
+
+
+def unix_socket_brokers(tmp_path) -> tuple[UnixSocketBroker, UnixSocketBroker]:
+    path = join(tmp_path, "broker.sock")
+    return UnixSocketBroker(path), UnixSocketBroker(path)
+
+
+async def wait_for(condition, timeout: float = 2.0):
+    # As mensagens passam pelo broker e pela task de envio de cada conexão
+    for _ in range(int(timeout / 0.01)):
+        if condition():
+            return
+        await sleep(0.01)
+    raise AssertionError("Mensagem não entregue pelo broker")
+
+
+@pytest.mark.parametrize("make_brokers", [redis_brokers, unix_socket_brokers])
+def test_fan_out_across_managers(make_brokers, tmp_path):
+    async def scenario():
+        broker_a, broker_b = make_brokers(str(tmp_path))
+        manager_a = ConnectionManager(broker=broker_a, frame_format="json")
+        manager_b = ConnectionManager(broker=broker_b, frame_format="json")
+        await manager_a.start()
+        await manager_b.start()
+        ws_a, ws_b = FakeWebSocket(), FakeWebSocket()
+        try:
+            await manager_a.connect(ws_a, client_id=1)
+            await manager_b.connect(ws_b, client_id=2)
+            manager_a.subscribe(ws_a, "room")
+
+            await manager_a.broadcast({"text": "hello"})
+            await wait_for(lambda: ws_a.received and ws_b.received)
+            assert ws_a.received == ws_b.received == ['[{"text":"hello"}]']
+
+            # Cliente conectado apenas no outro gerenciador
+            await manager_a.send_personal_message("direct", 2)
+            await wait_for(lambda: len(ws_b.received) == 2)
+            assert ws_b.received[-1] == '["direct"]'
+
+            await manager_b.publish("room", "news")
+            await wait_for(lambda: len(ws_a.received) == 2)
+            assert ws_a.received[-1] == '["news"]'
+            assert len(ws_b.received) == 2
+        finally:
+            manager_a.disconnect(ws_a)
+            manager_b.disconnect(ws_b)
+            await manager_a.stop()
+            await manager_b.stop()
+
+    run(scenario())
+
+
+def test_unix_socket_broker_large_message(tmp_path):
+    async def scenario():
+        broker_a, broker_b = unix_socket_brokers(str(tmp_path))
+        received: list[str] = []
+
+        async def handler(message: str):
+            received.append(message)
+
+        broker_b.add_handler(handler)
+        await broker_a.start()
+        await broker_b.start()
+        try:
+            # Maior que o limite padrão de 64 KiB do StreamReader e com quebras de linha
+            message = "x" * 100_000 + "\nfim"
+            await broker_a.publish(message)
+            await broker_a.publish("depois")
+            await wait_for(lambda: len(received) == 2)
+            assert received == [message, "depois"]
+        finally:
+            await broker_a.close()
+            await broker_b.close()
+
+    run(scenario())
+
+
+def test_unix_socket_broker_survives_hub_loss(tmp_path):
+    async def scenario():
+        hub, broker_b, broker_c = (UnixSocketBroker(join(str(tmp_path), "broker.sock")) for _ in range(3))
+        received_b: list[str] = []
+        received_c: list[str] = []
+
+        async def handler_b(message: str):
+            received_b.append(message)
+
+        async def handler_c(message: str):
+            received_c.append(message)
+
+        broker_b.add_handler(handler_b)
+        broker_c.add_handler(handler_c)
+        await hub.start()
+        await broker_b.start()
+        await broker_c.start()
+        try:
+            assert hub._server is not None
+            await hub.close()
+
+            # Um dos processos restantes assume o hub e o outro reconecta a ele
+            await wait_for(lambda: broker_b._server is not None or broker_c._server is not None)
+            new_hub = broker_b if broker_b._server is not None else broker_c
+            await wait_for(lambda: len(new_hub._peers) == 2)
+            await broker_b.publish("após a queda")
+            await wait_for(lambda: received_b and received_c)
+            assert received_b == received_c == ["após a queda"]
+        finally:
+            await broker_b.close()
+            await broker_c.close()
+
+    run(scenario())
+
+
+def test_redis_broker_resubscribes_after_connection_loss():
+    async def scenario():
+        client = FakeRedis()
+        broker = RedisBroker(client=client)
+        received: list[str] = []
+
+        async def handler(message: str):
+            received.append(message)
+
+        broker.add_handler(handler)
+        await broker.start()
+        try:
+            client.disconnect()
+            await wait_for(lambda: client.subscribers.get(broker.channel))
+            await client.publish(broker.channel, "após a queda")
+            await wait_for(lambda: received)
+            assert received == ["após a queda"]
+        finally:
+            await broker.close()
+        # O cliente foi passado pelo chamador, então continua aberto
+        assert not client.closed
+
+    run(scenario())
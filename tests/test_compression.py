@@ -0,0 +1,85 @@
+from asyncio import run
+from gzip import decompress
+
+from src.fastapi_helper.middleware.compression import CompressionMiddleware
+
+
+def body_app(*chunks: bytes):
+    async def app(scope, receive, send):
+        await send({"type": "http.response.start", "status": 200, "headers": [(b"content-type", b"application/json")]})
+        for idx, chunk in enumerate(chunks):
+            await send({"type": "http.response.body", "body": chunk, "more_body": idx < len(chunks) - 1})
+    return app
+
+
+def call(app, accept_encoding: str = "gzip") -> list[dict]:
+    middleware = CompressionMiddleware(app, minimum_size=100)
+    # Apenas o gzip, para o resultado não depender do brotli/zstandard instalados
+    middleware.encoders = {"gzip": middleware.encoders["gzip"]}
+    messages = []
+
+    async def receive():
+        return {"type": "http.request"}
+
+    async def send(message):
+        messages.append(message)
+
+    scope = {"type": "http", "headers": [(b"accept-encoding", accept_encoding.encode())]}
+    run(middleware(scope, receive, send))
+    return messages
+
+
+def headers_of(messages: list[dict]) -> dict[bytes, bytes]:
+    return dict(messages[0]["headers"])
+
+
+def test_accept_encoding_negotiation():
+    payload = b"x" * 1000
+
+    assert b"content-encoding" not in headers_of(call(body_app(payload), "gzip;q=0"))
+    assert b"content-encoding" not in headers_of(call(body_app(payload), "*, gzip;q=0"))
+    assert headers_of(call(body_app(payload), "*"))[b"content-encoding"] == b"gzip"
+    assert headers_of(call(body_app(payload), "br;q=0, gzip;q=0.5"))[b"content-encoding"] == b"gzip"
+
+
+def test_minimum_size():
+    small = call(body_app(b"x" * 99))
+    assert b"content-encoding" not in headers_of(small)
+    assert small[1]["body"] == b"x" * 99
+
+    large = call(body_app(b"x" * 1000))
+    headers = headers_of(large)
+    assert headers[b"content-encoding"] == b"gzip"
+    assert int(headers[b"content-length"]) == len(large[1]["body"])
+    assert decompress(large[1]["body"]) == b"x" * 1000
+
+
+def test_streamed_body():
+    chunks = [b"a" * 10, b"b" * 500, b"c" * 10]
+    messages = call(body_app(*chunks))
+
+    headers = headers_of(messages)
+    assert headers[b"content-encoding"] == b"gzip"
+    assert b"content-length" not in headers
+    assert [message["more_body"] for message in messages[1:]] == [True, True, False]
+    assert decompress(b"".join(message["body"] for message in messages[1:])) == b"".join(chunks)
+
+
+def test_empty_body():
+    messages = call(body_app(b""))
+    assert b"content-encoding" not in headers_of(messages)
+    assert messages[1]["body"] == b""
+
+    # Sem nenhuma mensagem de corpo, o início da resposta retido ainda é enviado
+    messages = call(body_app())
+    assert [message["type"] for message in messages] == ["http.response.start"]
+
+
+def test_non_body_message_is_sent_after_start():
+    async def app(scope, receive, send):
+        await send({"type": "http.response.start", "status": 200, "headers": []})
+        await send({"type": "http.response.pathsend", "path": "/tmp/file"})
+
+    messages = call(app)
+    assert [message["type"] for message in messages] == ["http.response.start", "http.response.pathsend"]
+    assert b"content-encoding" not in headers_of(messages)
@@ -0,0 +1,75 @@
+from asyncio import run
+
+from src.email_helper.dispatcher import DeliveryStatus, EmailDispatcher
+from tests.conftest import make_message, make_pool
+
+
+def make_dispatcher(controller, **kwargs) -> EmailDispatcher:
+    return EmailDispatcher(pool=make_pool(controller), workers=1, from_email="from@example.com", **kwargs)
+
+
+def test_temporary_error_is_retried_until_sent(smtp_server):
+    controller, handler = smtp_server
+    handler.data_responses = ["451 4.3.0 Try again later", "451 4.3.0 Try again later"]
+
+    async def scenario():
+        dispatcher = make_dispatcher(controller, backoff_base=0.01)
+        await dispatcher.start()
+        delivery_id = await dispatcher.submit("to@example.com", make_message("1"))
+        await dispatcher.stop()
+
+        delivery = dispatcher.status(delivery_id)
+        assert delivery.status == DeliveryStatus.SENT
+        assert delivery.attempts == 3
+        assert delivery.msg is None
+
+    run(scenario())
+    assert handler.data_attempts == 3
+    assert len(handler.peers) == 1
+
+
+def test_permanent_errors_fail_without_retry(smtp_server):
+    controller, handler = smtp_server
+    handler.data_responses = ["554 5.7.1 Message rejected"]
+    handler.refused = {"refused@example.com"}
+
+    async def scenario():
+        dispatcher = make_dispatcher(controller, backoff_base=0.01)
+        await dispatcher.start()
+        rejected_id = await dispatcher.submit("to@example.com", make_message("1"))
+        refused_id = await dispatcher.submit("refused@example.com", make_message("2"))
+        await dispatcher.stop()
+
+        for delivery_id in (rejected_id, refused_id):
+            delivery = dispatcher.status(delivery_id)
+            assert delivery.status == DeliveryStatus.FAILED
+            assert delivery.attempts == 1
+            assert delivery.error
+
+    run(scenario())
+    # Apenas o primeiro email chegou ao DATA, e só uma vez
+    assert handler.data_attempts == 1
+    assert handler.peers == []
+
+
+def test_finished_deliveries_are_evicted(smtp_server):
+    controller, handler = smtp_server
+
+    async def scenario():
+        dispatcher = make_dispatcher(controller, max_finished=2)
+        await dispatcher.start()
+        ids = [await dispatcher.submit("to@example.com", make_message(str(idx))) for idx in range(5)]
+        await dispatcher.stop()
+
+        assert len(handler.peers) == 5
+        # Apenas os dois envios finalizados mais recentes continuam disponíveis
+        assert [dispatcher.status(delivery_id) for delivery_id in ids[:3]] == [None, None, None]
+        assert all(dispatcher.status(delivery_id).status == DeliveryStatus.SENT for delivery_id in ids[3:])
+
+        dispatcher.retention = 0
+        await dispatcher.start()
+        await dispatcher.submit("to@example.com", make_message("6"))
+        await dispatcher.stop()
+        assert dispatcher.deliveries == {}
+
+    run(scenario())
@@ -0,0 +1,47 @@
+from time import sleep
+
+from tests.conftest import make_message, make_pool
+
+
+def test_pool_reuses_connection(smtp_server):
+    controller, handler = smtp_server
+    pool = make_pool(controller)
+    try:
+        pool.send("from@example.com", "to@example.com", make_message("1"))
+        pool.send("from@example.com", ["to@example.com"], make_message("2"))
+    finally:
+        pool.close()
+
+    assert len(handler.peers) == 2
+    assert handler.peers[0] == handler.peers[1]
+
+
+def test_pool_fresh_connection(smtp_server):
+    controller, handler = smtp_server
+    pool = make_pool(controller)
+    try:
+        pool.send("from@example.com", "to@example.com", make_message("1"))
+        with pool.connection(fresh=True) as server:
+            server.sendmail("from@example.com", "to@example.com", b"Subject: 2\r\n\r\ncorpo")
+        # As duas conexões voltam para o pool
+        assert len(pool._idle) == 2
+    finally:
+        pool.close()
+
+    assert handler.peers[0] != handler.peers[1]
+
+
+def test_pool_retries_after_server_disconnect(smtp_server):
+    controller, handler = smtp_server
+    pool = make_pool(controller)
+    try:
+        pool.send("from@example.com", "to@example.com", make_message("1"))
+        # O servidor encerra a sessão que está ociosa no pool
+        controller.loop.call_soon_threadsafe(handler.sessions[0].transport.close)
+        sleep(0.1)
+        pool.send("from@example.com", "to@example.com", make_message("2"))
+    finally:
+        pool.close()
+
+    assert len(handler.peers) == 2
+    assert handler.peers[0] != handler.peers[1]
@@ -0,0 +1,53 @@
+import pytest
+from pydantic import ValidationError
+
+from src.pydantic_helper.schemas.user import User, validate_users, validate_users_partial
+from src.pydantic_helper.validators.user import (
+    ERROR_EMAIL_INVALID_FORMAT_MASK,
+    ERROR_NAME_INVALID_FORMAT_MIN_LENGTH,
+    ERROR_USERNAME_INVALID_FORMAT_MIN_LENGTH,
+)
+
+
+def make_payload(**overrides) -> dict:
+    payload = {
+        "email": " user@example.com ",
+        "password": "Secret123!",
+        "name": " joão ",
+        "phone": "(11) 99999-9999",
+        "username": "joao",
+    }
+    return {**payload, **overrides}
+
+
+def test_validate_users():
+    users = validate_users([make_payload(), make_payload(is_admin=True)])
+
+    assert [user.email for user in users] == ["user@example.com", "user@example.com"]
+    assert users[0].name == "JOÃO"
+    assert users[0].phone == "11999999999"
+    assert users[1].is_admin is True
+
+    with pytest.raises(ValidationError) as info:
+        validate_users([make_payload(email=b"user@example.com"), make_payload(name=b"jo")])
+    assert {error["loc"] for error in info.value.errors()} == {(0, "email"), (1, "name")}
+
+
+def test_validate_users_partial():
+    payloads = [
+        make_payload(),
+        make_payload(email="invalid", name="j", username="j"),
+        "not a user",
+        make_payload(username="maria"),
+    ]
+
+    users, errors = validate_users_partial(payloads)
+
+    assert [user.username for user in users] == ["joao", "maria"]
+    assert set(errors) == {1, 2}
+    assert {error["loc"]: error["msg"] for error in errors[1]} == {
+        ("email",): ERROR_EMAIL_INVALID_FORMAT_MASK,
+        ("name",): ERROR_NAME_INVALID_FORMAT_MIN_LENGTH,
+        ("username",): ERROR_USERNAME_INVALID_FORMAT_MIN_LENGTH,
+    }
+    assert errors[2][0]["type"] == "model_type"
@@ -0,0 +1,35 @@
+from asyncio import run
+
+from src.fastapi_helper.middleware.rate_limit import RateLimitMiddleware
+
+
+async def ok_app(scope, receive, send):
+    await send({"type": "http.response.start", "status": 200, "headers": []})
+    await send({"type": "http.response.body", "body": b"ok"})
+
+
+async def request(middleware: RateLimitMiddleware, path: str) -> int:
+    messages = []
+
+    async def receive():
+        return {"type": "http.request"}
+
+    async def send(message):
+        messages.append(message)
+
+    await middleware({"type": "http", "path": path, "client": ("10.0.0.1", 1234)}, receive, send)
+    return messages[0]["status"]
+
+
+def test_route_rejection_refunds_client_token():
+    middleware = RateLimitMiddleware(ok_app, rate=0.001, capacity=2, route_limits={"/reports": (0.001, 1)})
+
+    async def scenario():
+        assert await request(middleware, "/reports") == 200
+        # Rejeitadas pelo limite da rota, sem gastar a cota do cliente
+        assert await request(middleware, "/reports") == 429
+        assert await request(middleware, "/reports") == 429
+        assert await request(middleware, "/items") == 200
+        assert await request(middleware, "/items") == 429
+
+    run(scenario())
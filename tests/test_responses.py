@@ -0,0 +1,64 @@
+import numpy as np
+from fastapi import APIRouter, Response
+from fastapi.testclient import TestClient
+from pydantic import BaseModel
+
+from src.fastapi_helper.responses import FastJSONResponse, FastJSONRoute, fast_json_app
+
+
+class Item(BaseModel):
+    value: int
+
+
+def make_client() -> TestClient:
+    app = fast_json_app()
+
+    @app.get("/numpy")
+    async def numpy_values():
+        return {"a": np.int64(3), "b": np.arange(3), "c": np.float32(0.5)}
+
+    @app.post("/created", status_code=201)
+    def created():
+        return [np.int64(1)]
+
+    @app.get("/model", response_model=Item)
+    async def model():
+        return {"value": 1, "extra": "filtrado pelo response_model"}
+
+    @app.get("/headers")
+    async def headers(response: Response):
+        response.headers["x-custom"] = "1"
+        return {"ok": True}
+
+    router = APIRouter(route_class=FastJSONRoute, default_response_class=FastJSONResponse)
+
+    @router.get("/router")
+    def from_router():
+        return {"a": np.int64(4)}
+
+    app.include_router(router)
+    return TestClient(app)
+
+
+def test_plain_values_skip_jsonable_encoder():
+    client = make_client()
+
+    response = client.get("/numpy")
+    assert response.status_code == 200
+    assert response.json() == {"a": 3, "b": [0, 1, 2], "c": 0.5}
+
+    response = client.post("/created")
+    assert response.status_code == 201
+    assert response.json() == [1]
+
+    assert client.get("/router").json() == {"a": 4}
+
+
+def test_fastapi_features_are_kept():
+    client = make_client()
+
+    assert client.get("/model").json() == {"value": 1}
+
+    response = client.get("/headers")
+    assert response.headers["x-custom"] == "1"
+    assert response.json() == {"ok": True}
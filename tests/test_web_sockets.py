@@ -0,0 +1,38 @@
+from asyncio import run, sleep
+
+import pytest
+
+from src.fastapi_helper.web_sockets import HEARTBEAT_PING, ConnectionManager
+from tests.fakes import FakeWebSocket
+
+
+def test_text_frames_are_never_batched():
+    with pytest.raises(ValueError):
+        ConnectionManager(batch_window=0.01)
+
+    async def scenario():
+        manager = ConnectionManager()
+        websocket = FakeWebSocket()
+        await manager.connect(websocket)
+        await manager.broadcast("linha 1\nlinha 2")
+        manager._send_local(websocket, HEARTBEAT_PING)
+        await sleep(0.01)
+        assert websocket.received == ["linha 1\nlinha 2", HEARTBEAT_PING]
+        manager.disconnect(websocket)
+
+    run(scenario())
+
+
+def test_json_batches_keep_message_boundaries():
+    async def scenario():
+        manager = ConnectionManager(batch_window=0.01, frame_format="json")
+        websocket = FakeWebSocket()
+        await manager.connect(websocket)
+        await manager.broadcast("linha 1\nlinha 2")
+        manager._send_local(websocket, HEARTBEAT_PING)
+        await manager.broadcast({"a": 1})
+        await sleep(0.05)
+        assert websocket.received == ['["linha 1\\nlinha 2","__ping__",{"a":1}]']
+        manager.disconnect(websocket)
+
+    run(scenario())
@@ -0,0 +1,68 @@
+from os import listdir, makedirs, remove
+from os.path import exists, join
+
+from PIL import Image
+
+from src.yolo_helper.config_images import generate_image_dataset
+from src.yolo_helper.manifest import DatasetManifest
+
+
+def make_images(folder: str, names: list[str]):
+    makedirs(folder, exist_ok=True)
+    for idx, name in enumerate(names):
+        Image.new("RGB", (32, 24), (idx * 40, 0, 0)).save(join(folder, name))
+
+
+def generate(folder: str, output: str, rotates: list[int], prune: bool = False) -> int:
+    # Retorna quantas imagens foram processadas nesta execução
+    calls = []
+    generate_image_dataset(folder, output, rotates, workers=1, progress=lambda done, total: calls.append(total), prune=prune)
+    return calls[0] if calls else 0
+
+
+def test_unchanged_sources_are_skipped(tmp_path):
+    folder, output = join(tmp_path, "images"), join(tmp_path, "dataset")
+    make_images(folder, ["a.jpg", "b.png"])
+
+    assert generate(folder, output, [90, 180]) == 2
+    assert sorted(listdir(output)) == [".manifest.json", "a_180.jpg", "a_90.jpg", "b_180.jpg", "b_90.jpg"]
+    entry = DatasetManifest(output, {"rotates": [90, 180], "size": [640, 640]}).entries["a.jpg"]
+    assert len(entry["hash"]) == 32
+
+    assert generate(folder, output, [90, 180]) == 0
+
+
+def test_missing_output_is_regenerated(tmp_path):
+    folder, output = join(tmp_path, "images"), join(tmp_path, "dataset")
+    make_images(folder, ["a.jpg", "b.jpg"])
+    generate(folder, output, [90, 180])
+
+    remove(join(output, "b_90.jpg"))
+
+    assert generate(folder, output, [90, 180]) == 1
+    assert exists(join(output, "b_90.jpg"))
+
+
+def test_dropped_rotation_outputs_are_removed(tmp_path):
+    folder, output = join(tmp_path, "images"), join(tmp_path, "dataset")
+    make_images(folder, ["a.jpg"])
+    generate(folder, output, [90, 180])
+
+    assert generate(folder, output, [90]) == 1
+    assert sorted(listdir(output)) == [".manifest.json", "a_90.jpg"]
+
+
+def test_foreign_entries_are_kept_without_prune(tmp_path):
+    output = join(tmp_path, "dataset")
+    folder_a, folder_b = join(tmp_path, "a"), join(tmp_path, "b")
+    make_images(folder_a, ["a.jpg"])
+    make_images(folder_b, ["b.jpg"])
+    generate(folder_a, output, [90])
+
+    generate(folder_b, output, [90], prune=False)
+    assert exists(join(output, "a_90.jpg"))
+    assert set(DatasetManifest(output, {"rotates": [90], "size": [640, 640]}).entries) == {"a.jpg", "b.jpg"}
+
+    generate(folder_b, output, [90], prune=True)
+    assert not exists(join(output, "a_90.jpg"))
+    assert exists(join(output, "b_90.jpg"))